@@ -0,0 +1,269 @@
+"""asyncio versions of the multicast server and client.
+
+One event loop can host hundreds of simulated DroneEndpoints, each with its
+own socket and send rate, next to a ControllerProtocol that keeps the latest
+position reported by every drone.
+
+Run each side on its own:
+    python multicast_async.py controller
+    python multicast_async.py swarm --drones 200 --rate 10
+"""
+
+import argparse
+import asyncio
+import random
+import socket
+import time
+from collections import deque
+from collections.abc import Callable
+
+from multicast_protocol import (
+    MCAST_GRP,
+    MCAST_PORT,
+    PositionEncoder,
+    ProtocolError,
+    decode,
+    open_receiver_socket,
+    open_sender_socket,
+)
+
+Position = tuple[float, float, float]
+
+
+class SenderProtocol(asyncio.DatagramProtocol):
+    """Sending side of a datagram endpoint with backpressure.
+
+    The transport calls pause_writing once its send buffer passes the high
+    water mark and resume_writing once it drains. Senders await drain()
+    before every datagram so they stop queueing while the buffer is full.
+    """
+
+    def __init__(self) -> None:
+        self.transport: asyncio.DatagramTransport | None = None
+        self.pauses = 0
+        self.errors = 0
+        self._writable = asyncio.Event()
+        self._writable.set()
+
+    def connection_made(self, transport: asyncio.DatagramTransport) -> None:
+        self.transport = transport
+
+    def pause_writing(self) -> None:
+        self.pauses += 1
+        self._writable.clear()
+
+    def resume_writing(self) -> None:
+        self._writable.set()
+
+    def error_received(self, exc: Exception) -> None:
+        self.errors += 1
+
+    async def drain(self) -> None:
+        await self._writable.wait()
+
+
+class DroneEndpoint:
+    """Simulated drone broadcasting its own position at a fixed rate.
+
+    Every datagram is timestamped so the controller can measure latency.
+    """
+
+    def __init__(
+        self,
+        drone_id: int,
+        address: tuple[str, int],
+        rate: float,
+        position: Position = (0.0, 0.0, 0.0),
+    ) -> None:
+        self.drone_id = drone_id
+        self.address = address
+        self.rate = rate
+        self.position = list(position)
+        self.tick = 0
+        self.sent = 0
+        self.encoder = PositionEncoder()
+        self.protocol: SenderProtocol | None = None
+
+    async def open(self, sock: socket.socket | None = None) -> None:
+        """Creates the endpoint's transport, on a multicast socket by default."""
+        sock = sock or open_sender_socket()
+        sock.setblocking(False)
+        _, self.protocol = await asyncio.get_running_loop().create_datagram_endpoint(
+            SenderProtocol, sock=sock
+        )
+
+    def close(self) -> None:
+        if self.protocol is not None and self.protocol.transport is not None:
+            self.protocol.transport.close()
+
+    async def send_position(self) -> None:
+        """Moves the drone a little and sends its new position."""
+        for axis in range(3):
+            self.position[axis] += random.uniform(-0.5, 0.5)
+        datagrams = self.encoder.encode_tick(
+            self.tick, [(self.drone_id, *self.position)], sent_at=time.time()
+        )
+        for datagram in datagrams:
+            await self.protocol.drain()
+            self.protocol.transport.sendto(datagram, self.address)
+            self.sent += 1
+        self.tick += 1
+
+    async def run(self, stop: asyncio.Event) -> None:
+        """Sends at self.rate per second until stop is set.
+
+        Sends are scheduled against the loop clock, so a slow send does not
+        push every later send back.
+        """
+        loop = asyncio.get_running_loop()
+        interval = 1 / self.rate
+        # Spread the first sends so the swarm does not fire in lockstep
+        next_send = loop.time() + random.uniform(0, interval)
+        while not stop.is_set():
+            delay = next_send - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            await self.send_position()
+            next_send += interval
+
+
+class ControllerProtocol(asyncio.DatagramProtocol):
+    """Receiving side that aggregates the latest position of every drone.
+
+    A record only replaces the stored one if its tick is not older, so
+    reordered datagrams never move a drone backwards in time.
+
+    Args:
+        latency_samples (int, optional): Keep the latency of the last this many
+            timed datagrams in latencies, such as for a load test. Defaults to
+            0, which keeps none so a long-running controller stays bounded.
+    """
+
+    def __init__(self, latency_samples: int = 0) -> None:
+        self.transport: asyncio.DatagramTransport | None = None
+        # Drone id -> (tick, position)
+        self.latest: dict[int, tuple[int, Position]] = {}
+        self.received = 0
+        self.malformed = 0
+        self.latencies: deque[float] | None = (
+            deque(maxlen=latency_samples) if latency_samples else None
+        )
+
+    def connection_made(self, transport: asyncio.DatagramTransport) -> None:
+        self.transport = transport
+
+    def datagram_received(self, data: bytes, addr: tuple[str, int]) -> None:
+        received_at = time.time()
+        try:
+            frame = decode(memoryview(data))
+        except ProtocolError:
+            self.malformed += 1
+            return
+        self.received += 1
+        if frame.sent_at is not None and self.latencies is not None:
+            self.latencies.append(received_at - frame.sent_at)
+        for drone_id, x, y, z in frame.iter_records():
+            current = self.latest.get(drone_id)
+            if current is None or current[0] <= frame.tick:
+                self.latest[drone_id] = (frame.tick, (x, y, z))
+
+    def get_position(self, drone_id: int) -> Position | None:
+        entry = self.latest.get(drone_id)
+        return entry[1] if entry else None
+
+
+async def open_controller(
+    group: str | None = MCAST_GRP,
+    port: int = MCAST_PORT,
+    host: str = "127.0.0.1",
+    latency_samples: int = 0,
+) -> ControllerProtocol:
+    """Starts a controller on the multicast group, or on a unicast host when
+    group is None. Port 0 picks a free port, read it from the transport.
+    latency_samples is passed to ControllerProtocol.
+    """
+    loop = asyncio.get_running_loop()
+
+    def factory() -> ControllerProtocol:
+        return ControllerProtocol(latency_samples)
+
+    if group is None:
+        _, protocol = await loop.create_datagram_endpoint(
+            factory, local_addr=(host, port)
+        )
+        return protocol
+    sock = open_receiver_socket(group, port)
+    sock.setblocking(False)
+    _, protocol = await loop.create_datagram_endpoint(factory, sock=sock)
+    return protocol
+
+
+async def run_swarm(
+    drone_count: int,
+    address: tuple[str, int],
+    rate: float,
+    duration: float | None,
+    sock_factory: Callable[[], socket.socket] | None = None,
+) -> list[DroneEndpoint]:
+    """Runs drone_count DroneEndpoints in this loop for duration seconds, or
+    forever when duration is None.
+
+    Args:
+        drone_count (int): Endpoints to host.
+        address (tuple[str, int]): Where every endpoint sends.
+        rate (float): Datagrams per second per endpoint.
+        duration (float | None): How long to run.
+        sock_factory (Callable[[], socket.socket] | None, optional): Builds each
+            endpoint's socket. Defaults to a multicast sending socket.
+
+    Returns:
+        list[DroneEndpoint]: The endpoints, closed, with their send counts.
+    """
+    drones = [DroneEndpoint(i, address, rate) for i in range(drone_count)]
+    for drone in drones:
+        await drone.open(sock_factory() if sock_factory else None)
+    stop = asyncio.Event()
+    tasks = [asyncio.create_task(drone.run(stop)) for drone in drones]
+    try:
+        if duration is None:
+            await asyncio.gather(*tasks)
+        else:
+            await asyncio.sleep(duration)
+            stop.set()
+            await asyncio.gather(*tasks)
+    finally:
+        for drone in drones:
+            drone.close()
+    return drones
+
+
+async def _run_controller(group: str, port: int, interval: float) -> None:
+    controller = await open_controller(group, port)
+    while True:
+        await asyncio.sleep(interval)
+        print(
+            f"{controller.received} datagrams, {len(controller.latest)} drones, "
+            f"{controller.malformed} malformed"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("role", choices=["controller", "swarm"])
+    parser.add_argument("--group", default=MCAST_GRP)
+    parser.add_argument("--port", type=int, default=MCAST_PORT)
+    parser.add_argument("--drones", type=int, default=100)
+    parser.add_argument("--rate", type=float, default=1.0)
+    parser.add_argument("--duration", type=float, default=None)
+    args = parser.parse_args()
+
+    if args.role == "controller":
+        asyncio.run(_run_controller(args.group, args.port, 1.0))
+    else:
+        asyncio.run(
+            run_swarm(args.drones, (args.group, args.port), args.rate, args.duration)
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,29 +1,44 @@
-import socket
-import struct
+import argparse
 
-# from threading import Thread
+from multicast_protocol import (
+    DEFAULT_MAX_DATAGRAM,
+    MCAST_GRP,
+    MCAST_PORT,
+    PositionReceiver,
+    ProtocolError,
+    open_receiver_socket,
+)
 
 
 def main() -> None:
-    mcast_grp = "239.255.255.250"
-    mcast_port = 12345
+    parser = argparse.ArgumentParser(description="Receives swarm positions.")
+    parser.add_argument("--group", default=MCAST_GRP)
+    parser.add_argument("--port", type=int, default=MCAST_PORT)
+    parser.add_argument("--max-datagram", type=int, default=DEFAULT_MAX_DATAGRAM)
+    parser.add_argument("--verbose", action="store_true", help="Print every record")
+    args = parser.parse_args()
 
-    multicast_client = socket.socket(
-        socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP
-    )
+    multicast_client = open_receiver_socket(args.group, args.port)
     multicast_client.settimeout(5.0)
-    multicast_client.bind(("", mcast_port))
-    mreq = struct.pack("4s4s", socket.inet_aton(mcast_grp), socket.inet_aton("0.0.0.0"))
-    multicast_client.setsockopt(socket.IPPROTO_IP, socket.IP_ADD_MEMBERSHIP, mreq)
-    multicast_client.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    receiver = PositionReceiver(multicast_client, args.max_datagram)
 
     while True:
         try:
-            print("RECEIVING")
-            data, addr = multicast_client.recvfrom(1000)
-            print(f"Received message: {data.decode()} from {addr}")
+            frame, addr = receiver.receive()
         except TimeoutError:
             print("TIMED OUT!")
+            continue
+        except ProtocolError as e:
+            print(f"Dropped malformed datagram: {e}")
+            continue
+
+        print(
+            f"Tick {frame.tick} chunk {frame.chunk_index + 1}/{frame.chunk_count}: "
+            f"{frame.record_count} drones from {addr}, {receiver.dropped} dropped"
+        )
+        if args.verbose:
+            for drone_id, x, y, z in frame.iter_records():
+                print(f"\tDrone {drone_id}: ({x:.3f}, {y:.3f}, {z:.3f})")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,97 @@
+"""Loopback load test for the asyncio multicast endpoints.
+
+Hosts --drones DroneEndpoints and one controller in a single event loop and
+reports datagrams per second, loss and end-to-end latency percentiles.
+
+    python multicast_load_test.py --drones 200 --rate 20 --duration 5
+    python multicast_load_test.py --multicast --drones 200 --rate 20
+
+Without --multicast traffic goes over unicast 127.0.0.1, which works on hosts
+without a multicast route.
+"""
+
+import argparse
+import asyncio
+import socket
+
+from multicast_async import open_controller, run_swarm
+from multicast_protocol import MCAST_GRP, MCAST_PORT
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+    if not sorted_values:
+        return float("nan")
+    index = min(len(sorted_values) - 1, int(fraction * len(sorted_values)))
+    return sorted_values[index]
+
+
+def _unicast_socket() -> socket.socket:
+    return socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
+
+
+async def load_test(
+    drone_count: int, rate: float, duration: float, multicast: bool, port: int
+) -> dict[str, float]:
+    """Runs the swarm against a controller and returns throughput and latency."""
+    # Room for the latency of every datagram the run is expected to send
+    latency_samples = max(int(drone_count * rate * (duration + 1)), 1)
+    if multicast:
+        controller = await open_controller(
+            MCAST_GRP, port, latency_samples=latency_samples
+        )
+        address = (MCAST_GRP, port)
+        sock_factory = None
+    else:
+        controller = await open_controller(None, 0, latency_samples=latency_samples)
+        address = controller.transport.get_extra_info("sockname")[:2]
+        sock_factory = _unicast_socket
+
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    drones = await run_swarm(drone_count, address, rate, duration, sock_factory)
+    # Let datagrams still in flight arrive
+    await asyncio.sleep(0.2)
+    elapsed = loop.time() - start
+    controller.transport.close()
+
+    sent = sum(drone.sent for drone in drones)
+    latencies = sorted(controller.latencies)
+    return {
+        "sent": sent,
+        "received": controller.received,
+        "loss": 1 - controller.received / sent if sent else 0.0,
+        "msgs_per_sec": controller.received / elapsed,
+        "drones_seen": len(controller.latest),
+        "pauses": sum(drone.protocol.pauses for drone in drones),
+        "p50_ms": percentile(latencies, 0.50) * 1000,
+        "p95_ms": percentile(latencies, 0.95) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+        "max_ms": (latencies[-1] if latencies else float("nan")) * 1000,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--drones", type=int, default=200)
+    parser.add_argument("--rate", type=float, default=20.0)
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument("--multicast", action="store_true")
+    parser.add_argument("--port", type=int, default=MCAST_PORT)
+    args = parser.parse_args()
+
+    result = asyncio.run(
+        load_test(args.drones, args.rate, args.duration, args.multicast, args.port)
+    )
+    print(
+        f"{result['sent']} sent, {result['received']} received "
+        f"({result['loss']:.2%} lost) from {result['drones_seen']} drones"
+    )
+    print(f"{result['msgs_per_sec']:.0f} msgs/sec, {result['pauses']} writer pauses")
+    print(
+        f"latency ms  p50 {result['p50_ms']:.3f}  p95 {result['p95_ms']:.3f}  "
+        f"p99 {result['p99_ms']:.3f}  max {result['max_ms']:.3f}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,301 @@
+"""Binary wire format for broadcasting swarm positions over multicast.
+
+Every datagram is a header followed by packed position records:
+
+    header  !2sBBIIHHH  magic, version, message type, sequence number, tick id,
+                        chunk index, chunk count, record count
+    stamp   !d          send time, only in MSG_TIMED_POSITIONS datagrams
+    record  !Iddd       drone id, x, y, z
+
+All drones moved in one tick are split across as few datagrams as fit in
+max_datagram bytes. Chunks of a tick share its tick id and are numbered
+0..chunk_count-1, and the sequence number increases by one per datagram so
+receivers can count drops. MSG_TIMED_POSITIONS datagrams carry the sender's
+time.time() after the header so receivers can measure end-to-end latency.
+"""
+
+import socket
+import struct
+from collections.abc import Iterator, Sequence
+
+MAGIC = b"GS"
+VERSION = 1
+MSG_POSITIONS = 1
+MSG_TIMED_POSITIONS = 2
+
+HEADER = struct.Struct("!2sBBIIHHH")
+RECORD = struct.Struct("!Iddd")
+TIMESTAMP = struct.Struct("!d")
+
+# 1500 byte Ethernet MTU minus the 20 byte IPv4 and 8 byte UDP headers
+DEFAULT_MAX_DATAGRAM = 1472
+MCAST_GRP = "239.255.255.250"
+MCAST_PORT = 12345
+
+Record = tuple[int, float, float, float]
+
+
+class ProtocolError(ValueError):
+    """Raised when a datagram does not follow the wire format."""
+
+
+def records_per_datagram(max_datagram: int = DEFAULT_MAX_DATAGRAM) -> int:
+    """Number of position records that fit in one datagram after the header."""
+    count = (max_datagram - HEADER.size) // RECORD.size
+    if count < 1:
+        raise ValueError(f"max_datagram {max_datagram} cannot hold a single record")
+    return min(count, 0xFFFF)
+
+
+class PositionFrame:
+    """One decoded datagram. records is a view into the receive buffer, so it
+    is only valid until the next datagram is received into that buffer.
+    """
+
+    __slots__ = (
+        "chunk_count",
+        "chunk_index",
+        "record_count",
+        "records",
+        "sent_at",
+        "sequence",
+        "tick",
+    )
+
+    def __init__(
+        self,
+        sequence: int,
+        tick: int,
+        chunk_index: int,
+        chunk_count: int,
+        record_count: int,
+        records: memoryview,
+        sent_at: float | None = None,
+    ) -> None:
+        self.sequence = sequence
+        self.tick = tick
+        self.chunk_index = chunk_index
+        self.chunk_count = chunk_count
+        self.record_count = record_count
+        self.records = records
+        self.sent_at = sent_at
+
+    def iter_records(self) -> Iterator[Record]:
+        """Yields (drone id, x, y, z) for every record, unpacked in place."""
+        return RECORD.iter_unpack(self.records)
+
+
+class PositionEncoder:
+    """Packs ticks of position records into reusable datagram buffers.
+
+    Buffers are allocated once and grown only when a tick needs more chunks
+    than any tick before it. The memoryviews returned by encode_tick point
+    into those buffers and are overwritten by the next call.
+    """
+
+    def __init__(self, max_datagram: int = DEFAULT_MAX_DATAGRAM) -> None:
+        self.max_datagram = max_datagram
+        self.per_datagram = records_per_datagram(max_datagram)
+        self.per_timed_datagram = records_per_datagram(max_datagram - TIMESTAMP.size)
+        self.sequence = 0
+        self._buffers: list[bytearray] = []
+
+    def _buffer(self, index: int) -> bytearray:
+        while len(self._buffers) <= index:
+            self._buffers.append(bytearray(self.max_datagram))
+        return self._buffers[index]
+
+    def encode_tick(
+        self, tick: int, records: Sequence[Record], sent_at: float | None = None
+    ) -> list[memoryview]:
+        """Encodes every record of one tick into as few datagrams as possible.
+
+        Args:
+            tick (int): Simulation tick the positions belong to.
+            records (Sequence[Record]): (drone id, x, y, z) of each drone moved.
+            sent_at (float | None, optional): time.time() to stamp the datagrams
+                with. When set they are sent as MSG_TIMED_POSITIONS.
+
+        Returns:
+            list[memoryview]: One view per datagram, ready to send.
+        """
+        timed = sent_at is not None
+        per_datagram = self.per_timed_datagram if timed else self.per_datagram
+        chunk_count = max(1, -(-len(records) // per_datagram))
+        if chunk_count > 0xFFFF:
+            raise ValueError(f"{len(records)} records do not fit in one tick")
+
+        datagrams = []
+        for chunk_index in range(chunk_count):
+            start = chunk_index * per_datagram
+            chunk = records[start : start + per_datagram]
+            buffer = self._buffer(chunk_index)
+            HEADER.pack_into(
+                buffer,
+                0,
+                MAGIC,
+                VERSION,
+                MSG_TIMED_POSITIONS if timed else MSG_POSITIONS,
+                self.sequence,
+                tick & 0xFFFFFFFF,
+                chunk_index,
+                chunk_count,
+                len(chunk),
+            )
+            offset = HEADER.size
+            if timed:
+                TIMESTAMP.pack_into(buffer, offset, sent_at)
+                offset += TIMESTAMP.size
+            for drone_id, x, y, z in chunk:
+                RECORD.pack_into(buffer, offset, drone_id, x, y, z)
+                offset += RECORD.size
+            datagrams.append(memoryview(buffer)[:offset])
+            self.sequence = (self.sequence + 1) & 0xFFFFFFFF
+        return datagrams
+
+
+def decode(datagram: memoryview) -> PositionFrame:
+    """Decodes one datagram without copying its records.
+
+    Args:
+        datagram (memoryview): Exactly the bytes received.
+
+    Returns:
+        PositionFrame: Header fields and a view over the records.
+    """
+    if len(datagram) < HEADER.size:
+        raise ProtocolError(
+            f"datagram of {len(datagram)} bytes is shorter than a header"
+        )
+    (
+        magic,
+        version,
+        message_type,
+        sequence,
+        tick,
+        chunk_index,
+        chunk_count,
+        record_count,
+    ) = HEADER.unpack_from(datagram)
+    if magic != MAGIC:
+        raise ProtocolError(f"bad magic {magic!r}")
+    if version != VERSION:
+        raise ProtocolError(f"unsupported version {version}")
+    start = HEADER.size
+    sent_at = None
+    if message_type == MSG_TIMED_POSITIONS:
+        if len(datagram) < start + TIMESTAMP.size:
+            raise ProtocolError("timed datagram is missing its timestamp")
+        (sent_at,) = TIMESTAMP.unpack_from(datagram, start)
+        start += TIMESTAMP.size
+    elif message_type != MSG_POSITIONS:
+        raise ProtocolError(f"unknown message type {message_type}")
+    end = start + record_count * RECORD.size
+    if len(datagram) != end:
+        raise ProtocolError(
+            f"{record_count} records need {end} bytes, datagram has {len(datagram)}"
+        )
+    return PositionFrame(
+        sequence,
+        tick,
+        chunk_index,
+        chunk_count,
+        record_count,
+        datagram[start:end],
+        sent_at,
+    )
+
+
+class PositionSender:
+    """Sends ticks of positions to a multicast group, or any UDP address."""
+
+    def __init__(
+        self,
+        sock: socket.socket,
+        address: tuple[str, int] = (MCAST_GRP, MCAST_PORT),
+        max_datagram: int = DEFAULT_MAX_DATAGRAM,
+    ) -> None:
+        self.sock = sock
+        self.address = address
+        self.encoder = PositionEncoder(max_datagram)
+
+    def send_tick(self, tick: int, records: Sequence[Record]) -> int:
+        """Sends every record of one tick.
+
+        Returns:
+            int: Number of datagrams sent.
+        """
+        datagrams = self.encoder.encode_tick(tick, records)
+        for datagram in datagrams:
+            self.sock.sendto(datagram, self.address)
+        return len(datagrams)
+
+
+class PositionReceiver:
+    """Receives datagrams into one preallocated buffer and decodes them in place.
+
+    Every sender numbers its datagrams on its own, so sequence numbers are
+    followed per sender address and gaps in any of them add up in dropped.
+    """
+
+    def __init__(
+        self, sock: socket.socket, max_datagram: int = DEFAULT_MAX_DATAGRAM
+    ) -> None:
+        self.sock = sock
+        self._buffer = bytearray(max_datagram)
+        self._view = memoryview(self._buffer)
+        self.dropped = 0
+        # Sender address -> sequence number expected next from it
+        self._next_sequence: dict[tuple[str, int], int] = {}
+
+    def receive(self) -> tuple[PositionFrame, tuple[str, int]]:
+        """Blocks for the next datagram and decodes it.
+
+        Returns:
+            tuple[PositionFrame, tuple[str, int]]: The frame, valid until the next
+            call, and the sender's address.
+        """
+        nbytes, address = self.sock.recvfrom_into(self._buffer)
+        frame = decode(self._view[:nbytes])
+        expected = self._next_sequence.get(address)
+        if expected is not None:
+            gap = (frame.sequence - expected) & 0xFFFFFFFF
+            if gap >= 0x80000000:
+                # Late, reordered datagram: counted as dropped when it was skipped
+                return frame, address
+            self.dropped += gap
+        self._next_sequence[address] = (frame.sequence + 1) & 0xFFFFFFFF
+        return frame, address
+
+
+def open_sender_socket(
+    ttl: int = 255, interface: str = "0.0.0.0", loopback: bool = True
+) -> socket.socket:
+    """Creates a UDP socket configured to send multicast.
+
+    Args:
+        ttl (int, optional): Multicast hop limit. Defaults to 255.
+        interface (str, optional): Local address of the sending interface.
+        loopback (bool, optional): Deliver to receivers on this host too, which
+            lets the protocol be exercised over loopback. Defaults to True.
+    """
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.setsockopt(
+        socket.IPPROTO_IP, socket.IP_MULTICAST_IF, socket.inet_aton(interface)
+    )
+    sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_TTL, ttl)
+    sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_LOOP, int(loopback))
+    return sock
+
+
+def open_receiver_socket(
+    group: str = MCAST_GRP, port: int = MCAST_PORT, interface: str = "0.0.0.0"
+) -> socket.socket:
+    """Creates a UDP socket bound to port and joined to a multicast group."""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind(("", port))
+    mreq = struct.pack("4s4s", socket.inet_aton(group), socket.inet_aton(interface))
+    sock.setsockopt(socket.IPPROTO_IP, socket.IP_ADD_MEMBERSHIP, mreq)
+    return sock
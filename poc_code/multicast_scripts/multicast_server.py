@@ -1,32 +1,45 @@
-import socket
-import struct
+import argparse
+import random
 from time import sleep
 
+from multicast_protocol import (
+    DEFAULT_MAX_DATAGRAM,
+    MCAST_GRP,
+    MCAST_PORT,
+    PositionSender,
+    Record,
+    open_sender_socket,
+)
 
-def main() -> None:
-    mcast_grp = "239.255.255.250"
-    mcast_port = 12345
-    mcast_ttl = 255
 
-    multicast_server = socket.socket(
-        socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP
-    )
-    multicast_server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-    multicast_server.setsockopt(
-        socket.IPPROTO_IP, socket.IP_MULTICAST_IF, socket.inet_aton("0.0.0.0")
-    )
-    multicast_server.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_TTL, mcast_ttl)
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Broadcasts swarm positions.")
+    parser.add_argument("--group", default=MCAST_GRP)
+    parser.add_argument("--port", type=int, default=MCAST_PORT)
+    parser.add_argument("--ttl", type=int, default=255)
+    parser.add_argument("--drones", type=int, default=100)
+    parser.add_argument("--interval", type=float, default=1.0)
+    parser.add_argument("--max-datagram", type=int, default=DEFAULT_MAX_DATAGRAM)
+    args = parser.parse_args()
 
-    str_message = "Hello World!"
-    str_message_len = len(str_message)
-    message = struct.pack(
-        f"H{str_message_len}s", str_message_len, str_message.encode("utf-8")
+    multicast_server = open_sender_socket(args.ttl)
+    sender = PositionSender(
+        multicast_server, (args.group, args.port), args.max_datagram
     )
 
+    # Stand-in for the simulation: every drone wanders a little each tick
+    positions: list[list[float]] = [[0.0, 0.0, 0.0] for _ in range(args.drones)]
+    tick = 0
     while True:
-        print(f"Sending {message}")
-        multicast_server.sendto(message, (mcast_grp, mcast_port))
-        sleep(1)
+        moved: list[Record] = []
+        for drone_id, position in enumerate(positions):
+            for axis in range(3):
+                position[axis] += random.uniform(-0.5, 0.5)
+            moved.append((drone_id, *position))
+        datagrams = sender.send_tick(tick, moved)
+        print(f"Sent tick {tick}: {len(moved)} drones in {datagrams} datagrams")
+        tick += 1
+        sleep(args.interval)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,160 @@
+"""Reader/writer contention on a DroneGraph for three edge locking strategies.
+
+Run from the src directory:
+    python -m benchmarks.contention_benchmark --drones 64 --readers 4 --writers 2
+
+per-edge  every Distance owns an RWLock (the original layout)
+striped   Distances share a StripedLocks pool
+snapshot  readers use the lock-free PositionSnapshot, writers publish a new epoch
+"""
+
+import argparse
+import random
+import threading
+import time
+from collections.abc import Callable
+
+from rf_sim.drone import Drone
+from rf_sim.utils.distance_obj import Distance
+from rf_sim.utils.graph_wrapper import DroneGraph
+from rf_sim.utils.read_write_lock import RWLock
+from rf_sim.utils.snapshot import SnapshotPublisher, StripedLocks
+from rf_sim.utils.vector import Vector
+
+
+def _build_graph(
+    drone_count: int, make_lock: Callable[[int, int], RWLock]
+) -> DroneGraph:
+    rng = random.Random(0)
+    graph = DroneGraph(multigraph=False)
+    graph.add_nodes_from(
+        [
+            Drone(i, rng.uniform(0, 100), rng.uniform(0, 100), rng.uniform(0, 100))
+            for i in range(drone_count)
+        ]
+    )
+    graph.add_edges_from(
+        [
+            (a, b, Distance(0.0, 0.0, 0.0, make_lock(a, b), a))
+            for a in range(drone_count)
+            for b in range(a + 1, drone_count)
+        ]
+    )
+    return graph
+
+
+def _locked_workers(
+    graph: DroneGraph,
+) -> tuple[Callable[[random.Random], None], Callable[[random.Random], None]]:
+    def read(rng: random.Random) -> None:
+        node_id = rng.randrange(graph.num_nodes())
+        for _, _, edge_data in graph.out_edges(node_id):
+            edge_data.get_vector_and_last_to_write()
+
+    def write(rng: random.Random) -> None:
+        node_id = rng.randrange(graph.num_nodes())
+        drone = graph.get_node_data(node_id)
+        drone.move_x(rng.uniform(-1, 1))
+        for out_id, in_id, edge_data in graph.out_edges(node_id):
+            other = graph.get_node_data(in_id)
+            edge_data.update_vector_with_vector(
+                Vector(
+                    drone.get_x() - other.get_x(),
+                    drone.get_y() - other.get_y(),
+                    drone.get_z() - other.get_z(),
+                ),
+                out_id,
+            )
+
+    return read, write
+
+
+def _snapshot_workers(
+    graph: DroneGraph,
+) -> tuple[Callable[[random.Random], None], Callable[[random.Random], None]]:
+    publisher = SnapshotPublisher()
+    publisher.publish_graph(graph)
+    write_lock = threading.Lock()
+
+    def read(rng: random.Random) -> None:
+        snapshot = publisher.current()
+        node_id = rng.randrange(graph.num_nodes())
+        for in_id in snapshot.positions:
+            if in_id != node_id:
+                snapshot.get_displacement(node_id, in_id)
+
+    def write(rng: random.Random) -> None:
+        node_id = rng.randrange(graph.num_nodes())
+        with write_lock:
+            graph.get_node_data(node_id).move_x(rng.uniform(-1, 1))
+            publisher.publish_graph(graph)
+
+    return read, write
+
+
+def run(
+    strategy: str, drone_count: int, readers: int, writers: int, seconds: float
+) -> dict[str, float]:
+    """Runs one strategy and returns reads and writes per second."""
+    if strategy == "per-edge":
+        read, write = _locked_workers(_build_graph(drone_count, lambda a, b: RWLock()))
+    elif strategy == "striped":
+        stripes = StripedLocks()
+        read, write = _locked_workers(_build_graph(drone_count, stripes.lock_for))
+    else:
+        read, write = _snapshot_workers(
+            _build_graph(drone_count, lambda a, b: RWLock())
+        )
+
+    stop = threading.Event()
+    counts = {"reads": 0, "writes": 0}
+    counts_lock = threading.Lock()
+
+    def worker(
+        kind: str, operation: Callable[[random.Random], None], seed: int
+    ) -> None:
+        rng = random.Random(seed)
+        done = 0
+        while not stop.is_set():
+            operation(rng)
+            done += 1
+        with counts_lock:
+            counts[kind] += done
+
+    threads = [
+        threading.Thread(target=worker, args=("reads", read, i)) for i in range(readers)
+    ] + [
+        threading.Thread(target=worker, args=("writes", write, readers + i))
+        for i in range(writers)
+    ]
+    for thread in threads:
+        thread.start()
+    time.sleep(seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+    return {
+        "reads_per_sec": counts["reads"] / seconds,
+        "writes_per_sec": counts["writes"] / seconds,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--drones", type=int, default=64)
+    parser.add_argument("--readers", type=int, default=4)
+    parser.add_argument("--writers", type=int, default=2)
+    parser.add_argument("--seconds", type=float, default=2.0)
+    args = parser.parse_args()
+
+    print(f"{'strategy':>10} {'reads/s':>12} {'writes/s':>12}")
+    for strategy in ("per-edge", "striped", "snapshot"):
+        result = run(strategy, args.drones, args.readers, args.writers, args.seconds)
+        print(
+            f"{strategy:>10} {result['reads_per_sec']:>12.0f} {result['writes_per_sec']:>12.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Per pass cost of space_drones with and without a ForceCache as a swarm settles.
+
+Run from the src directory:
+    python -m benchmarks.force_cache_benchmark --drones 50 100 --passes 60
+
+Both runs start from the same seeded placement. Early passes move every drone
+and cost the same either way. Once most drones stop, usually pinned against
+the field walls, cached passes only pay for the drones that still move.
+"""
+
+import argparse
+import random
+import time
+
+from rf_sim.field import Field, UpdateMode
+from rf_sim.simulation import Simulation
+
+
+def run(
+    drone_count: int, passes: int, mode: UpdateMode, cached: bool, seed: int
+) -> tuple[list[float], Field]:
+    """Seconds taken by each pass, and the field that was spaced."""
+    simulation, field = Simulation.build_swarm(drone_count, rng=random.Random(seed))
+    if cached:
+        field.enable_force_cache()
+
+    seconds = []
+    for iteration in range(passes):
+        start = time.perf_counter()
+        field.space_drones(
+            simulation.graph,
+            lambda _node_id: simulation.refresh_dirty_edges(),
+            update_mode=mode,
+            iteration=iteration,
+            refresh_edges_function=simulation.refresh_dirty_edges,
+        )
+        seconds.append(time.perf_counter() - start)
+    return seconds, field
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--drones", type=int, nargs="+", default=[50, 100])
+    parser.add_argument("--passes", type=int, default=60)
+    parser.add_argument(
+        "--mode",
+        choices=[m.value for m in UpdateMode],
+        default=UpdateMode.GAUSS_SEIDEL.value,
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    mode = UpdateMode(args.mode)
+    window = max(args.passes // 5, 1)
+
+    print(
+        f"{'drones':>8} {'first ms':>10} {'cached':>10}"
+        f" {'last ms':>10} {'cached':>10} {'hit rate':>9}"
+    )
+    for drone_count in args.drones:
+        plain, _ = run(drone_count, args.passes, mode, False, args.seed)
+        cached, field = run(drone_count, args.passes, mode, True, args.seed)
+        first = sum(plain[:window]) / window * 1e3
+        first_cached = sum(cached[:window]) / window * 1e3
+        last = sum(plain[-window:]) / window * 1e3
+        last_cached = sum(cached[-window:]) / window * 1e3
+        print(
+            f"{drone_count:>8} {first:>10.2f} {first_cached:>10.2f}"
+            f" {last:>10.2f} {last_cached:>10.2f}"
+            f" {field.force_cache.stats.hit_rate:>9.1%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
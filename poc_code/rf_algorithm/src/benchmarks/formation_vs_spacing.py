@@ -0,0 +1,72 @@
+"""Time to an equidistant formation: formation solver versus space_drones passes.
+
+Run from the src directory:
+    python -m benchmarks.formation_vs_spacing --drones 4 16 64 --seeds 0 1
+
+Spacing runs until the spread of drone-to-controller distances is within
+--tolerance or --max-iterations passes ran. The solver places drones on a
+sphere around the controller and assigns slots with the Hungarian algorithm;
+its travel time assumes every drone flies straight to its slot at MAX_SPEED.
+"""
+
+import argparse
+import random
+import time
+
+from rf_sim.convergence import ConvergenceCriteria, Criterion, run_until_converged
+from rf_sim.formation import solve_formation
+from rf_sim.simulation import Simulation
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--drones", type=int, nargs="+", default=[4, 16, 64])
+    parser.add_argument("--seeds", type=int, nargs="+", default=[0, 1])
+    parser.add_argument("--tolerance", type=float, default=0.1)
+    parser.add_argument("--max-iterations", type=int, default=1000)
+    args = parser.parse_args()
+
+    print(
+        f"{'drones':>7} {'seed':>5} {'method':>9} {'passes':>7} {'wall s':>8} "
+        f"{'travel s':>9} {'residual':>10}"
+    )
+    for drone_count in args.drones:
+        for seed in args.seeds:
+            simulation, field = Simulation.build_swarm(
+                drone_count, rng=random.Random(seed)
+            )
+            controller_location = simulation.controller.get_location()
+            result = run_until_converged(
+                lambda _iteration, monitor: field.space_drones(
+                    simulation.graph,
+                    lambda _node_id: simulation.refresh_dirty_edges(),
+                    monitor=monitor,
+                ),
+                ConvergenceCriteria(
+                    criterion=Criterion.EQUIDISTANCE,
+                    tolerance=args.tolerance,
+                    max_iterations=args.max_iterations,
+                ),
+                lambda: field.equidistance_residual(controller_location),
+            )
+            print(
+                f"{drone_count:>7} {seed:>5} {'spacing':>9} {result.iterations:>7} "
+                f"{result.wall_time:>8.3f} {'-':>9} {result.residual:>10.4f}"
+            )
+
+            _simulation, field = Simulation.build_swarm(
+                drone_count, rng=random.Random(seed)
+            )
+            start = time.perf_counter()
+            plan = solve_formation(field, field.drones, controller_location)
+            plan.apply()
+            wall_time = time.perf_counter() - start
+            print(
+                f"{drone_count:>7} {seed:>5} {'formation':>9} {'-':>7} "
+                f"{wall_time:>8.3f} {plan.time_to_formation():>9.3f} "
+                f"{field.equidistance_residual(controller_location):>10.4f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""Bytes per drone and per edge for Drone/Distance objects versus DroneState views.
+
+Run from the src directory:
+    python -m benchmarks.memory_benchmark --drones 100 200 400
+
+Only the Python heap is measured with tracemalloc. rustworkx keeps its own
+node and edge bookkeeping on the Rust heap, which is the same for both layouts.
+
+A DroneView has no __dict__, its per-drone bytes are its slots (velocity,
+speed limits and move listener) plus its row of the position array.
+"""
+
+import argparse
+import gc
+import tracemalloc
+from collections.abc import Callable
+
+from rf_sim.drone import Drone
+from rf_sim.drone_state import DroneState
+from rf_sim.utils.distance_obj import Distance
+from rf_sim.utils.graph_wrapper import DroneGraph
+from rf_sim.utils.read_write_lock import RWLock
+
+
+def _measure(build: Callable[[], object]) -> tuple[int, object]:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return after - before, result
+
+
+def object_layout(drone_count: int) -> tuple[float, float]:
+    """Bytes per drone and per edge using Drone and Distance objects."""
+    drone_bytes, drones = _measure(
+        lambda: [Drone(i, float(i), float(i), float(i)) for i in range(drone_count)]
+    )
+
+    def build_edges() -> DroneGraph:
+        graph = DroneGraph(multigraph=False)
+        graph.add_nodes_from(drones)
+        graph.add_edges_from(
+            [
+                (a, b, Distance(0.0, 0.0, 0.0, RWLock(), a))
+                for a in range(drone_count)
+                for b in range(a + 1, drone_count)
+            ]
+        )
+        return graph
+
+    edge_bytes, graph = _measure(build_edges)
+    return drone_bytes / drone_count, edge_bytes / graph.num_edges()
+
+
+def state_layout(drone_count: int) -> tuple[float, float]:
+    """Bytes per drone and per edge using a DroneState with view proxies."""
+    state = DroneState(capacity=drone_count)
+    drone_bytes, drones = _measure(
+        lambda: [
+            state.add_drone(i, float(i), float(i), float(i)) for i in range(drone_count)
+        ]
+    )
+
+    def build_edges() -> DroneGraph:
+        state.reserve_edges(drone_count * (drone_count - 1) // 2)
+        graph = DroneGraph(multigraph=False)
+        graph.add_nodes_from(drones)
+        graph.add_edges_from(
+            [
+                (a, b, state.add_edge(a, b))
+                for a in range(drone_count)
+                for b in range(a + 1, drone_count)
+            ]
+        )
+        return graph
+
+    edge_bytes, graph = _measure(build_edges)
+    # The position array is preallocated, so charge it to the drones
+    drone_bytes += state.positions.nbytes
+    return drone_bytes / drone_count, edge_bytes / graph.num_edges()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--drones", type=int, nargs="+", default=[50, 100, 200, 400])
+    args = parser.parse_args()
+
+    print(f"{'drones':>8} {'layout':>8} {'B/drone':>10} {'B/edge':>10}")
+    for drone_count in args.drones:
+        for name, layout in (("objects", object_layout), ("state", state_layout)):
+            per_drone, per_edge = layout(drone_count)
+            print(f"{drone_count:>8} {name:>8} {per_drone:>10.1f} {per_edge:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
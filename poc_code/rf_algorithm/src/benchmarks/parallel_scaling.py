@@ -0,0 +1,79 @@
+"""Scaling of ParallelSpacer ticks across worker counts.
+
+Run from the src directory:
+    python -m benchmarks.parallel_scaling --drones 4000 --ticks 3 --workers 1 2 4 8
+
+Every worker count is checked against a serial jacobi_rows run and must match
+it exactly.
+"""
+
+import argparse
+import random
+import time
+
+import numpy as np
+
+from rf_sim.drone import Drone
+from rf_sim.field import Field
+from rf_sim.parallel_space import ParallelSpacer, jacobi_rows
+from rf_sim.utils.graph_wrapper import DroneGraph
+
+
+def _build(drone_count: int, seed: int) -> tuple[DroneGraph, Field]:
+    random.seed(seed)
+    drones = [Drone(i, 0, 0, 0) for i in range(drone_count)]
+    field = Field(100, 100, 100, drones)
+    field.randomly_place_drones()
+    graph = DroneGraph(multigraph=False)
+    graph.add_nodes_from(drones)
+    return graph, field
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--drones", type=int, default=4000)
+    parser.add_argument("--ticks", type=int, default=3)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    graph, field = _build(args.drones, args.seed)
+    expected = np.array(
+        [(d.get_x(), d.get_y(), d.get_z()) for d in field.drones], dtype=np.float64
+    )
+    bounds = np.array([field.x_size, field.y_size, field.z_size])
+    start = time.perf_counter()
+    for _ in range(args.ticks):
+        moved = np.empty_like(expected)
+        jacobi_rows(
+            expected,
+            moved,
+            0,
+            len(expected),
+            bounds,
+            False,
+            0.15,
+            field.repulsion_strength,
+            field.min_distance,
+            field.max_step,
+        )
+        expected = moved
+    serial_seconds = (time.perf_counter() - start) / args.ticks
+    print(f"{'workers':>8} {'s/tick':>10} {'speedup':>8} {'matches':>8}")
+    print(f"{'serial':>8} {serial_seconds:>10.4f} {1.0:>8.2f} {'-':>8}")
+
+    for workers in args.workers:
+        graph, field = _build(args.drones, args.seed)
+        with ParallelSpacer(graph, field, workers) as spacer:
+            start = time.perf_counter()
+            for _ in range(args.ticks):
+                spacer.step(0.15, write_back=False)
+            seconds = (time.perf_counter() - start) / args.ticks
+            matches = np.array_equal(spacer.positions, expected)
+        print(
+            f"{workers:>8} {seconds:>10.4f} {serial_seconds / seconds:>8.2f} {matches!s:>8}"
+        )
+
+
+if __name__ == "__main__":
+    main()
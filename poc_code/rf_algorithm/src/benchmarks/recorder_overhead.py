@@ -0,0 +1,70 @@
+"""Cost of recording every engine tick with a TrajectoryRecorder.
+
+Run from the src directory:
+    python -m benchmarks.recorder_overhead --drones 50 100 200
+
+Each size runs the same seeded engine without and with a recorder whose ring
+buffer is smaller than the run, so the timing includes wraparound. Both are
+repeated --repeat times, interleaved, and the fastest run of each is reported.
+"""
+
+import argparse
+import tempfile
+import time
+
+from rf_sim.engine import EngineConfig, SimulationEngine
+from rf_sim.simulation import Simulation
+from rf_sim.trajectory import TrajectoryRecorder
+
+
+def run(drone_count: int, ticks: int, record_dir: str | None) -> float:
+    """Seconds taken by ticks engine steps, recording each one into record_dir."""
+    # The engine scatters the drones itself
+    simulation, field = Simulation.build_swarm(drone_count, place=False)
+    engine = SimulationEngine(
+        field,
+        simulation.graph,
+        simulation.refresh_dirty_edges,
+        EngineConfig(seed=0),
+    )
+    engine.scatter_drones()
+    recorder = (
+        TrajectoryRecorder(record_dir, simulation.drones, max(ticks // 2, 1))
+        if record_dir
+        else None
+    )
+
+    start = time.perf_counter()
+    for tick in range(ticks):
+        engine.step()
+        if recorder is not None:
+            recorder.record(tick)
+    elapsed = time.perf_counter() - start
+    if recorder is not None:
+        recorder.close()
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--drones", type=int, nargs="+", default=[50, 100, 200])
+    parser.add_argument("--ticks", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'drones':>8} {'plain s':>10} {'recorded s':>11} {'overhead':>9}")
+    for drone_count in args.drones:
+        plain_runs = []
+        recorded_runs = []
+        for _ in range(args.repeat):
+            plain_runs.append(run(drone_count, args.ticks, None))
+            with tempfile.TemporaryDirectory() as record_dir:
+                recorded_runs.append(run(drone_count, args.ticks, record_dir))
+        plain = min(plain_runs)
+        recorded = min(recorded_runs)
+        overhead = (recorded - plain) / plain
+        print(f"{drone_count:>8} {plain:>10.3f} {recorded:>11.3f} {overhead:>9.1%}")
+
+
+if __name__ == "__main__":
+    main()
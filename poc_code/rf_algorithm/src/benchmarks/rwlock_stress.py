@@ -0,0 +1,112 @@
+"""Writer latency percentiles under a read-heavy load for each readers-writer lock.
+
+Run from the src directory:
+    python -m benchmarks.rwlock_stress --readers 8 --writers 1 --seconds 2
+
+Readers hold the lock while scanning a list, like a DroneGraph dump or an
+equidistance check. Writers record how long each acquire_write call waited.
+"""
+
+import argparse
+import threading
+import time
+from collections.abc import Callable
+
+from rf_sim.utils.fair_rwlock import FairnessPolicy, FairRWLock
+from rf_sim.utils.read_write_lock import RWLock
+
+
+def _percentile(samples: list[float], fraction: float) -> float:
+    if not samples:
+        return float("nan")
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def run(
+    make_lock: Callable[[], RWLock | FairRWLock],
+    readers: int,
+    writers: int,
+    seconds: float,
+    scan_length: int,
+) -> dict[str, float]:
+    """Stresses one lock and returns writer wait percentiles in milliseconds."""
+    lock = make_lock()
+    shared = list(range(scan_length))
+    stop = threading.Event()
+    write_waits: list[float] = []
+    reads = [0]
+    samples_lock = threading.Lock()
+
+    def reader() -> None:
+        done = 0
+        while not stop.is_set():
+            lock.acquire_read()
+            sum(shared)
+            lock.release_read()
+            done += 1
+        with samples_lock:
+            reads[0] += done
+
+    def writer() -> None:
+        waits = []
+        while not stop.is_set():
+            start = time.perf_counter()
+            lock.acquire_write()
+            waits.append(time.perf_counter() - start)
+            shared[0] += 1
+            lock.release_write()
+            time.sleep(0.001)
+        with samples_lock:
+            write_waits.extend(waits)
+
+    threads = [threading.Thread(target=reader) for _ in range(readers)] + [
+        threading.Thread(target=writer) for _ in range(writers)
+    ]
+    for thread in threads:
+        thread.start()
+    time.sleep(seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+    return {
+        "writes": len(write_waits),
+        "reads_per_sec": reads[0] / seconds,
+        "p50_ms": _percentile(write_waits, 0.50) * 1000,
+        "p90_ms": _percentile(write_waits, 0.90) * 1000,
+        "p99_ms": _percentile(write_waits, 0.99) * 1000,
+        "max_ms": max(write_waits, default=float("nan")) * 1000,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--writers", type=int, default=1)
+    parser.add_argument("--seconds", type=float, default=2.0)
+    parser.add_argument("--scan-length", type=int, default=2000)
+    args = parser.parse_args()
+
+    locks: dict[str, Callable[[], RWLock | FairRWLock]] = {
+        "RWLock": RWLock,
+        "reader": lambda: FairRWLock(FairnessPolicy.READER_PREFERRING),
+        "writer": lambda: FairRWLock(FairnessPolicy.WRITER_PREFERRING),
+        "phase": lambda: FairRWLock(FairnessPolicy.PHASE_FAIR),
+    }
+    print(
+        f"{'lock':>8} {'writes':>8} {'reads/s':>10} {'p50 ms':>8} {'p90 ms':>8} {'p99 ms':>8} {'max ms':>8}"
+    )
+    for name, make_lock in locks.items():
+        result = run(
+            make_lock, args.readers, args.writers, args.seconds, args.scan_length
+        )
+        print(
+            f"{name:>8} {result['writes']:>8} {result['reads_per_sec']:>10.0f} "
+            f"{result['p50_ms']:>8.2f} {result['p90_ms']:>8.2f} "
+            f"{result['p99_ms']:>8.2f} {result['max_ms']:>8.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
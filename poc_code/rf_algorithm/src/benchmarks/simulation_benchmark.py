@@ -0,0 +1,209 @@
+"""Times every phase of the rf_simulation loop across swarm sizes and emits JSON.
+
+Run from the src directory:
+    python -m benchmarks.simulation_benchmark --drones 4 16 64 256 --output bench.json
+    python -m benchmarks.simulation_benchmark --drones 10000 --radius 2 --field 200
+
+Phases: populate_graph, update_graph_edges, one space_drones pass,
+drones_are_equidistant and a full run to convergence. A run that stops at
+--max-convergence-iterations is recorded as did_not_converge instead of
+run_to_convergence. Each scenario runs
+twice from the same seed: once for wall time and once under tracemalloc for
+the peak Python heap of every phase, so tracing does not distort timings.
+Complete graphs with more than --max-edges edges are skipped; pass --radius
+to benchmark large swarms on a sparse graph instead.
+"""
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from datetime import UTC, datetime
+
+from rf_sim.convergence import ConvergenceCriteria, Criterion, run_until_converged
+from rf_sim.field import Field
+from rf_sim.simulation import Simulation
+
+
+def _timed(
+    phases: dict[str, dict[str, float]],
+    name: str,
+    trace_memory: bool,
+    action: Callable[[], object],
+) -> object:
+    if trace_memory:
+        tracemalloc.reset_peak()
+        before = tracemalloc.get_traced_memory()[0]
+    start = time.perf_counter()
+    result = action()
+    seconds = time.perf_counter() - start
+    if trace_memory:
+        phases.setdefault(name, {})["peak_bytes"] = (
+            tracemalloc.get_traced_memory()[1] - before
+        )
+    else:
+        phases.setdefault(name, {})["seconds"] = seconds
+    return result
+
+
+def _setup(
+    drone_count: int,
+    field_size: float,
+    three_d: bool,
+    seed: int,
+    radius: float | None = None,
+    populate: bool = True,
+) -> tuple[Simulation, Field]:
+    return Simulation.build_swarm(
+        drone_count,
+        (field_size, field_size, field_size if three_d else None),
+        random.Random(seed),
+        radius,
+        populate=populate,
+    )
+
+
+def run_scenario(
+    phases: dict[str, dict[str, float]],
+    drone_count: int,
+    field_size: float,
+    three_d: bool,
+    radius: float | None,
+    seed: int,
+    max_convergence_iterations: int,
+    trace_memory: bool,
+) -> dict[str, object]:
+    """Runs every phase once and records its time or its peak memory in phases."""
+    # Populated separately so populate_graph is timed as its own phase
+    simulation, field = _setup(drone_count, field_size, three_d, seed, populate=False)
+    neighbors_only = radius is not None
+
+    _timed(
+        phases,
+        "populate_graph",
+        trace_memory,
+        lambda: simulation.populate_graph(radius),
+    )
+    _timed(phases, "update_graph_edges", trace_memory, simulation.update_graph_edges)
+    _timed(
+        phases,
+        "space_drones",
+        trace_memory,
+        lambda: field.space_drones(
+            simulation.graph,
+            lambda _node_id: simulation.refresh_dirty_edges(),
+            neighbors_only,
+        ),
+    )
+    _timed(
+        phases,
+        "drones_are_equidistant",
+        trace_memory,
+        lambda: field.drones_are_equidistant(
+            simulation.graph, simulation.controller.get_location()
+        ),
+    )
+
+    simulation, field = _setup(drone_count, field_size, three_d, seed, radius)
+    result = _timed(
+        phases,
+        "run_to_convergence",
+        trace_memory,
+        lambda: run_until_converged(
+            lambda iteration, monitor: field.space_drones(
+                simulation.graph,
+                lambda _node_id: simulation.refresh_dirty_edges(),
+                neighbors_only,
+                monitor=monitor,
+            ),
+            ConvergenceCriteria(
+                criterion=Criterion.MAX_DISPLACEMENT,
+                max_iterations=max_convergence_iterations,
+            ),
+        ),
+    )
+    if not result.converged:
+        # Hitting max_iterations only times that many passes, keep it apart
+        phases.setdefault("did_not_converge", {}).update(
+            phases.pop("run_to_convergence")
+        )
+    return {
+        "converged": result.converged,
+        "iterations": result.iterations,
+        "residual": result.residual,
+        "edges": simulation.graph.num_edges(),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--drones", type=int, nargs="+", default=[4, 16, 64, 256, 1024])
+    parser.add_argument("--field", type=float, nargs="+", default=[10.0])
+    parser.add_argument("--dims", choices=["2d", "3d"], nargs="+", default=["2d", "3d"])
+    parser.add_argument("--radius", type=float, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-edges", type=int, default=600_000)
+    parser.add_argument("--max-convergence-iterations", type=int, default=2000)
+    parser.add_argument("--no-memory", action="store_true")
+    parser.add_argument("--output", default="-", help="JSON file, - for stdout")
+    args = parser.parse_args()
+
+    results = []
+    for drone_count in args.drones:
+        for field_size in args.field:
+            for dims in args.dims:
+                entry: dict[str, object] = {
+                    "drones": drone_count,
+                    "field_size": field_size,
+                    "dims": dims,
+                    "radius": args.radius,
+                    "seed": args.seed,
+                }
+                if args.radius is None and drone_count * (drone_count - 1) // 2 > (
+                    args.max_edges
+                ):
+                    entry["skipped"] = "complete graph exceeds --max-edges"
+                    results.append(entry)
+                    continue
+
+                phases: dict[str, dict[str, float]] = {}
+                scenario = (
+                    drone_count,
+                    field_size,
+                    dims == "3d",
+                    args.radius,
+                    args.seed,
+                    args.max_convergence_iterations,
+                )
+                entry.update(run_scenario(phases, *scenario, trace_memory=False))
+                if not args.no_memory:
+                    tracemalloc.start()
+                    run_scenario(phases, *scenario, trace_memory=True)
+                    tracemalloc.stop()
+                entry["phases"] = phases
+                results.append(entry)
+                print(f"finished {drone_count} drones {dims}", file=sys.stderr)
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now(UTC).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "args": vars(args),
+        },
+        "results": results,
+    }
+    if args.output == "-":
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    else:
+        with open(args.output, "w") as output:
+            json.dump(report, output, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Process startup and import cost of the simulation's entry points.
+
+Run from the src directory:
+    python -m benchmarks.startup_time --repeat 11
+
+Every case runs in a fresh interpreter under python -X importtime. The table
+shows the median wall time of the whole process, the import time summed from
+the importtime report, how many modules were imported and whether rustworkx
+or numpy were among them. The bare interpreter row is the floor.
+
+Bytecode is cached in a temporary directory and each case runs once before it
+is timed, so compiling the sources is not counted, as on an installed drone.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Label -> interpreter arguments, run from SRC_DIR
+CASES: dict[str, list[str]] = {
+    "interpreter": ["-c", "pass"],
+    "import rf_sim.drone": ["-c", "import rf_sim.drone"],
+    "import rf_sim.rf_simulation": ["-c", "import rf_sim.rf_simulation"],
+    "import rf_sim.simulation": ["-c", "import rf_sim.simulation"],
+    "rf_sim --help": ["-m", "rf_sim", "--help"],
+    "rf_sim simulate -h": ["-m", "rf_sim", "simulate", "--help"],
+}
+HEAVY_MODULES = ("rustworkx", "numpy")
+
+
+def parse_importtime(report: str) -> dict[str, int]:
+    """Self import time in microseconds of every module in a -X importtime report."""
+    self_times = {}
+    for line in report.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _cumulative, name = line[len("import time:") :].split("|")
+        self_times[name.strip()] = int(self_us)
+    return self_times
+
+
+def run_case(arguments: list[str], env: dict[str, str]) -> tuple[float, dict[str, int]]:
+    """Wall seconds of one fresh interpreter, and its importtime report."""
+    start = time.perf_counter()
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", *arguments],
+        cwd=SRC_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return time.perf_counter() - start, parse_importtime(process.stderr)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--cases", nargs="+", choices=list(CASES), default=list(CASES))
+    args = parser.parse_args()
+
+    print(
+        f"{'case':<26} {'wall ms':>8} {'import ms':>10} {'modules':>8}"
+        f" {'rustworkx':>10} {'numpy':>6}"
+    )
+    with tempfile.TemporaryDirectory() as pycache:
+        env = {k: v for k, v in os.environ.items() if k != "PYTHONDONTWRITEBYTECODE"}
+        env["PYTHONPYCACHEPREFIX"] = pycache
+        for label in args.cases:
+            run_case(CASES[label], env)
+            report(label, [run_case(CASES[label], env) for _ in range(args.repeat)])
+
+
+def report(label: str, runs: list[tuple[float, dict[str, int]]]) -> None:
+    walls = []
+    import_times = []
+    for wall, self_times in runs:
+        walls.append(wall)
+        import_times.append(sum(self_times.values()) / 1000)
+    heavy = ["yes" if name in self_times else "no" for name in HEAVY_MODULES]
+    print(
+        f"{label:<26} {statistics.median(walls) * 1000:>8.1f}"
+        f" {statistics.median(import_times):>10.1f} {len(self_times):>8}"
+        f" {heavy[0]:>10} {heavy[1]:>6}"
+    )
+
+
+if __name__ == "__main__":
+    main()
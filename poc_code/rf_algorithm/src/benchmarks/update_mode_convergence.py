@@ -0,0 +1,137 @@
+"""Convergence speed of GAUSS_SEIDEL versus JACOBI passes of Field.space_drones.
+
+Run from the src directory:
+    python -m benchmarks.update_mode_convergence --drones 8 16 32 --seeds 0 1 2
+
+A run has settled once no drone moves more than --tolerance in a pass. Runs
+that have not settled after --max-iterations passes are reported as such.
+
+Drones pinned against the field's walls stop moving too, so a small step
+alone does not mean the swarm spread out. Each run also reports the closest
+pair of drones and how many drones sit on the field bounds. A run fails when
+two drones are stacked on one point, which they never leave since they push
+each other with zero force, or when every drone is pinned to the bounds.
+The script exits with status 1 if any run failed.
+"""
+
+import argparse
+import itertools
+import math
+import random
+import sys
+import time
+
+from rf_sim.drone import Drone
+from rf_sim.field import Field, UpdateMode
+from rf_sim.simulation import Simulation
+
+# Drones closer than this count as stacked on one point
+STACKED_DISTANCE = 1e-6
+
+
+def _positions(drones: list[Drone]) -> list[tuple[float, float, float]]:
+    return [(d.get_x(), d.get_y(), d.get_z()) for d in drones]
+
+
+def _on_bounds(position: tuple[float, float, float], field: Field) -> bool:
+    return any(
+        size and coordinate in (0, size)
+        for coordinate, size in zip(
+            position, (field.x_size, field.y_size, field.z_size), strict=True
+        )
+    )
+
+
+def _status(
+    settled: bool, min_pair_distance: float, on_bounds: int, drone_count: int
+) -> str:
+    if min_pair_distance < STACKED_DISTANCE:
+        return "stacked"
+    if on_bounds == drone_count:
+        return "pinned"
+    return "settled" if settled else "unsettled"
+
+
+def run(
+    update_mode: UpdateMode,
+    drone_count: int,
+    seed: int,
+    tolerance: float,
+    max_iterations: int,
+) -> dict[str, float | int | bool]:
+    """Spaces one seeded swarm until it settles and returns the pass count,
+    timing and how spread out the drones ended up.
+    """
+    simulation, field = Simulation.build_swarm(drone_count, rng=random.Random(seed))
+
+    start = time.perf_counter()
+    max_step = math.inf
+    iteration = 0
+    while iteration < max_iterations and max_step > tolerance:
+        before = _positions(field.drones)
+        field.space_drones(
+            simulation.graph,
+            simulation.update_egress_edges,
+            update_mode=update_mode,
+            iteration=iteration,
+            refresh_edges_function=simulation.refresh_all_edges,
+        )
+        max_step = max(
+            math.dist(old, new)
+            for old, new in zip(before, _positions(field.drones), strict=True)
+        )
+        iteration += 1
+
+    seconds = time.perf_counter() - start
+    positions = _positions(field.drones)
+    min_pair_distance = min(
+        (math.dist(a, b) for a, b in itertools.combinations(positions, 2)),
+        default=math.inf,
+    )
+    on_bounds = sum(_on_bounds(position, field) for position in positions)
+    return {
+        "iterations": iteration,
+        "status": _status(
+            max_step <= tolerance, min_pair_distance, on_bounds, drone_count
+        ),
+        "seconds": seconds,
+        "final_max_step": max_step,
+        "min_pair_distance": min_pair_distance,
+        "on_bounds": on_bounds,
+        "spread": field.equidistance_residual(simulation.controller.get_location()),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--drones", type=int, nargs="+", default=[8, 16, 32])
+    parser.add_argument("--seeds", type=int, nargs="+", default=[0, 1, 2])
+    parser.add_argument("--tolerance", type=float, default=1e-3)
+    parser.add_argument("--max-iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    print(
+        f"{'drones':>7} {'seed':>5} {'mode':>13} {'passes':>7} {'status':>10}"
+        f" {'min pair':>9} {'on walls':>9} {'spread':>7} {'seconds':>9}"
+    )
+    failed = 0
+    for drone_count in args.drones:
+        for seed in args.seeds:
+            for update_mode in UpdateMode:
+                result = run(
+                    update_mode, drone_count, seed, args.tolerance, args.max_iterations
+                )
+                failed += result["status"] in ("stacked", "pinned")
+                print(
+                    f"{drone_count:>7} {seed:>5} {update_mode.value:>13} "
+                    f"{result['iterations']:>7} {result['status']:>10} "
+                    f"{result['min_pair_distance']:>9.3f} {result['on_bounds']:>9} "
+                    f"{result['spread']:>7.3f} {result['seconds']:>9.3f}"
+                )
+    if failed:
+        print(f"{failed} runs ended with drones stacked or pinned to the bounds")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""Vector objects allocated and time spent per space_drones pass.
+
+Run from the src directory:
+    python -m benchmarks.vector_allocations --drones 25 50 100
+
+Vector construction is counted by wrapping Vector.__init__ for the duration
+of one pass, which also counts copies made through __copy__ or as_negated.
+Memory is the tracemalloc peak of the pass, so short lived temporaries that
+are freed straight away still show up in it.
+
+Each size runs twice from the same seed. "before" swaps in the per-edge loop
+space_drones used before the in-place force helpers: copy each edge vector,
+negate it when the other drone wrote it, build a force Vector with
+calculate_force and sum it, and refresh edges by building a new Vector. It
+still runs on today's slotted Vector, so only the allocation pattern differs.
+"""
+
+import argparse
+import random
+import sys
+import time
+import tracemalloc
+from collections.abc import Iterator
+from contextlib import contextmanager, nullcontext
+
+from rf_sim.field import Field, UpdateMode
+from rf_sim.simulation import Simulation
+from rf_sim.utils.distance_obj import Distance
+from rf_sim.utils.graph_wrapper import DroneGraph
+from rf_sim.utils.vector import Vector
+
+
+def _baseline_net_force(
+    self: Field, drone_graph: DroneGraph, out_id: int, neighbors_only: bool
+) -> Vector:
+    force_vector = Vector(0.0, 0.0, 0.0)
+    in_ids = (
+        drone_graph.neighbors(out_id) if neighbors_only else drone_graph.node_indices()
+    )
+    for in_id in in_ids:
+        if out_id == in_id:
+            continue
+        edge_data: Distance = drone_graph.get_edge_data(out_id, in_id)
+        distance_vector, last_to_write = edge_data.get_vector_and_last_to_write()
+        if last_to_write != out_id:
+            distance_vector = distance_vector.as_negated()
+        force_vector.mutating_vector_sum(
+            distance_vector.calculate_force(self.min_distance, self.repulsion_strength)
+        )
+    return force_vector
+
+
+def _baseline_update_graph_edge(
+    self: Simulation, node1_id: int, node2_id: int, edge_data: Distance
+) -> None:
+    drone1 = self.graph.get_node_data(node1_id)
+    drone2 = self.graph.get_node_data(node2_id)
+    updated_vector = Vector(
+        drone1.get_x() - drone2.get_x(),
+        drone1.get_y() - drone2.get_y(),
+        drone1.get_z() - drone2.get_z(),
+    )
+    edge_data.update_vector_with_vector(updated_vector, node1_id)
+
+
+@contextmanager
+def _baseline() -> Iterator[None]:
+    """Runs space_drones with the allocating per-edge loop for the duration."""
+    net_force = Field._net_force
+    update_graph_edge = Simulation.update_graph_edge
+    Field._net_force = _baseline_net_force
+    Simulation.update_graph_edge = _baseline_update_graph_edge
+    try:
+        yield
+    finally:
+        Field._net_force = net_force
+        Simulation.update_graph_edge = update_graph_edge
+
+
+def _space_pass(simulation: Simulation, field: Field, mode: UpdateMode) -> None:
+    field.space_drones(
+        simulation.graph,
+        lambda _node_id: simulation.refresh_dirty_edges(),
+        update_mode=mode,
+        refresh_edges_function=simulation.refresh_dirty_edges,
+    )
+
+
+def count_vectors(simulation: Simulation, field: Field, mode: UpdateMode) -> int:
+    """Vectors constructed during one pass."""
+    created = 0
+    original_init = Vector.__init__
+
+    def counting_init(self: Vector, x: float, y: float, z: float) -> None:
+        nonlocal created
+        created += 1
+        original_init(self, x, y, z)
+
+    Vector.__init__ = counting_init
+    try:
+        _space_pass(simulation, field, mode)
+    finally:
+        Vector.__init__ = original_init
+    return created
+
+
+def peak_bytes(simulation: Simulation, field: Field, mode: UpdateMode) -> int:
+    """tracemalloc peak above the starting point during one pass."""
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    start = tracemalloc.get_traced_memory()[0]
+    _space_pass(simulation, field, mode)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--drones", type=int, nargs="+", default=[25, 50, 100])
+    parser.add_argument(
+        "--mode",
+        choices=[m.value for m in UpdateMode],
+        default=UpdateMode.GAUSS_SEIDEL.value,
+    )
+    parser.add_argument("--passes", type=int, default=5, help="Timed passes")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    mode = UpdateMode(args.mode)
+
+    vector = Vector(1.0, 2.0, 3.0)
+    vector_bytes = sys.getsizeof(vector) + sys.getsizeof(
+        getattr(vector, "__dict__", None) or ()
+    )
+    print(f"bytes per Vector: {vector_bytes}")
+    print(
+        f"{'drones':>8} {'path':>7} {'vectors':>10} {'per edge':>9} {'peak KiB':>9}"
+        f" {'ms/pass':>9}"
+    )
+    for drone_count in args.drones:
+        for path in ("before", "after"):
+            simulation, field = Simulation.build_swarm(
+                drone_count, rng=random.Random(args.seed)
+            )
+            with _baseline() if path == "before" else nullcontext():
+                vectors = count_vectors(simulation, field, mode)
+                peak = peak_bytes(simulation, field, mode)
+                start = time.perf_counter()
+                for _ in range(args.passes):
+                    _space_pass(simulation, field, mode)
+                seconds = (time.perf_counter() - start) / args.passes
+            edges = simulation.graph.num_edges()
+            print(
+                f"{drone_count:>8} {path:>7} {vectors:>10} {vectors / edges:>9.2f}"
+                f" {peak / 1024:>9.1f} {seconds * 1e3:>9.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
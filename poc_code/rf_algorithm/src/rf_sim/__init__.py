@@ -0,0 +1,6 @@
+"""The drone spacing simulation, run as rf-sim once the project is installed,
+or as python -m rf_sim from the src directory.
+
+Nothing is imported here, each command imports its module only once it is
+chosen.
+"""
@@ -0,0 +1,57 @@
+"""Runs one command of the spacing simulation, simulate when none is given.
+
+Installed with uv sync or pip install, the rf-sim script runs from anywhere:
+    rf-sim --force-cache
+    rf-sim sweep --drones 4 8 16 --out sweep.jsonl
+    rf-sim trajectory stats run.traj
+
+From the src directory of a checkout, python -m rf_sim takes the same arguments.
+"""
+
+import importlib
+import os
+import sys
+
+# Command -> (module, function, summary). A module is only imported once its
+# command is chosen, so --help and argument errors never load rustworkx or numpy
+COMMANDS: dict[str, tuple[str, str, str]] = {
+    "simulate": ("rf_simulation", "cli", "Space a swarm until equidistant"),
+    "engine": ("engine", "main", "Run the time-stepped engine headless"),
+    "sweep": ("sweep", "main", "Run a parameter sweep across processes"),
+    "trajectory": ("trajectory", "main", "Summarize or replay a recording"),
+}
+DEFAULT_COMMAND = "simulate"
+
+
+def _program() -> str:
+    """How this was invoked, as shown in usage lines."""
+    if os.path.basename(sys.argv[0]) == "__main__.py":
+        return "python -m rf_sim"
+    return os.path.basename(sys.argv[0])
+
+
+def usage() -> str:
+    lines = [
+        f"usage: {_program()} [command] [args ...]",
+        "",
+        f"commands (default {DEFAULT_COMMAND}, see <command> --help):",
+    ]
+    lines += [f"  {name:<12}{summary}" for name, (_, _, summary) in COMMANDS.items()]
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> None:
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] in ("-h", "--help"):
+        print(usage())
+        return
+    command = argv[0] if argv and argv[0] in COMMANDS else DEFAULT_COMMAND
+    args = argv[1:] if argv and argv[0] == command else argv
+    module_name, function_name, _ = COMMANDS[command]
+    # The command parses sys.argv itself, and names itself in its usage line
+    sys.argv = [f"{_program()} {command}", *args]
+    getattr(importlib.import_module(f".{module_name}", __package__), function_name)()
+
+
+if __name__ == "__main__":
+    main()
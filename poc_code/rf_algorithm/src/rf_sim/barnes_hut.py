@@ -0,0 +1,273 @@
+import math
+import time
+from dataclasses import dataclass
+
+from .constants.proj_constants import MIN_DISTANCE, REPULSION_STRENGTH
+from .utils.vector import Vector
+
+Point = tuple[float, float, float]
+
+# Coincident drones can never be separated by subdividing, so stop here and
+# keep every remaining body in the same leaf.
+MAX_DEPTH = 32
+
+
+class OctreeNode:
+    """Cubic cell of a Barnes-Hut octree.
+
+    Leaves hold the indices of their bodies. Every node tracks how many bodies
+    it contains and their center of mass, which stands in for the whole cell
+    when it is far enough away from the drone being pushed.
+    """
+
+    __slots__ = ("center", "half_size", "count", "mass_center", "children", "bodies")
+
+    def __init__(self, center: Point, half_size: float) -> None:
+        self.center = center
+        self.half_size = half_size
+        self.count = 0
+        self.mass_center: Point = (0.0, 0.0, 0.0)
+        self.children: list[OctreeNode | None] | None = None
+        self.bodies: list[int] = []
+
+    def _octant(self, point: Point) -> int:
+        cx, cy, cz = self.center
+        return (
+            (1 if point[0] >= cx else 0)
+            | (2 if point[1] >= cy else 0)
+            | (4 if point[2] >= cz else 0)
+        )
+
+    def _child(self, octant: int) -> "OctreeNode":
+        child = self.children[octant]
+        if child is None:
+            quarter = self.half_size / 2
+            cx, cy, cz = self.center
+            child = OctreeNode(
+                (
+                    cx + (quarter if octant & 1 else -quarter),
+                    cy + (quarter if octant & 2 else -quarter),
+                    cz + (quarter if octant & 4 else -quarter),
+                ),
+                quarter,
+            )
+            self.children[octant] = child
+        return child
+
+    def insert(self, index: int, positions: list[Point], depth: int = 0) -> None:
+        """Adds a body to this cell, splitting the cell if it already holds one.
+
+        Args:
+            index (int): Index of the body in positions.
+            positions (list[Point]): Positions of every body in the tree.
+            depth (int, optional): Depth of this cell. Defaults to 0.
+        """
+        point = positions[index]
+        count = self.count
+        mx, my, mz = self.mass_center
+        self.mass_center = (
+            (mx * count + point[0]) / (count + 1),
+            (my * count + point[1]) / (count + 1),
+            (mz * count + point[2]) / (count + 1),
+        )
+        self.count = count + 1
+
+        if self.children is None:
+            if not self.bodies or depth >= MAX_DEPTH:
+                self.bodies.append(index)
+                return
+            self.children = [None] * 8
+            for body in self.bodies:
+                self._child(self._octant(positions[body])).insert(
+                    body, positions, depth + 1
+                )
+            self.bodies = []
+
+        self._child(self._octant(point)).insert(index, positions, depth + 1)
+
+
+class Octree:
+    """Barnes-Hut octree over a set of drone positions.
+
+    Approximates the repulsion of Vector.calculate_force in O(N log N): a cell
+    whose width divided by its distance to the drone is below theta is treated
+    as a single body of `count` drones sitting at its center of mass.
+    """
+
+    def __init__(
+        self,
+        positions: list[Point],
+        bounds: Point,
+        theta: float = 0.5,
+        repulsion_strength: float = REPULSION_STRENGTH,
+        min_distance: float = MIN_DISTANCE,
+    ) -> None:
+        self.positions = positions
+        self.theta = theta
+        self.repulsion_strength = repulsion_strength
+        self.min_distance = min_distance
+
+        # The root must be a cube that holds both the field and any drone outside of it
+        low = [0.0, 0.0, 0.0]
+        high = list(bounds)
+        for point in positions:
+            for axis in range(3):
+                low[axis] = min(low[axis], point[axis])
+                high[axis] = max(high[axis], point[axis])
+        half_size = max(h - lo for lo, h in zip(low, high, strict=True)) / 2 or 1.0
+        center = tuple((lo + h) / 2 for lo, h in zip(low, high, strict=True))
+
+        self.root = OctreeNode(center, half_size)
+        for index in range(len(positions)):
+            self.root.insert(index, positions)
+
+    def _pair_force(
+        self, point: Point, other: Point, weight: int, force: list[float]
+    ) -> None:
+        dx = point[0] - other[0]
+        dy = point[1] - other[1]
+        dz = point[2] - other[2]
+        distance = max(self.min_distance, math.sqrt(dx * dx + dy * dy + dz * dz))
+        scale = weight * self.repulsion_strength / (distance * distance * distance)
+        force[0] += dx * scale
+        force[1] += dy * scale
+        force[2] += dz * scale
+
+    def force_on(self, index: int) -> Vector:
+        """Approximates the net repulsive force every other body exerts on a body.
+
+        Args:
+            index (int): Index of the body in positions.
+
+        Returns:
+            Vector: Approximate net force on the body.
+        """
+        point = self.positions[index]
+        force = [0.0, 0.0, 0.0]
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            if node.children is None:
+                for body in node.bodies:
+                    if body != index:
+                        self._pair_force(point, self.positions[body], 1, force)
+                continue
+
+            mx, my, mz = node.mass_center
+            distance = math.sqrt(
+                (point[0] - mx) ** 2 + (point[1] - my) ** 2 + (point[2] - mz) ** 2
+            )
+            if distance > 0 and (2 * node.half_size) / distance < self.theta:
+                self._pair_force(point, node.mass_center, node.count, force)
+            else:
+                stack.extend(child for child in node.children if child is not None)
+
+        return Vector(*force)
+
+
+def exact_forces(
+    positions: list[Point],
+    repulsion_strength: float = REPULSION_STRENGTH,
+    min_distance: float = MIN_DISTANCE,
+) -> list[Vector]:
+    """Computes the exact net force on every body with Vector.calculate_force.
+
+    Args:
+        positions (list[Point]): Positions of every body.
+        repulsion_strength (float, optional): Strength of repulsive force.
+        min_distance (float, optional): Minimum distance used in the force law.
+
+    Returns:
+        list[Vector]: Net force on each body, in the same order as positions.
+    """
+    forces = []
+    for index, point in enumerate(positions):
+        force = Vector(0.0, 0.0, 0.0)
+        for other_index, other in enumerate(positions):
+            if other_index == index:
+                continue
+            distance_vector = Vector(
+                point[0] - other[0], point[1] - other[1], point[2] - other[2]
+            )
+            distance_vector.force_into(force, min_distance, repulsion_strength)
+        forces.append(force)
+    return forces
+
+
+@dataclass
+class ForceErrorReport:
+    """Accuracy and cost of a Barnes-Hut pass compared with the exact pass."""
+
+    theta: float
+    drone_count: int
+    max_relative_error: float
+    mean_relative_error: float
+    rms_relative_error: float
+    exact_seconds: float
+    approximate_seconds: float
+
+
+def measure_force_error(
+    positions: list[Point],
+    bounds: Point,
+    theta: float,
+    repulsion_strength: float = REPULSION_STRENGTH,
+    min_distance: float = MIN_DISTANCE,
+) -> ForceErrorReport:
+    """Compares Barnes-Hut forces against the exact pass for one set of positions.
+
+    Relative error is |approx - exact| / |exact| per drone. Drones with no net
+    force are skipped.
+
+    Args:
+        positions (list[Point]): Positions of every drone.
+        bounds (Point): Field dimensions the tree is built over.
+        theta (float): Opening angle to evaluate.
+        repulsion_strength (float, optional): Strength of repulsive force.
+        min_distance (float, optional): Minimum distance used in the force law.
+
+    Returns:
+        ForceErrorReport: Error statistics and timings of both passes.
+    """
+    start = time.perf_counter()
+    exact = exact_forces(positions, repulsion_strength, min_distance)
+    exact_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    tree = Octree(positions, bounds, theta, repulsion_strength, min_distance)
+    approximate = [tree.force_on(index) for index in range(len(positions))]
+    approximate_seconds = time.perf_counter() - start
+
+    errors = []
+    for exact_force, approximate_force in zip(exact, approximate, strict=True):
+        magnitude = exact_force.get_magnitude()
+        if magnitude == 0.0:
+            continue
+        errors.append(
+            exact_force.distance_between_vector(approximate_force) / magnitude
+        )
+
+    return ForceErrorReport(
+        theta=theta,
+        drone_count=len(positions),
+        max_relative_error=max(errors, default=0.0),
+        mean_relative_error=sum(errors) / len(errors) if errors else 0.0,
+        rms_relative_error=(
+            math.sqrt(sum(e * e for e in errors) / len(errors)) if errors else 0.0
+        ),
+        exact_seconds=exact_seconds,
+        approximate_seconds=approximate_seconds,
+    )
+
+
+if __name__ == "__main__":
+    import random
+
+    random.seed(0)
+    field_bounds = (100.0, 100.0, 100.0)
+    sample = [
+        (random.uniform(0, 100), random.uniform(0, 100), random.uniform(0, 100))
+        for _ in range(1000)
+    ]
+    for sample_theta in (0.2, 0.35, 0.5, 0.7, 1.0):
+        print(measure_force_error(sample, field_bounds, sample_theta))
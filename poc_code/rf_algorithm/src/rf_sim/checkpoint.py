@@ -0,0 +1,264 @@
+"""Checkpoint and restore of simulation state as NumPy binaries.
+
+A checkpoint is a directory named ckpt-<tick>, holding:
+
+    positions.npy   (N, 3) float64 drone positions
+    velocities.npy  (N, 3) float64 drone velocities
+    ids.npy         (N,) drone ids, int64 or unicode
+    meta.npz        tick, controller location, field size and force
+                    parameters, RNG state
+
+The per-drone arrays are plain .npy files, so load_checkpoint memory-maps
+them instead of reading large swarms into memory. A checkpoint is written
+to a temporary directory and renamed into place, so a crash mid-write never
+leaves a partial checkpoint behind.
+"""
+
+import os
+import queue
+import random
+import shutil
+import threading
+from dataclasses import dataclass
+
+import numpy as np
+
+from .constants.proj_constants import INITIAL_DAMPING, MIN_DISTANCE, REPULSION_STRENGTH
+from .drone import Drone
+from .field import Field
+
+PREFIX = "ckpt-"
+FORMAT_VERSION = 2
+# Version 1 checkpoints have no force parameters, they load with the defaults
+READABLE_VERSIONS = (1, 2)
+
+RandomState = tuple[int, tuple[int, ...], float | None]
+
+
+@dataclass
+class Checkpoint:
+    """Everything needed to resume a simulation. z_size is None for 2D fields."""
+
+    tick: int
+    ids: np.ndarray
+    positions: np.ndarray
+    velocities: np.ndarray
+    controller_location: tuple[float, float, float]
+    field_size: tuple[float, float, float | None]
+    rng_state: RandomState
+    repulsion_strength: float = REPULSION_STRENGTH
+    min_distance: float = MIN_DISTANCE
+    initial_damping: float = INITIAL_DAMPING
+
+    def make_drones(self) -> list[Drone]:
+        """Builds new Drones at the saved positions and velocities."""
+        drones = []
+        for drone_id, (x, y, z), velocity in zip(
+            self.ids.tolist(),
+            self.positions.tolist(),
+            self.velocities.tolist(),
+            strict=True,
+        ):
+            drone = Drone(drone_id, x, y, z)
+            drone.set_velocity(*velocity)
+            drones.append(drone)
+        return drones
+
+
+def capture(
+    tick: int,
+    drones: list[Drone],
+    controller_location: tuple[float, float, float],
+    field: Field,
+    rng: random.Random | None = None,
+) -> Checkpoint:
+    """Copies the current state into a Checkpoint. O(N) in memory, no disk I/O.
+
+    Args:
+        tick (int): Tick or pass counter to resume from.
+        drones (list[Drone]): Drones to save, in order.
+        controller_location (tuple[float, float, float]): Controller position.
+        field (Field): Field whose dimensions and force parameters are saved.
+        rng (random.Random | None, optional): Generator to save. Defaults to the
+            random module's global generator.
+    """
+    ids = [drone.get_id() for drone in drones]
+    return Checkpoint(
+        tick=tick,
+        ids=np.array(ids) if ids else np.empty(0, dtype=np.int64),
+        positions=np.array(
+            [(d.get_x(), d.get_y(), d.get_z()) for d in drones], dtype=np.float64
+        ).reshape(len(drones), 3),
+        velocities=np.array(
+            [d.get_velocity() for d in drones], dtype=np.float64
+        ).reshape(len(drones), 3),
+        controller_location=controller_location,
+        field_size=(field.x_size, field.y_size, field.z_size),
+        rng_state=(rng or random).getstate(),
+        repulsion_strength=field.repulsion_strength,
+        min_distance=field.min_distance,
+        initial_damping=field.initial_damping,
+    )
+
+
+def _encode_rng_state(state: RandomState) -> dict[str, np.ndarray]:
+    version, internal, gauss_next = state
+    return {
+        "rng_version": np.array(version),
+        "rng_internal": np.array(internal, dtype=np.uint32),
+        "rng_gauss_next": np.array(np.nan if gauss_next is None else gauss_next),
+    }
+
+
+def _decode_rng_state(meta: np.lib.npyio.NpzFile) -> RandomState:
+    gauss_next = float(meta["rng_gauss_next"])
+    return (
+        int(meta["rng_version"]),
+        tuple(int(word) for word in meta["rng_internal"]),
+        None if np.isnan(gauss_next) else gauss_next,
+    )
+
+
+def save_checkpoint(directory: str, checkpoint: Checkpoint) -> str:
+    """Writes a checkpoint under directory.
+
+    Returns:
+        str: Path of the new ckpt-<tick> directory.
+    """
+    os.makedirs(directory, exist_ok=True)
+    name = f"{PREFIX}{checkpoint.tick:012d}"
+    final_path = os.path.join(directory, name)
+    temp_path = os.path.join(directory, f".{name}.tmp")
+    shutil.rmtree(temp_path, ignore_errors=True)
+    os.makedirs(temp_path)
+
+    np.save(os.path.join(temp_path, "positions.npy"), checkpoint.positions)
+    np.save(os.path.join(temp_path, "velocities.npy"), checkpoint.velocities)
+    np.save(os.path.join(temp_path, "ids.npy"), checkpoint.ids)
+    x_size, y_size, z_size = checkpoint.field_size
+    np.savez(
+        os.path.join(temp_path, "meta.npz"),
+        format_version=np.array(FORMAT_VERSION),
+        tick=np.array(checkpoint.tick),
+        controller_location=np.array(checkpoint.controller_location, dtype=np.float64),
+        field_size=np.array(
+            [x_size, y_size, np.nan if z_size is None else z_size], dtype=np.float64
+        ),
+        repulsion_strength=np.array(checkpoint.repulsion_strength),
+        min_distance=np.array(checkpoint.min_distance),
+        initial_damping=np.array(checkpoint.initial_damping),
+        **_encode_rng_state(checkpoint.rng_state),
+    )
+
+    shutil.rmtree(final_path, ignore_errors=True)
+    os.rename(temp_path, final_path)
+    return final_path
+
+
+def load_checkpoint(path: str, mmap: bool = True) -> Checkpoint:
+    """Reads a checkpoint directory written by save_checkpoint.
+
+    Args:
+        path (str): ckpt-<tick> directory.
+        mmap (bool, optional): Memory-map the per-drone arrays instead of reading
+            them. Defaults to True.
+    """
+    mmap_mode = "r" if mmap else None
+    with np.load(os.path.join(path, "meta.npz")) as meta:
+        if int(meta["format_version"]) not in READABLE_VERSIONS:
+            raise ValueError(f"{path} has unsupported format {meta['format_version']}")
+        x_size, y_size, z_size = meta["field_size"].tolist()
+        controller_location = tuple(meta["controller_location"].tolist())
+        tick = int(meta["tick"])
+        rng_state = _decode_rng_state(meta)
+        force_parameters = {
+            name: float(meta[name])
+            for name in ("repulsion_strength", "min_distance", "initial_damping")
+            if name in meta
+        }
+    return Checkpoint(
+        tick=tick,
+        ids=np.load(os.path.join(path, "ids.npy"), mmap_mode=mmap_mode),
+        positions=np.load(os.path.join(path, "positions.npy"), mmap_mode=mmap_mode),
+        velocities=np.load(os.path.join(path, "velocities.npy"), mmap_mode=mmap_mode),
+        controller_location=controller_location,
+        field_size=(x_size, y_size, None if np.isnan(z_size) else z_size),
+        rng_state=rng_state,
+        **force_parameters,
+    )
+
+
+def list_checkpoints(directory: str) -> list[str]:
+    """Returns every complete checkpoint under directory, oldest first."""
+    if not os.path.isdir(directory):
+        return []
+    return [
+        os.path.join(directory, name)
+        for name in sorted(os.listdir(directory))
+        if name.startswith(PREFIX)
+    ]
+
+
+def latest_checkpoint(directory: str) -> str | None:
+    checkpoints = list_checkpoints(directory)
+    return checkpoints[-1] if checkpoints else None
+
+
+class AsyncCheckpointWriter:
+    """Writes checkpoints on a background thread so the simulation never waits on disk.
+
+    At most one checkpoint waits to be written. Submitting while another is
+    still pending replaces it, so a slow disk drops intermediate checkpoints
+    rather than stalling the loop or growing memory.
+
+    Args:
+        directory (str): Where checkpoints are written.
+        keep (int, optional): Newest checkpoints to keep, older ones are deleted.
+            At least 1. Defaults to 3.
+    """
+
+    def __init__(self, directory: str, keep: int = 3) -> None:
+        if keep < 1:
+            raise ValueError("keep must be at least 1")
+        self.directory = directory
+        self.keep = keep
+        self.written = 0
+        self.dropped = 0
+        self.error: Exception | None = None
+        self._pending: queue.Queue[Checkpoint | None] = queue.Queue(maxsize=1)
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def submit(self, checkpoint: Checkpoint) -> None:
+        """Queues a checkpoint without blocking."""
+        while True:
+            try:
+                self._pending.put_nowait(checkpoint)
+                return
+            except queue.Full:
+                try:
+                    self._pending.get_nowait()
+                    self.dropped += 1
+                except queue.Empty:
+                    pass
+
+    def close(self) -> None:
+        """Writes the pending checkpoint, if any, and stops the thread."""
+        self._pending.put(None)
+        self._thread.join()
+
+    def _run(self) -> None:
+        while (checkpoint := self._pending.get()) is not None:
+            try:
+                save_checkpoint(self.directory, checkpoint)
+                self.written += 1
+                for old in list_checkpoints(self.directory)[: -self.keep]:
+                    shutil.rmtree(old, ignore_errors=True)
+            except OSError as e:
+                self.error = e
+
+    def __enter__(self) -> "AsyncCheckpointWriter":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
@@ -0,0 +1,20 @@
+# Repulsive force algorithm tuning
+REPULSION_STRENGTH: float = 2.0  # how strong the repulsion is
+INITIAL_DAMPING: float = 0.15  # how much of the force to apply
+MIN_DISTANCE: float = 1.0  # minimum distance between drones
+DAMPING_DECAY: float = (
+    0.05  # JACOBI damping is INITIAL_DAMPING / (1 + DAMPING_DECAY * pass)
+)
+MAX_STEP_FRACTION: float = (
+    0.05  # longest JACOBI move, as a fraction of the shortest field side
+)
+
+# Multicast group shared with multicast_scripts
+MCAST_GRP: str = "239.255.255.250"
+MCAST_PORT: int = 12345
+
+# Time-stepped engine
+TICK_RATE: float = 60.0  # engine ticks per simulated second
+MAX_SPEED: float = 2.0  # field units per second
+MAX_ACCELERATION: float = 4.0  # field units per second squared
+DRAG: float = 1.5  # exponential velocity decay rate, per second
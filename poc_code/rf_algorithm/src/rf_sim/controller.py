@@ -1,6 +1,6 @@
 from copy import copy
 
-from utils.vector import Vector
+from .utils.vector import Vector
 
 
 class Controller:
@@ -0,0 +1,181 @@
+import math
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from enum import Enum
+
+from .utils.telemetry import get_telemetry
+
+
+class Criterion(Enum):
+    """Quantity whose residual decides when spacing has converged."""
+
+    # Spread (max - min) of every drone's distance to the controller
+    EQUIDISTANCE = "equidistance"
+    # Largest distance any drone moved during the last pass
+    MAX_DISPLACEMENT = "max_displacement"
+    # Sum of squared distances moved during the last pass
+    ENERGY = "energy"
+
+
+class StopReason(Enum):
+    """Why run_until_converged returned."""
+
+    CONVERGED = "converged"
+    MAX_ITERATIONS = "max_iterations"
+    TIME_BUDGET = "time_budget"
+
+
+@dataclass
+class ConvergenceCriteria:
+    """When to stop spacing drones.
+
+    With relative=True the residual is compared against tolerance times the
+    first residual observed, instead of against tolerance directly.
+    """
+
+    criterion: Criterion = Criterion.MAX_DISPLACEMENT
+    tolerance: float = 1e-3
+    relative: bool = False
+    max_iterations: int | None = 1000
+    time_budget: float | None = None
+
+    def is_met(self, residual: float, reference: float) -> bool:
+        """Checks a residual against the tolerance.
+
+        Args:
+            residual (float): Latest residual.
+            reference (float): First residual of the run, used when relative is True.
+
+        Returns:
+            bool: True if the residual is within tolerance.
+        """
+        if self.relative:
+            return residual <= self.tolerance * reference
+        return residual <= self.tolerance
+
+
+@dataclass
+class ConvergenceResult:
+    """Outcome of run_until_converged. wall_time is in seconds."""
+
+    converged: bool
+    reason: StopReason
+    iterations: int
+    residual: float
+    wall_time: float
+
+
+class ConvergenceMonitor:
+    """Accumulates how far drones move during a pass.
+
+    Field.space_drones reports every move through record_move, so the
+    displacement and energy residuals are known as soon as a pass ends,
+    without another walk over the drones or edges.
+    """
+
+    def __init__(self) -> None:
+        self.max_displacement = 0.0
+        self.energy = 0.0
+        self.moves = 0
+
+    def begin_pass(self) -> None:
+        """Clears the counters before a new pass."""
+        self.max_displacement = 0.0
+        self.energy = 0.0
+        self.moves = 0
+
+    def record_move(self, dx: float, dy: float, dz: float) -> None:
+        """Records how far a single drone moved.
+
+        Args:
+            dx (float): Change in x coordinate.
+            dy (float): Change in y coordinate.
+            dz (float): Change in z coordinate.
+        """
+        squared = dx * dx + dy * dy + dz * dz
+        self.energy += squared
+        self.moves += 1
+        if squared > self.max_displacement * self.max_displacement:
+            self.max_displacement = math.sqrt(squared)
+
+    def residual(self, criterion: Criterion) -> float:
+        """Returns the residual of the last pass for a displacement based criterion.
+
+        Args:
+            criterion (Criterion): MAX_DISPLACEMENT or ENERGY.
+
+        Returns:
+            float: Residual of the last pass.
+        """
+        if criterion is Criterion.ENERGY:
+            return self.energy
+        if criterion is Criterion.MAX_DISPLACEMENT:
+            return self.max_displacement
+        raise ValueError(f"{criterion} is not tracked by ConvergenceMonitor")
+
+
+def run_until_converged(
+    space_pass: Callable[[int, ConvergenceMonitor], None],
+    criteria: ConvergenceCriteria,
+    equidistance_residual: Callable[[], float] | None = None,
+) -> ConvergenceResult:
+    """Runs spacing passes until the criteria are met or a budget runs out.
+
+    Args:
+        space_pass (Callable[[int, ConvergenceMonitor], None]): Runs one pass given
+            its iteration index and the monitor to report moves to.
+        criteria (ConvergenceCriteria): Stopping rules.
+        equidistance_residual (Callable[[], float] | None, optional): Returns the
+            current equidistance spread. Required for Criterion.EQUIDISTANCE.
+
+    Returns:
+        ConvergenceResult: Iterations run, last residual, wall time and stop reason.
+    """
+    if criteria.criterion is Criterion.EQUIDISTANCE and equidistance_residual is None:
+        raise ValueError("Criterion.EQUIDISTANCE needs an equidistance_residual")
+
+    check_timer = get_telemetry().phase("convergence_check")
+
+    def current_residual() -> float:
+        with check_timer:
+            if criteria.criterion is Criterion.EQUIDISTANCE:
+                return equidistance_residual()
+            return monitor.residual(criteria.criterion)
+
+    monitor = ConvergenceMonitor()
+    start = time.perf_counter()
+    iteration = 0
+    residual = math.inf
+    reference: float | None = None
+    if criteria.criterion is Criterion.EQUIDISTANCE:
+        residual = reference = current_residual()
+
+    while True:
+        if reference is not None and criteria.is_met(residual, reference):
+            reason = StopReason.CONVERGED
+            break
+        if criteria.max_iterations is not None and iteration >= criteria.max_iterations:
+            reason = StopReason.MAX_ITERATIONS
+            break
+        if (
+            criteria.time_budget is not None
+            and time.perf_counter() - start >= criteria.time_budget
+        ):
+            reason = StopReason.TIME_BUDGET
+            break
+
+        monitor.begin_pass()
+        space_pass(iteration, monitor)
+        iteration += 1
+        residual = current_residual()
+        if reference is None:
+            reference = residual
+
+    return ConvergenceResult(
+        converged=reason is StopReason.CONVERGED,
+        reason=reason,
+        iterations=iteration,
+        residual=residual,
+        wall_time=time.perf_counter() - start,
+    )
@@ -0,0 +1,395 @@
+"""Finds drones and the controller by pinging the multicast group.
+
+Messages share the magic and version of multicast_scripts/multicast_protocol.py
+and use message types that protocol does not:
+
+    header    !2sBB       magic, version, message type
+    PING      !I          nonce
+    ANNOUNCE  !IBIddd     nonce (0 if unsolicited), role, peer id, x, y, z
+    LEAVE     !BI         role, peer id
+
+A discovery round sends a PING and collects every ANNOUNCE carrying its nonce
+until the deadline. Announces without that nonce and LEAVE messages are
+membership changes and are queued for Discovery.poll.
+"""
+
+import queue
+import random
+import socket
+import struct
+import threading
+import time
+from dataclasses import dataclass, field
+from enum import Enum, IntEnum
+
+from .constants.proj_constants import MCAST_GRP, MCAST_PORT
+from .utils.telemetry import Level, get_telemetry
+
+MAGIC = b"GS"
+VERSION = 1
+MSG_PING = 3
+MSG_ANNOUNCE = 4
+MSG_LEAVE = 5
+
+HEADER = struct.Struct("!2sBB")
+PING = struct.Struct("!I")
+ANNOUNCE = struct.Struct("!IBIddd")
+LEAVE = struct.Struct("!BI")
+
+Position = tuple[float, float, float]
+
+
+class PeerRole(IntEnum):
+    DRONE = 0
+    CONTROLLER = 1
+
+
+@dataclass(frozen=True)
+class Peer:
+    """A drone or controller that answered discovery."""
+
+    role: PeerRole
+    peer_id: int
+    position: Position
+
+
+class MembershipChange(Enum):
+    JOIN = "join"
+    LEAVE = "leave"
+
+
+@dataclass(frozen=True)
+class MembershipEvent:
+    change: MembershipChange
+    peer: Peer
+
+
+@dataclass
+class DiscoveryResult:
+    """Peers found by one discovery round. Latencies are in seconds from the PING."""
+
+    drones: list[Peer] = field(default_factory=list)
+    controller: Peer | None = None
+    latencies: dict[tuple[PeerRole, int], float] = field(default_factory=dict)
+    duplicates: int = 0
+    malformed: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def first_reply(self) -> float | None:
+        return min(self.latencies.values(), default=None)
+
+    @property
+    def last_reply(self) -> float | None:
+        return max(self.latencies.values(), default=None)
+
+
+def encode_ping(nonce: int) -> bytes:
+    return HEADER.pack(MAGIC, VERSION, MSG_PING) + PING.pack(nonce)
+
+
+def encode_announce(peer: Peer, nonce: int = 0) -> bytes:
+    return HEADER.pack(MAGIC, VERSION, MSG_ANNOUNCE) + ANNOUNCE.pack(
+        nonce, peer.role, peer.peer_id, *peer.position
+    )
+
+
+def encode_leave(role: PeerRole, peer_id: int) -> bytes:
+    return HEADER.pack(MAGIC, VERSION, MSG_LEAVE) + LEAVE.pack(role, peer_id)
+
+
+def decode_message(data: bytes) -> tuple[int, int | None, Peer | None]:
+    """Decodes a discovery message.
+
+    Args:
+        data (bytes): One datagram.
+
+    Returns:
+        tuple[int, int | None, Peer | None]: Message type, nonce and peer. The
+        nonce is None for LEAVE and the peer is None for PING. A LEAVE peer has
+        no position.
+
+    Raises:
+        ValueError: If the datagram is not a discovery message.
+    """
+    if len(data) < HEADER.size:
+        raise ValueError("datagram shorter than a header")
+    magic, version, message_type = HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("not a discovery datagram")
+    body = {MSG_PING: PING, MSG_ANNOUNCE: ANNOUNCE, MSG_LEAVE: LEAVE}.get(message_type)
+    if body is None or len(data) != HEADER.size + body.size:
+        raise ValueError(f"malformed message of type {message_type}")
+
+    fields = body.unpack_from(data, HEADER.size)
+    if message_type == MSG_PING:
+        return message_type, fields[0], None
+    if message_type == MSG_ANNOUNCE:
+        nonce, role, peer_id, x, y, z = fields
+        return message_type, nonce, Peer(PeerRole(role), peer_id, (x, y, z))
+    role, peer_id = fields
+    return message_type, None, Peer(PeerRole(role), peer_id, (0.0, 0.0, 0.0))
+
+
+class MulticastTransport:
+    """Sends to and receives from the multicast group used by multicast_scripts."""
+
+    def __init__(
+        self,
+        group: str = MCAST_GRP,
+        port: int = MCAST_PORT,
+        interface: str = "0.0.0.0",
+        ttl: int = 255,
+    ) -> None:
+        self.address = (group, port)
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.sock.bind(("", port))
+        mreq = struct.pack("4s4s", socket.inet_aton(group), socket.inet_aton(interface))
+        self.sock.setsockopt(socket.IPPROTO_IP, socket.IP_ADD_MEMBERSHIP, mreq)
+        self.sock.setsockopt(
+            socket.IPPROTO_IP, socket.IP_MULTICAST_IF, socket.inet_aton(interface)
+        )
+        self.sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_TTL, ttl)
+        # Lets discovery and responders share one host
+        self.sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_LOOP, 1)
+
+    def send(self, data: bytes) -> None:
+        self.sock.sendto(data, self.address)
+
+    def recv(self, timeout: float) -> bytes | None:
+        """Returns the next datagram, or None if none arrives within timeout."""
+        self.sock.settimeout(max(timeout, 1e-6))
+        try:
+            return self.sock.recv(2048)
+        except TimeoutError:
+            return None
+
+    def close(self) -> None:
+        self.sock.close()
+
+
+class LoopbackNetwork:
+    """In-process stand-in for the multicast group.
+
+    Every datagram sent through one endpoint is delivered to every other
+    endpoint, like multicast with loopback disabled for the sender.
+    """
+
+    def __init__(self) -> None:
+        self._endpoints: list[LoopbackTransport] = []
+        self._lock = threading.Lock()
+
+    def endpoint(self) -> "LoopbackTransport":
+        transport = LoopbackTransport(self)
+        with self._lock:
+            self._endpoints.append(transport)
+        return transport
+
+    def _deliver(self, sender: "LoopbackTransport", data: bytes) -> None:
+        with self._lock:
+            endpoints = list(self._endpoints)
+        for endpoint in endpoints:
+            if endpoint is not sender:
+                endpoint.inbox.put(data)
+
+    def _detach(self, transport: "LoopbackTransport") -> None:
+        with self._lock:
+            self._endpoints.remove(transport)
+
+
+class LoopbackTransport:
+    """One endpoint of a LoopbackNetwork, with the same API as MulticastTransport."""
+
+    def __init__(self, network: LoopbackNetwork) -> None:
+        self.network = network
+        self.inbox: queue.Queue[bytes] = queue.Queue()
+
+    def send(self, data: bytes) -> None:
+        self.network._deliver(self, data)
+
+    def recv(self, timeout: float) -> bytes | None:
+        try:
+            return self.inbox.get(timeout=max(timeout, 0.0))
+        except queue.Empty:
+            return None
+
+    def close(self) -> None:
+        self.network._detach(self)
+
+
+Transport = MulticastTransport | LoopbackTransport
+
+
+class Responder:
+    """Answers discovery pings on behalf of any number of simulated peers.
+
+    Runs on a background thread once started. Also sends the unsolicited
+    ANNOUNCE and LEAVE messages late joiners and departing peers would send.
+    """
+
+    def __init__(self, transport: Transport, peers: list[Peer] | None = None) -> None:
+        self.transport = transport
+        self.peers: dict[tuple[PeerRole, int], Peer] = {
+            (peer.role, peer.peer_id): peer for peer in peers or []
+        }
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def join(self, peer: Peer) -> None:
+        """Adds a peer and announces it without waiting for a ping."""
+        with self._lock:
+            self.peers[(peer.role, peer.peer_id)] = peer
+        self.transport.send(encode_announce(peer))
+
+    def leave(self, role: PeerRole, peer_id: int) -> None:
+        """Removes a peer and tells the group it left."""
+        with self._lock:
+            self.peers.pop((role, peer_id), None)
+        self.transport.send(encode_leave(role, peer_id))
+
+    def serve_once(self, timeout: float) -> bool:
+        """Answers one ping if one arrives within timeout.
+
+        Returns:
+            bool: True if a ping was answered.
+        """
+        data = self.transport.recv(timeout)
+        if data is None:
+            return False
+        try:
+            message_type, nonce, _ = decode_message(data)
+        except ValueError:
+            return False
+        if message_type != MSG_PING:
+            return False
+        with self._lock:
+            peers = list(self.peers.values())
+        for peer in peers:
+            self.transport.send(encode_announce(peer, nonce))
+        return True
+
+    def start(self) -> None:
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _serve(self) -> None:
+        while not self._stop.is_set():
+            self.serve_once(0.05)
+
+
+class Discovery:
+    """Discovers peers on a transport and tracks later membership changes.
+
+    Args:
+        transport (Transport): Multicast group or a loopback stand-in.
+        deadline (float, optional): Seconds to collect replies after a PING.
+            Defaults to 1.0.
+    """
+
+    def __init__(self, transport: Transport, deadline: float = 1.0) -> None:
+        self.transport = transport
+        self.deadline = deadline
+        self._pending: list[MembershipEvent] = []
+
+    def discover(self, expected_drones: int | None = None) -> DiscoveryResult:
+        """Pings the group and collects replies, deduplicated by role and id.
+
+        Args:
+            expected_drones (int | None, optional): Stop as soon as this many drones
+                and a controller replied instead of waiting for the deadline.
+
+        Returns:
+            DiscoveryResult: Every peer found plus latency metrics.
+        """
+        result = DiscoveryResult()
+        found: dict[tuple[PeerRole, int], Peer] = {}
+        nonce = random.randrange(1, 2**32)
+        start = time.perf_counter()
+        self.transport.send(encode_ping(nonce))
+
+        while (remaining := start + self.deadline - time.perf_counter()) > 0:
+            data = self.transport.recv(remaining)
+            if data is None:
+                break
+            try:
+                message_type, reply_nonce, peer = decode_message(data)
+            except ValueError:
+                result.malformed += 1
+                continue
+            if message_type == MSG_PING:
+                continue
+            if message_type != MSG_ANNOUNCE or reply_nonce != nonce:
+                self._queue_change(message_type, peer)
+                continue
+
+            key = (peer.role, peer.peer_id)
+            if key in found:
+                result.duplicates += 1
+                continue
+            found[key] = peer
+            result.latencies[key] = time.perf_counter() - start
+            if peer.role is PeerRole.CONTROLLER:
+                result.controller = peer
+            else:
+                result.drones.append(peer)
+            if (
+                expected_drones is not None
+                and len(result.drones) >= expected_drones
+                and result.controller is not None
+            ):
+                break
+
+        result.elapsed = time.perf_counter() - start
+        result.drones.sort(key=lambda peer: peer.peer_id)
+        telemetry = get_telemetry()
+        telemetry.count("discovery_rounds")
+        telemetry.event(
+            Level.INFO,
+            "discovery",
+            lambda: {
+                "drones": len(result.drones),
+                "controller": result.controller is not None,
+                "first_reply": result.first_reply,
+                "last_reply": result.last_reply,
+                "elapsed": result.elapsed,
+                "duplicates": result.duplicates,
+            },
+        )
+        return result
+
+    def poll(self, timeout: float = 0.0) -> list[MembershipEvent]:
+        """Returns joins and leaves received since the last call.
+
+        Args:
+            timeout (float, optional): Seconds to wait for the first new message.
+                Messages already queued by the transport are always drained.
+        """
+        wait = timeout
+        while (data := self.transport.recv(wait)) is not None:
+            wait = 0.0
+            try:
+                message_type, _, peer = decode_message(data)
+            except ValueError:
+                continue
+            if message_type != MSG_PING:
+                self._queue_change(message_type, peer)
+        events, self._pending = self._pending, []
+        return events
+
+    def _queue_change(self, message_type: int, peer: Peer) -> None:
+        # Replies to someone else's ping still tell us the peer is alive
+        change = (
+            MembershipChange.LEAVE
+            if message_type == MSG_LEAVE
+            else MembershipChange.JOIN
+        )
+        self._pending.append(MembershipEvent(change, peer))
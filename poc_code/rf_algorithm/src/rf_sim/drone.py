@@ -0,0 +1,202 @@
+from collections.abc import Callable
+
+from .constants.proj_constants import MAX_ACCELERATION, MAX_SPEED
+from .utils.telemetry import Level, get_telemetry
+from .utils.vector import Vector
+
+
+class DroneBase:
+    """Movement, velocity and accessors shared by Drone and DroneState's DroneView.
+
+    Holds no storage of its own. Subclasses provide id, x, y, z, vx, vy, vz,
+    max_speed, max_acceleration and _move_listener, as attributes or slots.
+    """
+
+    __slots__ = ()
+
+    def set_move_listener(self, listener: Callable[["Drone"], None] | None) -> None:
+        """Registers a callback run every time this drone's position changes.
+
+        Args:
+            listener (Callable[[Drone], None] | None): Receives the drone that moved.
+            None removes the current listener.
+        """
+        self._move_listener = listener
+
+    def _notify_moved(self) -> None:
+        if self._move_listener is not None:
+            self._move_listener(self)
+
+    def move_x(self, distance: float) -> None:
+        if distance:
+            self.x += distance
+            self._notify_moved()
+
+    def move_y(self, distance: float) -> None:
+        if distance:
+            self.y += distance
+            self._notify_moved()
+
+    def move_z(self, distance: float) -> None:
+        if distance:
+            self.z += distance
+            self._notify_moved()
+
+    def move_from_vector(self, vector: Vector) -> None:
+        # check if vector has exactly 3 components
+        # checks if there should be no movement at all
+        telemetry = get_telemetry()
+        if vector.get_magnitude() == 0.0:
+            telemetry.event(Level.DEBUG, "no_movement", lambda: {"drone": self.id})
+            return
+
+        vector_components = vector.get_internals_as_tuple()
+
+        # fields are only built if a sink records DEBUG events
+        telemetry.event(
+            Level.DEBUG,
+            "drone_move",
+            lambda: {
+                "drone": self.id,
+                "x": vector_components[0],
+                "y": vector_components[1],
+                "z": vector_components[2],
+            },
+        )
+
+        # moves the drone in the x, y, and z directions
+        self.move_x(vector_components[0])
+        self.move_y(vector_components[1])
+        self.move_z(vector_components[2])
+
+    def set_x(self, x: float) -> None:
+        if x != self.x:
+            self.x = x
+            self._notify_moved()
+
+    def set_y(self, y: float) -> None:
+        if y != self.y:
+            self.y = y
+            self._notify_moved()
+
+    def set_z(self, z: float) -> None:
+        if z != self.z:
+            self.z = z
+            self._notify_moved()
+
+    def get_velocity(self) -> tuple[float, float, float]:
+        return (self.vx, self.vy, self.vz)
+
+    def set_velocity(self, vx: float, vy: float, vz: float) -> None:
+        self.vx = vx
+        self.vy = vy
+        self.vz = vz
+
+    def get_max_speed(self) -> float:
+        return self.max_speed
+
+    def get_max_acceleration(self) -> float:
+        return self.max_acceleration
+
+    def get_x(self) -> float:
+        return self.x
+
+    def get_y(self) -> float:
+        return self.y
+
+    def get_z(self) -> float:
+        return self.z
+
+    def get_id(self) -> str:
+        return self.id
+
+    def pretty_print(self) -> str:
+        return f"Drone {self.id}"
+
+    def __str__(self) -> str:
+        return f"""
+            Drone {self.id}
+            X Coordinate: {self.x}
+            Y Coordinate: {self.y}
+            Z Coordinate: {self.z}
+        """
+
+    def __repr__(self) -> str:
+        return f"ID: {self.id}\nX: {self.x}\nY: {self.y}\nZ: {self.z}\n"
+
+    # checks if two drones are equal by id, x, y, and z
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, DroneBase):
+            return False  # don't attempt to compare against unrelated types
+        if (
+            self.id == other.id
+            and self.x == other.get_x()
+            and self.y == other.get_y()
+            and self.z == other.get_z()
+        ):
+            return True
+        return False
+
+    # equal drones always share an id, so hashing by id keeps drones usable in sets
+    def __hash__(self) -> int:
+        return hash(self.id)
+
+
+class Drone(DroneBase):
+    """Class representing a rudimentary drone. Capable of moving and broadcasting location"""
+
+    # Called with the drone whenever one of its coordinates changes
+    _move_listener: Callable[["Drone"], None] | None = None
+    # Velocity in field units per second, only used by the time-stepped engine
+    vx: float = 0.0
+    vy: float = 0.0
+    vz: float = 0.0
+    max_speed: float = MAX_SPEED
+    max_acceleration: float = MAX_ACCELERATION
+
+    def __init__(
+        self,
+        id: str,
+        x_coordinate: float,
+        y_coordinate: float,
+        z_coordinate: float,
+        max_speed: float = MAX_SPEED,
+        max_acceleration: float = MAX_ACCELERATION,
+    ) -> None:
+        self.id = id
+        self.x = x_coordinate
+        self.y = y_coordinate
+        self.z = z_coordinate
+        self.max_speed = max_speed
+        self.max_acceleration = max_acceleration
+
+
+if __name__ == "__main__":
+    print("testing move_from_vector() method: ")
+
+    # Create two drone instances
+    drone1 = Drone("Alpha", 0.0, 0.0, 0.0)
+    drone2 = Drone("Beta", 3.0, 4.0, 0.0)
+
+    print("printing drone1 and drone2 before moving: ")
+    print(drone1)
+    print(drone2)
+    print()
+
+    # Move the first drone
+    drone1.move_from_vector(Vector(-1.0, -1.0, -2.0))
+
+    # Move the second drone
+    drone2.move_from_vector(Vector(3.0, -6.0, 2.0))
+
+    print()
+    print("printing drone1 and drone2 after moving: ")
+    print(drone1)
+    print(drone2)
+    print()
+
+    # Calculate distance between them
+    drone_1_vec = Vector(drone1.get_x(), drone1.get_y(), drone1.get_z())
+    drone_2_vec = Vector(drone2.get_x(), drone2.get_y(), drone2.get_z())
+    distance = drone_1_vec.distance_between_vector(drone_2_vec)
+    print(f"Distance between drones: {distance}")
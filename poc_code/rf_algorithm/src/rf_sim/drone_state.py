@@ -0,0 +1,317 @@
+from collections.abc import Callable
+
+import numpy as np
+
+from .constants.proj_constants import MAX_ACCELERATION, MAX_SPEED
+from .drone import Drone, DroneBase
+from .utils.graph_wrapper import DroneGraph
+from .utils.read_write_lock import RWLock
+from .utils.vector import Vector
+
+
+class DroneState:
+    """Struct-of-arrays store for a whole swarm.
+
+    Positions live in one (capacity, 3) float array and ids in a parallel list.
+    Edges are two index arrays plus a last-writer array, so an edge costs a few
+    array slots instead of a Distance, Vector and RWLock on the heap. Distance
+    vectors are derived from the positions whenever they are read. One RWLock
+    guards the whole store.
+    """
+
+    def __init__(self, capacity: int = 16) -> None:
+        capacity = max(capacity, 1)
+        self.positions = np.zeros((capacity, 3), dtype=np.float64)
+        self.ids: list[str | int] = []
+        self.edge_sources = np.zeros(capacity, dtype=np.int32)
+        self.edge_targets = np.zeros(capacity, dtype=np.int32)
+        self.edge_last_writer = np.full(capacity, -1, dtype=np.int32)
+        self.edge_count = 0
+        self.mutex = RWLock()
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def add_drone(
+        self,
+        id: str | int,
+        x_coordinate: float,
+        y_coordinate: float,
+        z_coordinate: float,
+    ) -> "DroneView":
+        """Appends a drone to the store.
+
+        Returns:
+            DroneView: Drone proxy reading and writing the new row.
+        """
+        row = len(self.ids)
+        if row == len(self.positions):
+            self.positions = np.resize(self.positions, (2 * row, 3))
+        self.positions[row] = (x_coordinate, y_coordinate, z_coordinate)
+        self.ids.append(id)
+        return DroneView(self, row)
+
+    def reserve_edges(self, count: int) -> None:
+        """Grows the edge arrays so that count edges fit without reallocating.
+
+        Args:
+            count (int): Total number of edges the store should hold.
+        """
+        if count > len(self.edge_sources):
+            self.edge_sources = np.resize(self.edge_sources, count)
+            self.edge_targets = np.resize(self.edge_targets, count)
+            self.edge_last_writer = np.resize(self.edge_last_writer, count)
+
+    def add_edge(self, source: int, target: int) -> "DistanceView":
+        """Appends an edge between two drone rows.
+
+        Returns:
+            DistanceView: Distance proxy for the new edge, initially written by source.
+        """
+        slot = self.edge_count
+        if slot == len(self.edge_sources):
+            self.edge_sources = np.resize(self.edge_sources, 2 * slot)
+            self.edge_targets = np.resize(self.edge_targets, 2 * slot)
+            self.edge_last_writer = np.resize(self.edge_last_writer, 2 * slot)
+        self.edge_sources[slot] = source
+        self.edge_targets[slot] = target
+        self.edge_last_writer[slot] = source
+        self.edge_count += 1
+        return DistanceView(self, slot)
+
+    def build_graph(self) -> DroneGraph:
+        """Builds a complete DroneGraph whose nodes and edges are views over this store.
+        Node indices match store rows.
+
+        Returns:
+            DroneGraph: Graph with one node per drone and one edge per pair.
+        """
+        drone_count = len(self.ids)
+        self.reserve_edges(self.edge_count + drone_count * (drone_count - 1) // 2)
+        graph = DroneGraph(multigraph=False)
+        graph.add_nodes_from([DroneView(self, row) for row in range(drone_count)])
+        graph.add_edges_from(
+            [
+                (source, target, self.add_edge(source, target))
+                for source in range(drone_count)
+                for target in range(source + 1, drone_count)
+            ]
+        )
+        return graph
+
+
+class DroneView(DroneBase):
+    """Drone proxy over one row of a DroneState. Holds no coordinates of its own.
+
+    Shares Drone's behaviour through the slotted DroneBase, so views carry no
+    per-instance __dict__, only the slots below.
+    """
+
+    __slots__ = (
+        "_state",
+        "_row",
+        "_move_listener",
+        "vx",
+        "vy",
+        "vz",
+        "max_speed",
+        "max_acceleration",
+    )
+
+    def __init__(
+        self,
+        state: DroneState,
+        row: int,
+        max_speed: float = MAX_SPEED,
+        max_acceleration: float = MAX_ACCELERATION,
+    ) -> None:
+        self._state = state
+        self._row = row
+        self._move_listener: Callable[[Drone], None] | None = None
+        self.vx = 0.0
+        self.vy = 0.0
+        self.vz = 0.0
+        self.max_speed = max_speed
+        self.max_acceleration = max_acceleration
+
+    @property
+    def id(self) -> str | int:
+        return self._state.ids[self._row]
+
+    @property
+    def x(self) -> float:
+        return float(self._state.positions[self._row, 0])
+
+    @x.setter
+    def x(self, value: float) -> None:
+        self._state.positions[self._row, 0] = value
+
+    @property
+    def y(self) -> float:
+        return float(self._state.positions[self._row, 1])
+
+    @y.setter
+    def y(self, value: float) -> None:
+        self._state.positions[self._row, 1] = value
+
+    @property
+    def z(self) -> float:
+        return float(self._state.positions[self._row, 2])
+
+    @z.setter
+    def z(self, value: float) -> None:
+        self._state.positions[self._row, 2] = value
+
+
+class DistanceView:
+    """Distance proxy over one edge slot of a DroneState.
+
+    The vector is recomputed from the two drone positions on every read,
+    oriented from the last drone to write the edge towards the other one.
+    Updates therefore only need to record the writer.
+    """
+
+    __slots__ = ("_state", "_slot")
+
+    def __init__(self, state: DroneState, slot: int) -> None:
+        self._state = state
+        self._slot = slot
+
+    def _vector_unlocked(self) -> Vector:
+        state = self._state
+        writer = int(state.edge_last_writer[self._slot])
+        other = int(state.edge_sources[self._slot])
+        if other == writer:
+            other = int(state.edge_targets[self._slot])
+        dx, dy, dz = (state.positions[writer] - state.positions[other]).tolist()
+        return Vector(dx, dy, dz)
+
+    def get_vector(self) -> Vector:
+        """Thread-safe way to acquire the distance vector between the two drones.
+
+        Returns:
+            Vector: Vector from the other drone to the last drone to write.
+        """
+        self._state.mutex.acquire_read()
+        vector = self._vector_unlocked()
+        self._state.mutex.release_read()
+
+        return vector
+
+    def get_vector_abs(self) -> Vector:
+        """Thread-safe way to acquire the distance vector with absolute value applied.
+
+        Returns:
+            Vector: Absolute distance between the two drones.
+        """
+        return self.get_vector().as_abs()
+
+    def get_vector_magnitutde(self) -> float:
+        """Thread-safe way to calculate magnitude of the distance vector.
+
+        Returns:
+            float: Distance between the two drones.
+        """
+        return self.get_vector().get_magnitude()
+
+    def update_vector_with_coords(
+        self, x: float, y: float, z: float, drone_id: int
+    ) -> None:
+        """Records drone_id as the last writer. Coordinates are derived from positions."""
+        self._record_writer(drone_id)
+
+    def update_vector_with_vector(self, vector: Vector, drone_id: int) -> None:
+        """Records drone_id as the last writer. The vector is derived from positions."""
+        self._record_writer(drone_id)
+
+    def update_vector_with_components(
+        self, x: float, y: float, z: float, drone_id: int
+    ) -> None:
+        """Records drone_id as the last writer. Components are derived from positions."""
+        self._record_writer(drone_id)
+
+    def add_force_into(
+        self,
+        out: Vector,
+        drone_id: int,
+        min_distance: float,
+        repulsion_strength: float,
+    ) -> None:
+        """Adds the force this edge exerts on drone_id to out, see Distance.add_force_into."""
+        self._state.mutex.acquire_read()
+        vector = self._vector_unlocked()
+        writer = int(self._state.edge_last_writer[self._slot])
+        self._state.mutex.release_read()
+        vector.force_into(
+            out,
+            min_distance,
+            repulsion_strength,
+            1.0 if writer == drone_id else -1.0,
+        )
+
+    def _record_writer(self, drone_id: int) -> None:
+        state = self._state
+        state.mutex.acquire_write()
+        if drone_id in (state.edge_sources[self._slot], state.edge_targets[self._slot]):
+            state.edge_last_writer[self._slot] = drone_id
+        state.mutex.release_write()
+
+    def get_rwlock(self) -> RWLock:
+        """Getter for the RWLock shared by every view of the store.
+
+        Returns:
+            RWLock: Lock guarding the DroneState.
+        """
+        return self._state.mutex
+
+    def get_last_to_write(self) -> int:
+        """Getter for last to write.
+
+        Returns:
+            int: Row of the last drone to update distance.
+        """
+        self._state.mutex.acquire_read()
+        drone_id = int(self._state.edge_last_writer[self._slot])
+        self._state.mutex.release_read()
+
+        return drone_id
+
+    def get_vector_and_last_to_write(self) -> tuple[Vector, int]:
+        """Thread-safe way to acquire the distance vector and its writer under a single read lock.
+
+        Returns:
+            tuple[Vector, int]: Distance vector and row of the last drone to update distance.
+        """
+        self._state.mutex.acquire_read()
+        vector = self._vector_unlocked()
+        drone_id = int(self._state.edge_last_writer[self._slot])
+        self._state.mutex.release_read()
+
+        return vector, drone_id
+
+    def distance_between_vectors(self, other_vector: Vector) -> float:
+        """Calculates the distance between the distance vector and another vector.
+
+        Args:
+            other_vector (Vector): Other distance vector to use in distance measurement.
+
+        Returns:
+            float: Distance between the points represented by the two position vectors.
+        """
+        return self.get_vector().distance_between_vector(other_vector)
+
+    def distance_between_vectors_using_abs(self, other_vector: Vector) -> float:
+        """Calculates the distance between the absolute value of the distance vector and another vector.
+
+        Args:
+            other_vector (Vector): Other distance vector to use in distance measurement.
+
+        Returns:
+            float: Distance between the points represented by the two position vectors.
+        """
+        return self.get_vector().as_abs().distance_between_vector(other_vector)
+
+    def __str__(self) -> str:
+        vector_internals = self.get_vector().get_internals_as_tuple()
+
+        return f"<{vector_internals[0]}, {vector_internals[1]}, {vector_internals[2]}>"
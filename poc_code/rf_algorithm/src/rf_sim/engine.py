@@ -0,0 +1,324 @@
+import argparse
+import math
+import random
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from enum import Enum
+
+from .constants.proj_constants import DRAG, TICK_RATE
+from .drone import Drone
+from .field import Field
+from .simulation import Simulation
+from .utils.graph_wrapper import DroneGraph
+from .utils.telemetry import get_telemetry
+
+
+class Integrator(Enum):
+    """How SimulationEngine advances velocity and position over one tick."""
+
+    # v += a * dt, then x += v * dt with the new velocity
+    SEMI_IMPLICIT_EULER = "semi_implicit_euler"
+    # x += v * dt + a * dt^2 / 2, then v += (a + a_next) * dt / 2
+    VELOCITY_VERLET = "velocity_verlet"
+
+
+@dataclass
+class EngineConfig:
+    """Settings of a SimulationEngine. Drones have unit mass, so force is acceleration."""
+
+    tick_rate: float = TICK_RATE
+    integrator: Integrator = Integrator.SEMI_IMPLICIT_EULER
+    drag: float = DRAG
+    neighbors_only: bool = False
+    seed: int | None = None
+
+    @property
+    def dt(self) -> float:
+        return 1 / self.tick_rate
+
+
+@dataclass
+class TickStats:
+    """Throughput of one SimulationEngine.run call."""
+
+    ticks: int
+    sim_time: float
+    wall_time: float
+
+    @property
+    def ticks_per_second(self) -> float:
+        return self.ticks / self.wall_time if self.wall_time else math.inf
+
+    @property
+    def realtime_factor(self) -> float:
+        """Simulated seconds per wall clock second. Above 1 is faster than real time."""
+        return self.sim_time / self.wall_time if self.wall_time else math.inf
+
+
+def _clamp_magnitude(
+    x: float, y: float, z: float, limit: float
+) -> tuple[float, float, float]:
+    magnitude = math.sqrt(x * x + y * y + z * z)
+    if magnitude <= limit:
+        return x, y, z
+    scale = limit / magnitude
+    return x * scale, y * scale, z * scale
+
+
+class SimulationEngine:
+    """Fixed time step simulation of the swarm around a Field.
+
+    Every tick reads all forces from the graph edges, integrates them into
+    each drone's velocity and position over dt = 1 / tick_rate, then refreshes
+    the edges once. Accelerations are capped by each drone's max_acceleration,
+    speeds by its max_speed and drag bleeds off velocity so the swarm settles.
+    Drones hitting a wall stop along that axis. Nothing depends on wall time
+    or unseeded randomness, so a seed reproduces a run exactly.
+
+    Args:
+        field (Field): Field bounding the drones.
+        drone_graph (DroneGraph): Graph holding the drones and their Distance edges.
+        refresh_edges_function (Callable[[], None]): Called once per tick after
+            every drone moved, such as Simulation.refresh_dirty_edges.
+        config (EngineConfig | None, optional): Engine settings.
+    """
+
+    def __init__(
+        self,
+        field: Field,
+        drone_graph: DroneGraph,
+        refresh_edges_function: Callable[[], object],
+        config: EngineConfig | None = None,
+    ) -> None:
+        self.field = field
+        self.drone_graph = drone_graph
+        self.refresh_edges_function = refresh_edges_function
+        self.config = config or EngineConfig()
+        self.rng = random.Random(self.config.seed)
+        self.tick_count = 0
+        self.sim_time = 0.0
+        # Accelerations of the last tick, carried over by VELOCITY_VERLET
+        self._accelerations: list[tuple[float, float, float]] | None = None
+
+    def scatter_drones(self) -> None:
+        """Places every drone at random from the engine's seeded generator."""
+        self.field.randomly_place_drones(self.rng)
+        self.refresh_edges_function()
+        self._accelerations = None
+
+    def _node_ids(self) -> list[int]:
+        return list(self.drone_graph.node_indices())
+
+    def _accelerations_now(
+        self, node_ids: list[int]
+    ) -> list[tuple[float, float, float]]:
+        forces = self.field.net_forces(
+            self.drone_graph, node_ids, self.config.neighbors_only
+        )
+        accelerations = []
+        for out_id, force in zip(node_ids, forces, strict=True):
+            drone: Drone = self.drone_graph.get_node_data(out_id)
+            accelerations.append(
+                _clamp_magnitude(
+                    *force.get_internals_as_tuple(), drone.get_max_acceleration()
+                )
+            )
+        return accelerations
+
+    def _move(
+        self,
+        drone: Drone,
+        vx: float,
+        vy: float,
+        vz: float,
+        dx: float,
+        dy: float,
+        dz: float,
+    ) -> None:
+        """Moves a drone by (dx, dy, dz) clamped to the field and stores its velocity,
+        zeroing any velocity component that ran into a wall.
+        """
+        field = self.field
+        x = drone.get_x() + dx
+        y = drone.get_y() + dy
+        if not 0 <= x <= field.x_size:
+            x = max(0, min(field.x_size, x))
+            vx = 0.0
+        if not 0 <= y <= field.y_size:
+            y = max(0, min(field.y_size, y))
+            vy = 0.0
+        drone.set_x(x)
+        drone.set_y(y)
+        if field.z_size:
+            z = drone.get_z() + dz
+            if not 0 <= z <= field.z_size:
+                z = max(0, min(field.z_size, z))
+                vz = 0.0
+            drone.set_z(z)
+        else:
+            vz = 0.0
+        drone.set_velocity(vx, vy, vz)
+
+    def step(self) -> None:
+        """Advances the simulation by one tick of config.dt seconds."""
+        dt = self.config.dt
+        decay = math.exp(-self.config.drag * dt)
+        node_ids = self._node_ids()
+        drones: list[Drone] = [self.drone_graph.get_node_data(i) for i in node_ids]
+
+        with get_telemetry().phase("integrate"):
+            if self.config.integrator is Integrator.SEMI_IMPLICIT_EULER:
+                accelerations = self._accelerations_now(node_ids)
+                for drone, (ax, ay, az) in zip(drones, accelerations, strict=True):
+                    vx, vy, vz = drone.get_velocity()
+                    vx, vy, vz = _clamp_magnitude(
+                        (vx + ax * dt) * decay,
+                        (vy + ay * dt) * decay,
+                        (vz + az * dt) * decay,
+                        drone.get_max_speed(),
+                    )
+                    self._move(drone, vx, vy, vz, vx * dt, vy * dt, vz * dt)
+                with get_telemetry().phase("edge_update"):
+                    self.refresh_edges_function()
+            else:
+                accelerations = self._accelerations
+                if accelerations is None or len(accelerations) != len(node_ids):
+                    # First tick, or drones joined or left since the last one
+                    accelerations = self._accelerations_now(node_ids)
+                half_dt_squared = 0.5 * dt * dt
+                for drone, (ax, ay, az) in zip(drones, accelerations, strict=True):
+                    vx, vy, vz = drone.get_velocity()
+                    self._move(
+                        drone,
+                        vx,
+                        vy,
+                        vz,
+                        vx * dt + ax * half_dt_squared,
+                        vy * dt + ay * half_dt_squared,
+                        vz * dt + az * half_dt_squared,
+                    )
+                with get_telemetry().phase("edge_update"):
+                    self.refresh_edges_function()
+                next_accelerations = self._accelerations_now(node_ids)
+                for drone, (ax, ay, az), (nx, ny, nz) in zip(
+                    drones, accelerations, next_accelerations, strict=True
+                ):
+                    vx, vy, vz = drone.get_velocity()
+                    drone.set_velocity(
+                        *_clamp_magnitude(
+                            (vx + (ax + nx) * 0.5 * dt) * decay,
+                            (vy + (ay + ny) * 0.5 * dt) * decay,
+                            (vz + (az + nz) * 0.5 * dt) * decay
+                            if self.field.z_size
+                            else 0.0,
+                            drone.get_max_speed(),
+                        )
+                    )
+                self._accelerations = next_accelerations
+
+        self.tick_count += 1
+        self.sim_time = self.tick_count * dt
+
+    def run(
+        self,
+        ticks: int | None = None,
+        sim_seconds: float | None = None,
+        real_time: bool = False,
+        until: Callable[[], bool] | None = None,
+    ) -> TickStats:
+        """Runs ticks headless as fast as possible, or paced to the wall clock.
+
+        Args:
+            ticks (int | None, optional): Ticks to run.
+            sim_seconds (float | None, optional): Simulated seconds to run, used
+                when ticks is None.
+            real_time (bool, optional): Sleep so one simulated second takes one
+                wall clock second. Defaults to False.
+            until (Callable[[], bool] | None, optional): Checked after every tick,
+                stops the run early once it returns True.
+
+        Returns:
+            TickStats: Ticks run, simulated time and wall time.
+        """
+        if ticks is None:
+            if sim_seconds is None:
+                raise ValueError("run needs ticks or sim_seconds")
+            ticks = round(sim_seconds * self.config.tick_rate)
+
+        start = time.perf_counter()
+        start_sim_time = self.sim_time
+        ran = 0
+        for ran in range(1, ticks + 1):
+            self.step()
+            if real_time:
+                delay = start + ran * self.config.dt - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+            if until is not None and until():
+                break
+
+        stats = TickStats(
+            ran, self.sim_time - start_sim_time, time.perf_counter() - start
+        )
+        get_telemetry().count("engine_ticks", ran)
+        return stats
+
+    def kinetic_energy(self) -> float:
+        """Sum of v^2 / 2 over every drone, 0 once the swarm is at rest."""
+        return sum(
+            0.5 * (vx * vx + vy * vy + vz * vz)
+            for vx, vy, vz in (
+                drone.get_velocity() for drone in self.drone_graph.nodes()
+            )
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Runs the time-stepped engine headless and reports ticks per second."
+    )
+    parser.add_argument("--drones", type=int, default=64)
+    parser.add_argument("--field", type=float, default=10.0)
+    parser.add_argument("--tick-rate", type=float, default=TICK_RATE)
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument(
+        "--integrator",
+        choices=[i.value for i in Integrator],
+        default=Integrator.SEMI_IMPLICIT_EULER.value,
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--real-time", action="store_true")
+    args = parser.parse_args()
+
+    # The engine scatters the drones itself
+    simulation, field = Simulation.build_swarm(
+        args.drones, (args.field, args.field, args.field), place=False
+    )
+    engine = SimulationEngine(
+        field,
+        simulation.graph,
+        simulation.refresh_dirty_edges,
+        EngineConfig(
+            tick_rate=args.tick_rate,
+            integrator=Integrator(args.integrator),
+            seed=args.seed,
+        ),
+    )
+    engine.scatter_drones()
+    stats = engine.run(sim_seconds=args.seconds, real_time=args.real_time)
+
+    print(
+        f"{stats.ticks} ticks, {stats.sim_time:.2f} s simulated in {stats.wall_time:.3f} s"
+    )
+    print(
+        f"{stats.ticks_per_second:.1f} ticks/s, {stats.realtime_factor:.1f}x real time"
+    )
+    print(
+        f"kinetic energy {engine.kinetic_energy():.6f}, equidistance residual "
+        f"{field.equidistance_residual(simulation.controller.get_location()):.4f}"
+    )
+
+
+if __name__ == "__main__":
+    main()
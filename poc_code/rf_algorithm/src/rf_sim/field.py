@@ -0,0 +1,405 @@
+import random
+from collections.abc import Callable, Iterable
+from enum import Enum
+from typing import cast
+
+from .barnes_hut import Octree
+from .constants.proj_constants import (
+    DAMPING_DECAY,
+    INITIAL_DAMPING,
+    MAX_STEP_FRACTION,
+    MIN_DISTANCE,
+    REPULSION_STRENGTH,
+)
+from .convergence import ConvergenceMonitor
+from .drone import Drone
+from .force_cache import DEFAULT_MAX_PAIRS, ForceCache
+from .utils.distance_obj import Distance
+from .utils.graph_wrapper import DroneGraph
+from .utils.snapshot import PositionSnapshot
+from .utils.telemetry import get_telemetry
+from .utils.vector import Vector
+
+
+def step_damping(damping: float) -> float:
+    """Advances the damping schedule used while sweeping drones in space_drones.
+
+    Args:
+        damping (float): Damping applied to the drone that was just moved.
+
+    Returns:
+        float: Damping to apply to the next drone in the sweep.
+    """
+    return damping + (0.5 if damping < 10 else 5)
+
+
+def damping_schedule(
+    iteration: int,
+    initial_damping: float = INITIAL_DAMPING,
+    decay: float = DAMPING_DECAY,
+) -> float:
+    """Damping for a whole JACOBI pass, initial_damping / (1 + decay * iteration).
+
+    Unlike the per drone schedule of a GAUSS_SEIDEL sweep it never grows: every
+    drone moves at once, so a growing damping pushes the whole swarm into the
+    field's walls and corners within a few dozen passes.
+
+    Args:
+        iteration (int): Index of the pass, starting at 0.
+        initial_damping (float, optional): Damping of the first pass.
+        decay (float, optional): How fast the damping falls off per pass.
+
+    Returns:
+        float: Damping to apply to every drone in the pass.
+    """
+    return initial_damping / (1 + decay * iteration)
+
+
+class UpdateMode(Enum):
+    """How space_drones applies forces during a pass."""
+
+    # Move drones one at a time, later drones see earlier moves
+    GAUSS_SEIDEL = "gauss_seidel"
+    # Compute every force from one snapshot, then move all drones at once
+    JACOBI = "jacobi"
+
+
+class Field:
+    """2 or 3 dimensional field. Used to give space for drone simulation
+
+    repulsion_strength, min_distance and initial_damping tune the spacing
+    passes and default to the values in proj_constants. Passes that sum forces
+    over every drone read them from force_cache when one is enabled.
+    """
+
+    def __init__(
+        self,
+        x_size: float,
+        y_size: float,
+        z_size: float | None,
+        drones: list[Drone],
+        repulsion_strength: float = REPULSION_STRENGTH,
+        min_distance: float = MIN_DISTANCE,
+        initial_damping: float = INITIAL_DAMPING,
+    ) -> None:
+        self.x_size = x_size
+        self.y_size = y_size
+        self.z_size = z_size
+        self.drones = drones
+        self.repulsion_strength = repulsion_strength
+        self.min_distance = min_distance
+        self.initial_damping = initial_damping
+        # Longest move of one drone in a JACOBI pass
+        self.max_step = MAX_STEP_FRACTION * min(
+            size for size in (x_size, y_size, z_size) if size
+        )
+        self.force_cache: ForceCache | None = None
+
+    def enable_force_cache(
+        self, max_pairs: int = DEFAULT_MAX_PAIRS, rebuild_every: int = 50
+    ) -> ForceCache:
+        """Makes all-pairs passes update forces incrementally, see ForceCache.
+
+        Returns:
+            ForceCache: The new cache, also stored as force_cache.
+        """
+        self.force_cache = ForceCache(
+            self.repulsion_strength, self.min_distance, max_pairs, rebuild_every
+        )
+        return self.force_cache
+
+    def randomly_place_drones(self, rng: random.Random | None = None) -> None:
+        """Moves every drone by a random whole number offset inside the field.
+
+        Args:
+            rng (random.Random | None, optional): Source of randomness, pass a seeded
+                instance for reproducible placements. Defaults to the random module.
+        """
+        rng = rng or random
+        for drone in self.drones:
+            drone.move_x(rng.randint(0, int(self.x_size - 1)))
+            drone.move_y(rng.randint(0, int(self.y_size - 1)))
+            if self.z_size:
+                drone.move_z(rng.randint(0, int(self.z_size - 1)))
+
+    def place_drones(self, positions: Iterable[Iterable[float]]) -> None:
+        """Moves every drone to the matching row of positions, such as a recorded
+        (N, 3) tick. Moved drones are reported to their move listeners as usual.
+        """
+        for drone, (x, y, z) in zip(self.drones, positions, strict=True):
+            drone.set_x(float(x))
+            drone.set_y(float(y))
+            drone.set_z(float(z))
+
+    def drones_are_equidistant(
+        self, drone_graph: DroneGraph, controller_location: Vector
+    ) -> bool:
+        distances: list[Distance] = []
+        for i in drone_graph.edges():
+            i = cast(Distance, i)
+            distance = i.distance_between_vectors_using_abs(controller_location)
+            distances.append(distance)
+
+        if not distances:
+            return True
+        return distances.count(distances[0]) == len(distances)
+
+    def equidistance_residual(
+        self, controller_location: Vector, snapshot: PositionSnapshot | None = None
+    ) -> float:
+        """O(N) measure of how far the swarm is from being equidistant.
+
+        Args:
+            controller_location (Vector): Position of the controller.
+            snapshot (PositionSnapshot | None, optional): Published positions to
+                measure, all from one epoch. Defaults to None, which reads the
+                drones directly.
+
+        Returns:
+            float: Largest minus smallest distance between a drone and the controller.
+            0.0 when every drone sits the same distance away.
+        """
+        positions = (
+            snapshot.positions.values()
+            if snapshot is not None
+            else [
+                (drone.get_x(), drone.get_y(), drone.get_z()) for drone in self.drones
+            ]
+        )
+        if not positions:
+            return 0.0
+        distances = [
+            controller_location.distance_between_vector(Vector(x, y, z))
+            for x, y, z in positions
+        ]
+        return max(distances) - min(distances)
+
+    def _net_force(
+        self, drone_graph: DroneGraph, out_id: int, neighbors_only: bool
+    ) -> Vector:
+        """Sums the repulsive force every other drone exerts on out_id, read from the graph edges."""
+        force_vector = Vector(0.0, 0.0, 0.0)  # there is no force initially
+
+        in_ids = (
+            drone_graph.neighbors(out_id)
+            if neighbors_only
+            else drone_graph.node_indices()
+        )
+        for in_id in in_ids:
+            if out_id == in_id:  # skip if it is the same drone
+                continue
+
+            edge_data: Distance = drone_graph.get_edge_data(out_id, in_id)
+            # Added straight into force_vector, negated when in_id wrote the edge
+            edge_data.add_force_into(
+                force_vector, out_id, self.min_distance, self.repulsion_strength
+            )
+        return force_vector
+
+    def net_forces(
+        self, drone_graph: DroneGraph, node_ids: list[int], neighbors_only: bool
+    ) -> list[Vector]:
+        """Net repulsive force on each of node_ids, all read from the current edges.
+
+        Args:
+            drone_graph (DroneGraph): Graph holding the drones and their Distance edges.
+            node_ids (list[int]): Drones to compute the force on.
+            neighbors_only (bool): Only sum forces from drones sharing an edge.
+
+        Returns:
+            list[Vector]: One force per node ID, in order.
+        """
+        with get_telemetry().phase("force_calc"):
+            if self.force_cache is not None and not neighbors_only:
+                self.force_cache.begin_pass(drone_graph)
+                return [self.force_cache.force_on(out_id) for out_id in node_ids]
+            return [
+                self._net_force(drone_graph, out_id, neighbors_only)
+                for out_id in node_ids
+            ]
+
+    def _apply_force(
+        self,
+        drone: Drone,
+        force_vector: Vector,
+        damping: float,
+        monitor: ConvergenceMonitor | None = None,
+    ) -> None:
+        """Moves a drone by force_vector * damping, clamped to the field."""
+        old_x, old_y, old_z = drone.get_x(), drone.get_y(), drone.get_z()
+        force_vector_components = force_vector.get_internals_as_tuple()
+        new_x = (
+            drone.get_x() + force_vector_components[0] * damping
+        )  # calculate the new x coordinate
+        new_y = (
+            drone.get_y() + force_vector_components[1] * damping
+        )  # calculate the new y coordinate
+        new_z = (
+            drone.get_z() + force_vector_components[2] * damping
+        )  # calculate the new z coordinate
+
+        drone.set_x(max(0, min(self.x_size, new_x)))
+        drone.set_y(max(0, min(self.y_size, new_y)))
+        if self.z_size:
+            drone.set_z(max(0, min(self.z_size, new_z)))
+        if monitor is not None:
+            monitor.record_move(
+                drone.get_x() - old_x, drone.get_y() - old_y, drone.get_z() - old_z
+            )
+
+    def space_drones(
+        self,
+        drone_graph: DroneGraph,
+        update_edge_function: callable,
+        neighbors_only: bool = False,
+        update_mode: UpdateMode = UpdateMode.GAUSS_SEIDEL,
+        iteration: int = 0,
+        refresh_edges_function: Callable[[], None] | None = None,
+        monitor: ConvergenceMonitor | None = None,
+        node_ids: list[int] | None = None,
+    ) -> None:
+        """Pushes every drone away from the others.
+
+        In GAUSS_SEIDEL mode drones move one at a time in node order, each one
+        seeing the moves made before it, and damping grows after every drone.
+        In JACOBI mode every force is computed from the positions at the start
+        of the pass, all drones move together with the damping given by
+        damping_schedule(iteration), no drone further than max_step, and edges
+        are refreshed once afterwards.
+
+        Args:
+            drone_graph (DroneGraph): Graph holding the drones and their Distance edges.
+            update_edge_function (callable): Called with a node id after that drone moves.
+            neighbors_only (bool, optional): Only sum forces from drones sharing an edge
+                with the moving drone. Use when the graph was populated with an
+                interaction radius. Defaults to False.
+            update_mode (UpdateMode, optional): Sweep order. Defaults to GAUSS_SEIDEL.
+            iteration (int, optional): Index of this pass, used by the JACOBI damping
+                schedule. Defaults to 0.
+            refresh_edges_function (callable | None, optional): JACOBI only. Called once
+                with no arguments to refresh every edge after all drones moved. When
+                None, update_edge_function is called for each drone instead.
+            monitor (ConvergenceMonitor | None, optional): Receives every move so
+                displacement residuals are ready when the pass ends.
+            node_ids (list[int] | None, optional): JACOBI only. Drones to move, the
+                rest still push on them but stay put, such as ghost copies owned
+                by another shard. Defaults to every drone in the graph.
+        """
+        if update_mode is UpdateMode.JACOBI:
+            self._space_drones_jacobi(
+                drone_graph,
+                update_edge_function,
+                neighbors_only,
+                iteration,
+                refresh_edges_function,
+                monitor,
+                node_ids,
+            )
+            return
+
+        telemetry = get_telemetry()
+        force_timer = telemetry.phase("force_calc")
+        edge_timer = telemetry.phase("edge_update")
+        damping = self.initial_damping
+        cache = self.force_cache if not neighbors_only else None
+        if cache is not None:
+            with force_timer:
+                cache.begin_pass(drone_graph)
+        for out_id in drone_graph.node_indices():
+            with force_timer:
+                if cache is not None:
+                    force_vector = cache.force_on(out_id)
+                else:
+                    force_vector = self._net_force(drone_graph, out_id, neighbors_only)
+            self._apply_force(
+                drone_graph.get_node_data(out_id), force_vector, damping, monitor
+            )
+            if cache is not None:
+                with force_timer:
+                    cache.moved(drone_graph, out_id)
+            damping = step_damping(damping)
+            with edge_timer:
+                update_edge_function(out_id)
+
+    def _space_drones_jacobi(
+        self,
+        drone_graph: DroneGraph,
+        update_edge_function: callable,
+        neighbors_only: bool,
+        iteration: int,
+        refresh_edges_function: Callable[[], None] | None,
+        monitor: ConvergenceMonitor | None,
+        node_ids: list[int] | None,
+    ) -> None:
+        damping = damping_schedule(iteration, self.initial_damping)
+        if node_ids is None:
+            node_ids = list(drone_graph.node_indices())
+        # Every edge is read before any drone moves, so all forces share one snapshot
+        telemetry = get_telemetry()
+        forces = self.net_forces(drone_graph, node_ids, neighbors_only)
+        for out_id, force_vector in zip(node_ids, forces, strict=True):
+            # Crowded drones feel large forces, keep their step under max_step
+            magnitude = force_vector.get_magnitude()
+            self._apply_force(
+                drone_graph.get_node_data(out_id),
+                force_vector,
+                min(damping, self.max_step / magnitude) if magnitude else damping,
+                monitor,
+            )
+
+        with telemetry.phase("edge_update"):
+            if refresh_edges_function is not None:
+                refresh_edges_function()
+            else:
+                for out_id in node_ids:
+                    update_edge_function(out_id)
+
+    def space_drones_barnes_hut(
+        self,
+        drone_graph: DroneGraph,
+        update_edge_function: callable,
+        theta: float = 0.5,
+        monitor: ConvergenceMonitor | None = None,
+    ) -> None:
+        """Barnes-Hut approximation of space_drones for large swarms.
+
+        Builds one octree over the field from the positions at the start of the
+        pass, then moves drones in node order with the same damping schedule as
+        space_drones. Every force is read from that snapshot, so drones do not
+        see moves made earlier in the same pass. theta=0 gives the exact forces.
+
+        Args:
+            drone_graph (DroneGraph): Graph holding the drones and their Distance edges.
+            update_edge_function (callable): Called with a node id after that drone moves.
+            theta (float, optional): Opening angle. Larger is faster and less accurate.
+                Defaults to 0.5.
+            monitor (ConvergenceMonitor | None, optional): Receives every move.
+        """
+        telemetry = get_telemetry()
+        force_timer = telemetry.phase("force_calc")
+        edge_timer = telemetry.phase("edge_update")
+        damping = self.initial_damping
+        node_ids = list(drone_graph.node_indices())
+        drones: list[Drone] = [drone_graph.get_node_data(i) for i in node_ids]
+        with force_timer:
+            tree = Octree(
+                [(d.get_x(), d.get_y(), d.get_z()) for d in drones],
+                (self.x_size, self.y_size, self.z_size or 0.0),
+                theta,
+                self.repulsion_strength,
+                self.min_distance,
+            )
+
+        for index, (out_id, drone) in enumerate(zip(node_ids, drones, strict=True)):
+            with force_timer:
+                force_vector = tree.force_on(index)
+            self._apply_force(drone, force_vector, damping, monitor)
+            damping = step_damping(damping)
+            with edge_timer:
+                update_edge_function(out_id)
+
+    def __str__(self) -> str:
+        return f"""
+            Field with dimensions: [{self.x_size}, {self.y_size}, {self.z_size}]
+            Drones: {str.join(chr(10), [str(d) for d in self.drones])}
+        """
@@ -0,0 +1,231 @@
+import math
+from dataclasses import dataclass
+
+from .constants.proj_constants import MIN_DISTANCE, REPULSION_STRENGTH
+from .drone import Drone
+from .utils.graph_wrapper import DroneGraph
+from .utils.telemetry import get_telemetry
+from .utils.vector import Vector
+
+Force = tuple[float, float, float]
+
+# Each pair cache entry costs about 324 bytes, so roughly 32 MB
+DEFAULT_MAX_PAIRS = 100_000
+
+
+@dataclass
+class ForceCacheStats:
+    """Counters of a ForceCache since it was created or last cleared."""
+
+    # Stale pair contributions found in the cache, or recomputed
+    hits: int = 0
+    misses: int = 0
+    pair_evaluations: int = 0
+    incremental_updates: int = 0
+    rebuilds: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class ForceCache:
+    """Keeps the net all-pairs repulsive force on every drone up to date incrementally.
+
+    The net force on each drone is stored and, when a drone moves, corrected
+    pair by pair: the contribution of each pair it belongs to at the old
+    positions is subtracted and the contribution at the new positions added.
+    Old contributions are looked up by (pair, position versions) in a bounded
+    pair cache, and recomputed from the old positions on a miss. A pass where
+    k drones moved costs O(k * N) force evaluations instead of O(N^2).
+    Rebuilds only fill the pair cache when every pair fits in max_pairs,
+    otherwise most entries would be evicted before being read.
+
+    Incremental sums slowly drift from a fresh sum, so every rebuild_every
+    passes, and whenever drones join or leave, all forces are recomputed.
+
+    Args:
+        repulsion_strength (float, optional): Strength of repulsive force.
+        min_distance (float, optional): Minimum distance used in the force law.
+        max_pairs (int, optional): Pair contributions kept, oldest are evicted first.
+        rebuild_every (int, optional): Passes between full recomputes.
+    """
+
+    def __init__(
+        self,
+        repulsion_strength: float = REPULSION_STRENGTH,
+        min_distance: float = MIN_DISTANCE,
+        max_pairs: int = DEFAULT_MAX_PAIRS,
+        rebuild_every: int = 50,
+    ) -> None:
+        self.repulsion_strength = repulsion_strength
+        self.min_distance = min_distance
+        self.max_pairs = max_pairs
+        self.rebuild_every = rebuild_every
+        self.stats = ForceCacheStats()
+        self._net: dict[int, list[float]] = {}
+        self._positions: dict[int, Force] = {}
+        self._versions: dict[int, int] = {}
+        # (low node, high node, low version, high version) -> force on low from high
+        self._pairs: dict[tuple[int, int, int, int], Force] = {}
+        self._passes = 0
+
+    def clear(self) -> None:
+        """Forgets every force, the next pass recomputes them all."""
+        self._net.clear()
+        self._positions.clear()
+        self._pairs.clear()
+        self._passes = 0
+
+    def _pair_force(self, out_pos: Force, in_pos: Force) -> tuple[float, float, float]:
+        """Vector.calculate_force of out_pos - in_pos, the push in_pos gives out_pos."""
+        dx = out_pos[0] - in_pos[0]
+        dy = out_pos[1] - in_pos[1]
+        dz = out_pos[2] - in_pos[2]
+        distance = max(self.min_distance, math.sqrt(dx * dx + dy * dy + dz * dz))
+        scale = self.repulsion_strength / (distance * distance) / distance
+        return dx * scale, dy * scale, dz * scale
+
+    def _remember(self, key: tuple[int, int, int, int], force: Force) -> None:
+        pairs = self._pairs
+        if len(pairs) >= self.max_pairs:
+            if self.max_pairs <= 0:
+                return
+            del pairs[next(iter(pairs))]
+        pairs[key] = force
+
+    @staticmethod
+    def _position(drone: Drone) -> Force:
+        return drone.get_x(), drone.get_y(), drone.get_z()
+
+    def _rebuild(self, drone_graph: DroneGraph, node_ids: list[int]) -> None:
+        self._pairs.clear()
+        self._positions = {
+            i: self._position(drone_graph.get_node_data(i)) for i in node_ids
+        }
+        self._versions = {i: self._versions.get(i, 0) + 1 for i in node_ids}
+        net = {i: [0.0, 0.0, 0.0] for i in node_ids}
+        positions = self._positions
+        versions = self._versions
+        remember = len(node_ids) * (len(node_ids) - 1) // 2 <= self.max_pairs
+        for a_index, a in enumerate(node_ids):
+            a_pos = positions[a]
+            a_net = net[a]
+            for b in node_ids[a_index + 1 :]:
+                fx, fy, fz = force = self._pair_force(a_pos, positions[b])
+                a_net[0] += fx
+                a_net[1] += fy
+                a_net[2] += fz
+                b_net = net[b]
+                b_net[0] -= fx
+                b_net[1] -= fy
+                b_net[2] -= fz
+                if not remember:
+                    continue
+                low, high = (a, b) if a < b else (b, a)
+                if low != a:
+                    force = (-fx, -fy, -fz)
+                self._remember((low, high, versions[low], versions[high]), force)
+        self._net = net
+        self.stats.rebuilds += 1
+        self.stats.pair_evaluations += len(node_ids) * (len(node_ids) - 1) // 2
+
+    def _apply_moves(self, moves: dict[int, Force]) -> None:
+        """Corrects every net force for drones that moved to the given positions."""
+        positions = self._positions
+        versions = self._versions
+        net = self._net
+        pairs = self._pairs
+        new_versions = {m: versions[m] + 1 for m in moves}
+        evaluations = 0
+        for m, m_new in moves.items():
+            m_old = positions[m]
+            m_net = net[m]
+            for j, j_old in positions.items():
+                # A pair of two moved drones is corrected once, by the lower ID
+                if j == m or (j in moves and j < m):
+                    continue
+                j_new = moves.get(j, j_old)
+                low, high = (m, j) if m < j else (j, m)
+                stale = pairs.get((low, high, versions[low], versions[high]))
+                if stale is None:
+                    self.stats.misses += 1
+                    evaluations += 1
+                    sx, sy, sz = self._pair_force(m_old, j_old)
+                else:
+                    self.stats.hits += 1
+                    sx, sy, sz = (
+                        stale if low == m else (-stale[0], -stale[1], -stale[2])
+                    )
+                fx, fy, fz = self._pair_force(m_new, j_new)
+                evaluations += 1
+                self._remember(
+                    (
+                        low,
+                        high,
+                        new_versions.get(low, versions[low]),
+                        new_versions.get(high, versions[high]),
+                    ),
+                    (fx, fy, fz) if low == m else (-fx, -fy, -fz),
+                )
+                dx, dy, dz = fx - sx, fy - sy, fz - sz
+                m_net[0] += dx
+                m_net[1] += dy
+                m_net[2] += dz
+                j_net = net[j]
+                j_net[0] -= dx
+                j_net[1] -= dy
+                j_net[2] -= dz
+        positions.update(moves)
+        versions.update(new_versions)
+        self.stats.incremental_updates += len(moves)
+        self.stats.pair_evaluations += evaluations
+
+    def begin_pass(self, drone_graph: DroneGraph) -> int:
+        """Brings every net force up to date with the current positions.
+
+        Call once before reading forces in a pass. Drones moved by anything, such
+        as randomly_place_drones or a formation, are found by comparing positions.
+
+        Returns:
+            int: Drones whose position changed since the last pass.
+        """
+        node_ids = list(drone_graph.node_indices())
+        self._passes += 1
+        evaluations = self.stats.pair_evaluations
+        if (
+            len(node_ids) != len(self._positions)
+            or any(i not in self._positions for i in node_ids)
+            or self._passes % self.rebuild_every == 0
+        ):
+            self._rebuild(drone_graph, node_ids)
+            moved = len(node_ids)
+        else:
+            moves = {}
+            for i in node_ids:
+                position = self._position(drone_graph.get_node_data(i))
+                if position != self._positions[i]:
+                    moves[i] = position
+            moved = len(moves)
+            # Past a quarter of the swarm one fresh sum is cheaper than corrections
+            if moved * 4 > len(node_ids):
+                self._rebuild(drone_graph, node_ids)
+            elif moves:
+                self._apply_moves(moves)
+        get_telemetry().count(
+            "force_pairs_evaluated", self.stats.pair_evaluations - evaluations
+        )
+        return moved
+
+    def moved(self, drone_graph: DroneGraph, node_id: int) -> None:
+        """Corrects the forces after one drone moved in the middle of a pass,
+        such as between drones of a GAUSS_SEIDEL sweep. O(N).
+        """
+        position = self._position(drone_graph.get_node_data(node_id))
+        if position != self._positions[node_id]:
+            self._apply_moves({node_id: position})
+
+    def force_on(self, node_id: int) -> Vector:
+        """Current net force on a drone. O(1)."""
+        return Vector(*self._net[node_id])
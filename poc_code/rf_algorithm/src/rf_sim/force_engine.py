@@ -0,0 +1,140 @@
+import numpy as np
+
+from .constants.proj_constants import INITIAL_DAMPING, MIN_DISTANCE, REPULSION_STRENGTH
+from .field import Field, step_damping
+from .utils.graph_wrapper import DroneGraph
+from .utils.vector import Vector
+
+
+def repulsion_forces(
+    displacements: np.ndarray, repulsion_strength: float, min_distance: float
+) -> np.ndarray:
+    """Applies Vector.calculate_force to a stack of displacement vectors.
+
+    Args:
+        displacements (np.ndarray): Array of shape (..., 3) pointing away from the repelling drone.
+        repulsion_strength (float): Strength of repulsive force.
+        min_distance (float): Minimum distance that distance should be calculated as.
+
+    Returns:
+        np.ndarray: Force vectors with the same shape as displacements.
+    """
+    magnitude = np.sqrt(
+        displacements[..., 0] ** 2
+        + displacements[..., 1] ** 2
+        + displacements[..., 2] ** 2
+    )
+    distance = np.maximum(min_distance, magnitude)
+    force = repulsion_strength / distance**2
+    return (displacements / distance[..., None]) * force[..., None]
+
+
+class VectorizedForceEngine:
+    """Array-backed alternative to Field.space_drones.
+
+    Every drone position lives in a single (N, 3) float array, so pairwise
+    displacements, the clamped min_distance, the repulsion force and the
+    damping update are all NumPy operations instead of per-edge Vector objects.
+    """
+
+    def __init__(
+        self,
+        drone_graph: DroneGraph,
+        repulsion_strength: float = REPULSION_STRENGTH,
+        min_distance: float = MIN_DISTANCE,
+    ) -> None:
+        self.drone_graph = drone_graph
+        self.repulsion_strength = repulsion_strength
+        self.min_distance = min_distance
+        self.node_ids = np.asarray(drone_graph.node_indices(), dtype=np.intp)
+        self.positions = np.zeros((len(self.node_ids), 3), dtype=np.float64)
+        self.load_positions()
+
+    def load_positions(self) -> None:
+        """Copies the current coordinates of every drone in the graph into the position array."""
+        for row, node_id in enumerate(self.node_ids):
+            drone = self.drone_graph.get_node_data(int(node_id))
+            self.positions[row] = (drone.get_x(), drone.get_y(), drone.get_z())
+
+    def write_positions(self) -> None:
+        """Copies the position array back onto the drones held by the graph."""
+        for row, node_id in enumerate(self.node_ids):
+            drone = self.drone_graph.get_node_data(int(node_id))
+            drone.set_x(float(self.positions[row, 0]))
+            drone.set_y(float(self.positions[row, 1]))
+            drone.set_z(float(self.positions[row, 2]))
+
+    def _forces_from(self, displacements: np.ndarray) -> np.ndarray:
+        return repulsion_forces(
+            displacements, self.repulsion_strength, self.min_distance
+        )
+
+    def pairwise_displacements(self) -> np.ndarray:
+        """Returns an (N, N, 3) array where entry [i, j] is position i minus position j."""
+        return self.positions[:, None, :] - self.positions[None, :, :]
+
+    def pairwise_forces(self) -> np.ndarray:
+        """Returns an (N, N, 3) array where entry [i, j] is the force drone j exerts on drone i.
+
+        The diagonal is zero because a drone's displacement from itself is the zero vector.
+        """
+        return self._forces_from(self.pairwise_displacements())
+
+    def net_forces(self) -> np.ndarray:
+        """Returns the (N, 3) net repulsive force on every drone from the current positions."""
+        return self.pairwise_forces().sum(axis=1)
+
+    def space_drones(self, field: Field, damping: float = INITIAL_DAMPING) -> None:
+        """Array equivalent of Field.space_drones.
+
+        Drones are visited in node order and each one sees the positions already
+        updated earlier in the sweep, exactly like the per-edge loop. The force on
+        a single drone is computed against the whole position array at once.
+        Results match the loop up to floating point summation order.
+
+        Args:
+            field (Field): Field whose dimensions bound drone positions.
+            damping (float, optional): Damping applied to the first drone of the sweep.
+        """
+        upper_bounds = np.array(
+            [field.x_size, field.y_size, field.z_size if field.z_size else np.inf]
+        )
+        for row in range(len(self.positions)):
+            force = self._forces_from(self.positions[row] - self.positions).sum(axis=0)
+            new_position = np.clip(
+                self.positions[row] + force * damping, 0, upper_bounds
+            )
+            if not field.z_size:
+                new_position[2] = self.positions[row, 2]
+            self.positions[row] = new_position
+            damping = step_damping(damping)
+
+        self.write_positions()
+        self.update_graph_edges()
+
+    def update_graph_edges(self) -> None:
+        """Batched equivalent of rf_simulation.update_graph_edges.
+
+        Computes the displacement of every edge in a single array operation and
+        writes it into the edge's Distance, recording the source node as the writer.
+        """
+        row_of_node = np.full(int(self.node_ids.max(initial=-1)) + 1, -1, dtype=np.intp)
+        row_of_node[self.node_ids] = np.arange(len(self.node_ids))
+
+        edges = list(self.drone_graph.weighted_edge_list())
+        if not edges:
+            return
+        sources = np.fromiter(
+            (edge[0] for edge in edges), dtype=np.intp, count=len(edges)
+        )
+        targets = np.fromiter(
+            (edge[1] for edge in edges), dtype=np.intp, count=len(edges)
+        )
+        displacements = (
+            self.positions[row_of_node[sources]] - self.positions[row_of_node[targets]]
+        )
+
+        for (source, _, edge_data), displacement in zip(
+            edges, displacements.tolist(), strict=True
+        ):
+            edge_data.update_vector_with_vector(Vector(*displacement), source)
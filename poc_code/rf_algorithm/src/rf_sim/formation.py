@@ -0,0 +1,198 @@
+import math
+from dataclasses import dataclass
+
+import numpy as np
+
+from .constants.proj_constants import MAX_SPEED
+from .drone import Drone
+from .field import Field
+from .utils.vector import Vector
+
+# Angle between consecutive points of the Fibonacci lattice, pi * (3 - sqrt(5))
+GOLDEN_ANGLE = math.pi * (3 - math.sqrt(5))
+
+
+def fibonacci_sphere(count: int, center: Vector, radius: float) -> np.ndarray:
+    """Places count points with near uniform spacing on a sphere.
+
+    Args:
+        count (int): Number of points.
+        center (Vector): Center of the sphere.
+        radius (float): Radius of the sphere.
+
+    Returns:
+        np.ndarray: (count, 3) array of points, all exactly radius from center.
+    """
+    index = np.arange(count) + 0.5
+    z = 1 - 2 * index / count
+    ring = np.sqrt(1 - z * z)
+    theta = GOLDEN_ANGLE * index
+    unit = np.stack([ring * np.cos(theta), ring * np.sin(theta), z], axis=1)
+    return np.asarray(center.get_internals_as_tuple()) + radius * unit
+
+
+def circle(count: int, center: Vector, radius: float) -> np.ndarray:
+    """Places count evenly spaced points on a circle in the plane z = center.z.
+
+    Returns:
+        np.ndarray: (count, 3) array of points, all exactly radius from center.
+    """
+    theta = 2 * math.pi * np.arange(count) / max(count, 1)
+    unit = np.stack([np.cos(theta), np.sin(theta), np.zeros(count)], axis=1)
+    return np.asarray(center.get_internals_as_tuple()) + radius * unit
+
+
+def largest_radius(field: Field, center: Vector) -> float:
+    """Largest radius around center that keeps the whole formation inside field.
+    Only x and y bound the radius when the field is 2D.
+    """
+    x, y, z = center.get_internals_as_tuple()
+    gaps = [x, field.x_size - x, y, field.y_size - y]
+    if field.z_size:
+        gaps += [z, field.z_size - z]
+    return max(0.0, min(gaps))
+
+
+def min_cost_assignment(cost: np.ndarray) -> np.ndarray:
+    """Hungarian algorithm for a square cost matrix, O(n^3) with the inner loop
+    over columns done in NumPy.
+
+    Args:
+        cost (np.ndarray): (n, n) cost of giving row i column j.
+
+    Returns:
+        np.ndarray: assignment[i] is the column given to row i. The total cost
+        of the assignment is minimal.
+    """
+    n = cost.shape[0]
+    if cost.shape != (n, n):
+        raise ValueError("cost matrix must be square")
+    # 1-based potentials and matching, column 0 is a sentinel
+    u = np.zeros(n + 1)
+    v = np.zeros(n + 1)
+    row_of_col = np.zeros(n + 1, dtype=np.intp)
+    way = np.zeros(n + 1, dtype=np.intp)
+
+    for row in range(1, n + 1):
+        row_of_col[0] = row
+        col = 0
+        min_slack = np.full(n + 1, np.inf)
+        used = np.zeros(n + 1, dtype=bool)
+        while True:
+            used[col] = True
+            current_row = row_of_col[col]
+            free = ~used[1:]
+            slack = cost[current_row - 1] - u[current_row] - v[1:]
+            improved = np.flatnonzero(free & (slack < min_slack[1:])) + 1
+            min_slack[improved] = slack[improved - 1]
+            way[improved] = col
+
+            candidates = np.where(free, min_slack[1:], np.inf)
+            next_col = int(np.argmin(candidates)) + 1
+            delta = candidates[next_col - 1]
+
+            used_cols = np.flatnonzero(used)
+            u[row_of_col[used_cols]] += delta
+            v[used_cols] -= delta
+            min_slack[1:][free] -= delta
+
+            col = next_col
+            if row_of_col[col] == 0:
+                break
+
+        # Flip the augmenting path
+        while col:
+            previous = way[col]
+            row_of_col[col] = row_of_col[previous]
+            col = previous
+
+    assignment = np.empty(n, dtype=np.intp)
+    assignment[row_of_col[1:] - 1] = np.arange(n)
+    return assignment
+
+
+@dataclass
+class FormationPlan:
+    """Target slot of every drone and the travel needed to get there.
+
+    targets[i] is the slot of drones[i]. Travel is in field units.
+    """
+
+    drones: list[Drone]
+    targets: np.ndarray
+    radius: float
+    total_travel: float
+    max_travel: float
+
+    def time_to_formation(self, speed: float = MAX_SPEED) -> float:
+        """Seconds until the last drone arrives if every drone flies straight
+        to its slot at speed.
+        """
+        return self.max_travel / speed
+
+    def apply(self) -> None:
+        """Moves every drone directly onto its slot."""
+        for drone, (x, y, z) in zip(self.drones, self.targets.tolist(), strict=True):
+            drone.set_x(x)
+            drone.set_y(y)
+            drone.set_z(z)
+
+
+def solve_formation(
+    field: Field,
+    drones: list[Drone],
+    controller_location: Vector,
+    radius: float | None = None,
+) -> FormationPlan:
+    """Places the drones equidistant from the controller with minimum total travel.
+
+    Slots lie on a Fibonacci sphere around the controller, or on a circle at the
+    controller's height when the field is 2D. Slots are then matched to drones
+    by the Hungarian algorithm on straight line distance.
+
+    Args:
+        field (Field): Field the formation must fit in.
+        drones (list[Drone]): Drones to place.
+        controller_location (Vector): Center of the formation.
+        radius (float | None, optional): Formation radius. Defaults to the largest
+            radius that fits in the field. Slots outside the field are clamped
+            to it, which breaks equidistance for those drones.
+
+    Returns:
+        FormationPlan: Slot of every drone plus total and maximum travel.
+
+    Raises:
+        ValueError: No radius was given and the controller is closer than
+            field.min_distance to a wall, or outside the field, so every slot
+            would sit on or next to the controller.
+    """
+    if radius is None:
+        radius = largest_radius(field, controller_location)
+        if radius < field.min_distance:
+            raise ValueError(
+                f"controller at {controller_location.get_internals_as_tuple()} "
+                f"leaves a formation radius of {radius}, below min_distance "
+                f"{field.min_distance}"
+            )
+    count = len(drones)
+    if field.z_size:
+        slots = fibonacci_sphere(count, controller_location, radius)
+        upper = (field.x_size, field.y_size, field.z_size)
+    else:
+        slots = circle(count, controller_location, radius)
+        upper = (field.x_size, field.y_size, np.inf)
+    slots = np.clip(slots, 0, upper)
+
+    positions = np.array(
+        [(d.get_x(), d.get_y(), d.get_z()) for d in drones], dtype=np.float64
+    ).reshape(count, 3)
+    cost = np.linalg.norm(positions[:, None, :] - slots[None, :, :], axis=2)
+    assignment = min_cost_assignment(cost) if count else np.empty(0, dtype=np.intp)
+    travel = cost[np.arange(count), assignment]
+    return FormationPlan(
+        drones=drones,
+        targets=slots[assignment],
+        radius=radius,
+        total_travel=float(travel.sum()),
+        max_travel=float(travel.max(initial=0.0)),
+    )
@@ -0,0 +1,259 @@
+from collections.abc import Callable
+from multiprocessing import Pool
+from multiprocessing.shared_memory import SharedMemory
+from multiprocessing.util import Finalize
+
+import numpy as np
+
+from .constants.proj_constants import INITIAL_DAMPING, MIN_DISTANCE, REPULSION_STRENGTH
+from .field import Field, damping_schedule
+from .force_engine import repulsion_forces
+from .utils.graph_wrapper import DroneGraph
+
+# Rows handled per NumPy call, bounds the (rows, N, 3) temporary per worker
+BLOCK_ROWS = 256
+
+# Shared memory handles attached once per worker process by _attach_worker
+_WORKER: dict[str, object] = {}
+
+
+def jacobi_rows(
+    positions: np.ndarray,
+    new_positions: np.ndarray,
+    start: int,
+    stop: int,
+    upper_bounds: np.ndarray,
+    keep_z: bool,
+    damping: float,
+    repulsion_strength: float = REPULSION_STRENGTH,
+    min_distance: float = MIN_DISTANCE,
+    max_step: float = np.inf,
+) -> None:
+    """Moves rows [start, stop) of positions into new_positions using forces
+    computed from positions only, as one synchronous (Jacobi) update.
+
+    Each row's result only depends on positions, so splitting rows between
+    workers in any way gives bit-for-bit the same output as one serial call.
+
+    Args:
+        positions (np.ndarray): (N, 3) positions at the start of the tick.
+        new_positions (np.ndarray): (N, 3) array receiving the moved rows.
+        start (int): First row to move.
+        stop (int): One past the last row to move.
+        upper_bounds (np.ndarray): Field size on each axis. Lower bounds are 0.
+        keep_z (bool): Leave z untouched, as space_drones does for 2D fields.
+        damping (float): How much of the force to apply.
+        repulsion_strength (float, optional): Strength of repulsive force.
+        min_distance (float, optional): Minimum distance used in the force law.
+        max_step (float, optional): Longest move of one drone, as Field.max_step.
+            Defaults to no limit.
+    """
+    for block_start in range(start, stop, BLOCK_ROWS):
+        block_stop = min(stop, block_start + BLOCK_ROWS)
+        block = positions[block_start:block_stop]
+        forces = repulsion_forces(
+            block[:, None, :] - positions[None, :, :], repulsion_strength, min_distance
+        ).sum(axis=1)
+        magnitudes = np.sqrt((forces * forces).sum(axis=1, keepdims=True))
+        with np.errstate(divide="ignore"):
+            dampings = np.minimum(damping, max_step / magnitudes)
+        moved = np.clip(block + forces * dampings, 0, upper_bounds)
+        if keep_z:
+            moved[:, 2] = block[:, 2]
+        new_positions[block_start:block_stop] = moved
+
+
+def _attach_worker(
+    positions_name: str,
+    new_positions_name: str,
+    drone_count: int,
+    upper_bounds: tuple[float, float, float],
+    keep_z: bool,
+    repulsion_strength: float,
+    min_distance: float,
+    max_step: float,
+) -> None:
+    positions_shm = SharedMemory(name=positions_name)
+    new_positions_shm = SharedMemory(name=new_positions_name)
+    _WORKER.update(
+        positions_shm=positions_shm,
+        new_positions_shm=new_positions_shm,
+        positions=np.ndarray((drone_count, 3), np.float64, positions_shm.buf),
+        new_positions=np.ndarray((drone_count, 3), np.float64, new_positions_shm.buf),
+        upper_bounds=np.array(upper_bounds),
+        keep_z=keep_z,
+        repulsion_strength=repulsion_strength,
+        min_distance=min_distance,
+        max_step=max_step,
+    )
+    # Pool workers skip atexit, but run multiprocessing finalizers when they exit
+    Finalize(None, _detach_worker, exitpriority=10)
+
+
+def _detach_worker() -> None:
+    """Closes the worker's shared memory handles, the parent unlinks the blocks."""
+    # The arrays export the buffers, they must go before the blocks can close
+    _WORKER.pop("positions", None)
+    _WORKER.pop("new_positions", None)
+    for key in ("positions_shm", "new_positions_shm"):
+        shm = _WORKER.pop(key, None)
+        if shm is not None:
+            shm.close()
+
+
+def _move_slice(task: tuple[int, int, float]) -> None:
+    start, stop, damping = task
+    jacobi_rows(
+        _WORKER["positions"],
+        _WORKER["new_positions"],
+        start,
+        stop,
+        _WORKER["upper_bounds"],
+        _WORKER["keep_z"],
+        damping,
+        _WORKER["repulsion_strength"],
+        _WORKER["min_distance"],
+        _WORKER["max_step"],
+    )
+
+
+class ParallelSpacer:
+    """Runs synchronous spacing ticks across a multiprocessing pool.
+
+    Positions live in two shared memory blocks: workers read the current tick
+    from one and write their slice of the next tick into the other, so nothing
+    is pickled per tick except the slice bounds. Results are identical to
+    calling jacobi_rows serially over every row.
+
+    Use as a context manager so the pool and shared memory are released.
+
+    Args:
+        drone_graph (DroneGraph): Graph holding the drones to space.
+        field (Field): Field holding the drones. Gives the bounds, the damping
+            schedule and, unless given here, the force parameters.
+        workers (int): Pool size.
+        repulsion_strength (float | None, optional): Strength of repulsive
+            force. Defaults to the field's.
+        min_distance (float | None, optional): Minimum distance used in the
+            force law. Defaults to the field's.
+    """
+
+    def __init__(
+        self,
+        drone_graph: DroneGraph,
+        field: Field,
+        workers: int,
+        repulsion_strength: float | None = None,
+        min_distance: float | None = None,
+    ) -> None:
+        if repulsion_strength is None:
+            repulsion_strength = field.repulsion_strength
+        if min_distance is None:
+            min_distance = field.min_distance
+        self.drone_graph = drone_graph
+        self.field = field
+        self.workers = workers
+        self.node_ids = list(drone_graph.node_indices())
+        drone_count = len(self.node_ids)
+        nbytes = max(drone_count * 3 * 8, 1)
+
+        self._positions_shm = SharedMemory(create=True, size=nbytes)
+        self._new_positions_shm = SharedMemory(create=True, size=nbytes)
+        self.positions = np.ndarray(
+            (drone_count, 3), np.float64, self._positions_shm.buf
+        )
+        self._new_positions = np.ndarray(
+            (drone_count, 3), np.float64, self._new_positions_shm.buf
+        )
+        self.load_positions()
+
+        bounds = (field.x_size, field.y_size, field.z_size if field.z_size else np.inf)
+        self._pool = Pool(
+            workers,
+            initializer=_attach_worker,
+            initargs=(
+                self._positions_shm.name,
+                self._new_positions_shm.name,
+                drone_count,
+                bounds,
+                not field.z_size,
+                repulsion_strength,
+                min_distance,
+                field.max_step,
+            ),
+        )
+        rows_per_worker = -(-drone_count // workers) if drone_count else 0
+        self._slices = [
+            (start, min(drone_count, start + rows_per_worker))
+            for start in range(0, drone_count, max(rows_per_worker, 1))
+        ]
+
+    def load_positions(self) -> None:
+        """Copies the current coordinates of every drone in the graph into shared memory."""
+        for row, node_id in enumerate(self.node_ids):
+            drone = self.drone_graph.get_node_data(node_id)
+            self.positions[row] = (drone.get_x(), drone.get_y(), drone.get_z())
+
+    def write_positions(self) -> None:
+        """Copies the shared positions back onto the drones held by the graph."""
+        for row, node_id in enumerate(self.node_ids):
+            drone = self.drone_graph.get_node_data(node_id)
+            x, y, z = self.positions[row].tolist()
+            drone.set_x(x)
+            drone.set_y(y)
+            drone.set_z(z)
+
+    def step(self, damping: float = INITIAL_DAMPING, write_back: bool = True) -> None:
+        """Runs one synchronous tick across the pool.
+
+        Args:
+            damping (float, optional): How much of the force to apply this tick.
+            write_back (bool, optional): Move the drones to the new positions, so
+                their move listeners mark their edges stale. With False only the
+                shared positions change until write_positions. Defaults to True.
+        """
+        self._pool.map(
+            _move_slice, [(start, stop, damping) for start, stop in self._slices]
+        )
+        self.positions[:] = self._new_positions
+        if write_back:
+            self.write_positions()
+
+    def space_drones(
+        self,
+        iteration: int = 0,
+        refresh_edges_function: Callable[[], object] | None = None,
+    ) -> None:
+        """One JACOBI pass of the field's drones, run across the pool.
+
+        Stands in for Field.space_drones with UpdateMode.JACOBI over all pairs:
+        drones moved since the last pass are loaded first, and the damping
+        follows damping_schedule(iteration).
+
+        Args:
+            iteration (int, optional): Index of this pass. Defaults to 0.
+            refresh_edges_function (Callable[[], object] | None, optional): Called
+                once after every drone moved, such as refresh_dirty_edges.
+        """
+        self.load_positions()
+        self.step(damping_schedule(iteration, self.field.initial_damping))
+        if refresh_edges_function is not None:
+            refresh_edges_function()
+
+    def close(self) -> None:
+        """Stops the pool and frees the shared memory. Safe to call again."""
+        if self._pool is None:
+            return
+        self._pool.close()
+        self._pool.join()
+        self._pool = None
+        del self.positions, self._new_positions
+        for shm in (self._positions_shm, self._new_positions_shm):
+            shm.close()
+            shm.unlink()
+
+    def __enter__(self) -> "ParallelSpacer":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
@@ -0,0 +1,480 @@
+"""Module level driver of one swarm, and the spacing simulation's command line.
+
+Importing this module is cheap: rustworkx, numpy and the simulation modules
+are imported on first use, and the swarm's Simulation is built by the first
+function called.
+
+Run with the installed rf-sim script, or python -m rf_sim from the src directory:
+    rf-sim simulate --force-cache
+"""
+
+from __future__ import annotations
+
+import argparse
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+from .utils.telemetry import Level, Telemetry, get_telemetry, make_sink, set_telemetry
+
+if TYPE_CHECKING:
+    import random
+
+    from .checkpoint import AsyncCheckpointWriter, Checkpoint
+    from .controller import Controller
+    from .convergence import ConvergenceCriteria, ConvergenceMonitor
+    from .discovery import Discovery, MembershipEvent
+    from .drone import Drone
+    from .field import Field
+    from .simulation import Simulation
+    from .trajectory import TrajectoryRecorder
+    from .utils.distance_obj import Distance
+    from .utils.graph_wrapper import DroneGraph
+    from .utils.snapshot import SnapshotPublisher, StripedLocks
+    from .utils.spatial_index import UniformGrid
+
+# The swarm driven by the functions below, built by the first of them called.
+# The globals mirror its attributes so callers can keep reading them, and
+# assigning DRONE_LIST, CONTROLLER, GET_LOCATION or CONVERGENCE_CRITERIA is
+# picked up by the next call.
+SIMULATION: Simulation | None = None
+
+SYS_GRAPH: DroneGraph | None = None
+DRONE_LIST: list[Drone] = []
+# Drones whose edges are stale, filled by each drone's move listener
+MOVING_DRONES: set[Drone] = set()
+CONTROLLER: Controller = None
+# Edges share a fixed pool of locks instead of owning one each
+EDGE_LOCKS: StripedLocks | None = None
+# Lock-free position reads, published once per tick
+POSITION_SNAPSHOTS: SnapshotPublisher | None = None
+# Only set when the graph is populated with an interaction radius
+SPATIAL_INDEX: UniformGrid | None = None
+# Drones count as equidistant once their distances to the controller differ by
+# at most the tolerance. The iteration cap keeps main() from spinning forever.
+# None until SIMULATION is built, which fills in the default criteria.
+CONVERGENCE_CRITERIA: ConvergenceCriteria | None = None
+# Returns the controller's (x, y, z) when no location is given to register_controller
+GET_LOCATION: Callable[[], tuple[float, float, float]] | None = None
+
+
+def _create() -> Simulation:
+    """Builds SIMULATION, keeping any globals callers assigned beforehand."""
+    global SIMULATION, SYS_GRAPH, EDGE_LOCKS, POSITION_SNAPSHOTS, CONVERGENCE_CRITERIA
+    # Imported here so importing this module does not load rustworkx
+    from .simulation import Simulation
+
+    SIMULATION = Simulation(CONVERGENCE_CRITERIA, GET_LOCATION)
+    SIMULATION.moving_drones = MOVING_DRONES
+    if SYS_GRAPH is None:
+        SYS_GRAPH = SIMULATION.graph
+    EDGE_LOCKS = SIMULATION.edge_locks
+    POSITION_SNAPSHOTS = SIMULATION.position_snapshots
+    CONVERGENCE_CRITERIA = SIMULATION.criteria
+    return SIMULATION
+
+
+def _pull() -> Simulation:
+    """Hands the globals callers may assign over to SIMULATION."""
+    simulation = SIMULATION if SIMULATION is not None else _create()
+    simulation.graph = SYS_GRAPH
+    simulation.drones = DRONE_LIST
+    simulation.controller = CONTROLLER
+    simulation.criteria = CONVERGENCE_CRITERIA
+    simulation.get_location = GET_LOCATION
+    return simulation
+
+
+def _push() -> None:
+    """Mirrors SIMULATION's attributes back into the globals."""
+    global SYS_GRAPH, DRONE_LIST, CONTROLLER, SPATIAL_INDEX, POSITION_SNAPSHOTS
+    SYS_GRAPH = SIMULATION.graph
+    DRONE_LIST = SIMULATION.drones
+    CONTROLLER = SIMULATION.controller
+    SPATIAL_INDEX = SIMULATION.spatial_index
+    POSITION_SNAPSHOTS = SIMULATION.position_snapshots
+
+
+def reset() -> None:
+    """Clears every module level structure so a new swarm can be simulated."""
+    _pull().reset()
+    _push()
+
+
+def mark_drone_moved(drone: Drone) -> None:
+    _pull().mark_drone_moved(drone)
+
+
+def register_controller(location: tuple[float, float, float] | None = None) -> None:
+    """Creates CONTROLLER once, at location, else at GET_LOCATION(), else (5, 5, 5).
+
+    Args:
+        location (tuple[float, float, float] | None, optional): Controller position,
+            for example as reported by discovery.
+    """
+    _pull().register_controller(location)
+    _push()
+
+
+def register_drones(discovery: Discovery | None = None) -> None:
+    """Fills DRONE_LIST, from a multicast discovery round when one is given.
+    See Simulation.register_drones.
+    """
+    _pull().register_drones(discovery)
+    _push()
+
+
+def populate_graph(interaction_radius: float | None = None) -> None:
+    """Adds every registered drone to the graph and connects them with Distance edges.
+
+    Args:
+        interaction_radius (float | None, optional): When set, drones are only
+            connected to drones within this radius, tracked by SPATIAL_INDEX.
+            Defaults to None, which connects every pair.
+    """
+    _pull().populate_graph(interaction_radius)
+    _push()
+
+
+def update_graph_edges() -> None:
+    """
+    Updates the edges of the graph with the current distance between every Drone.
+    """
+    _pull().update_graph_edges()
+
+
+def update_graph_edge(node1_id: int, node2_id: int, edge_data: Distance) -> None:
+    """Update a single edge's payload based on two provided nodes.
+    The first id should be the "dominant" node in the transaction.
+
+    Args:
+        node1_id (int): node ID of the first drone.
+        node2_id (int): node ID of the second drone.
+    """
+    _pull().update_graph_edge(node1_id, node2_id, edge_data)
+
+
+def refresh_all_edges() -> None:
+    """Updates every edge of the graph exactly once, written by its lower node ID.
+    Batched edge refresh for UpdateMode.JACOBI passes.
+    """
+    _pull().refresh_all_edges()
+
+
+def update_egress_edges(node_id: int) -> None:
+    _pull().update_egress_edges(node_id)
+
+
+def refresh_dirty_edges() -> int:
+    """Refreshes every edge touching a drone in MOVING_DRONES exactly once, then
+    clears the set. Cost is proportional to the edges of drones that moved,
+    not to the size of the graph.
+
+    Returns:
+        int: Number of edges refreshed.
+    """
+    return _pull().refresh_dirty_edges()
+
+
+def update_neighbor_edges(node_id: int) -> None:
+    """Edge update for graphs populated with an interaction radius.
+    Moves the node in SPATIAL_INDEX and reconciles its edges with its new neighbors.
+
+    Args:
+        node_id (int): node ID of the drone that moved.
+    """
+    _pull().update_neighbor_edges(node_id)
+
+
+def join_drone(drone: Drone) -> int:
+    """Adds a drone that joined after populate_graph, connecting it to the
+    existing drones without rebuilding the graph.
+
+    Args:
+        drone (Drone): The new drone.
+
+    Returns:
+        int: Its node ID in SYS_GRAPH.
+    """
+    return _pull().join_drone(drone)
+
+
+def leave_drone(drone_id: int | str) -> bool:
+    """Removes a drone and its edges from the graph. Other drones keep their
+    node IDs, and the freed ID may be reused by the next drone to join.
+
+    Args:
+        drone_id (int | str): ID of the drone that left.
+
+    Returns:
+        bool: False if no such drone was registered.
+    """
+    return _pull().leave_drone(drone_id)
+
+
+def apply_membership_events(events: list[MembershipEvent]) -> None:
+    """Joins and removes drones reported by Discovery.poll, one at a time.
+    A controller announce registers the controller if there is none yet.
+    """
+    _pull().apply_membership_events(events)
+    _push()
+
+
+def capture_checkpoint(
+    field: Field, tick: int, rng: random.Random | None = None
+) -> Checkpoint:
+    """Copies the drones, controller, field settings and RNG state into a Checkpoint.
+
+    Args:
+        field (Field): Field the drones live in.
+        tick (int): Pass or tick counter to resume from.
+        rng (random.Random | None, optional): Generator to save. Defaults to the
+            random module's global generator.
+    """
+    return _pull().capture_checkpoint(field, tick, rng)
+
+
+def restore_checkpoint(
+    checkpoint: Checkpoint,
+    rng: random.Random | None = None,
+    interaction_radius: float | None = None,
+) -> Field:
+    """Replaces all module state with a checkpoint and rebuilds SYS_GRAPH.
+
+    Args:
+        checkpoint (Checkpoint): State to restore.
+        rng (random.Random | None, optional): Generator to restore the RNG state
+            into. Defaults to the random module's global generator.
+        interaction_radius (float | None, optional): Passed to populate_graph.
+
+    Returns:
+        Field: Field with the saved dimensions and force parameters holding the
+        restored drones.
+    """
+    field = _pull().restore_checkpoint(checkpoint, rng, interaction_radius)
+    _push()
+    return field
+
+
+def _start_swarm(checkpoint_dir: str | None) -> tuple[Field, int]:
+    """Resumes from the latest checkpoint in checkpoint_dir, if there is one,
+    else registers a new swarm at random positions.
+
+    Returns:
+        tuple[Field, int]: The drones' field and the pass to continue from.
+    """
+    from .checkpoint import latest_checkpoint, load_checkpoint
+    from .field import Field
+
+    latest = latest_checkpoint(checkpoint_dir) if checkpoint_dir else None
+    if latest is not None:
+        saved = load_checkpoint(latest)
+        get_telemetry().event(
+            Level.INFO, "resumed", {"path": latest, "tick": saved.tick}
+        )
+        return restore_checkpoint(saved), saved.tick
+
+    register_controller()
+    register_drones()  # ex: [Drone(0, 3, 3, 3), Drone(1, 3, -3, -3), Drone(2, -3, 3, -3), Drone(3, -3, -3, 3)]
+    populate_graph()
+
+    drone_field = Field(10, 10, 10, DRONE_LIST)
+    drone_field.randomly_place_drones()  # Randomly place drones in field
+    update_graph_edges()
+    return drone_field, 0
+
+
+def _open_outputs(
+    checkpoint_dir: str | None, record_path: str | None, record_capacity: int
+) -> tuple[AsyncCheckpointWriter | None, TrajectoryRecorder | None]:
+    """Opens the checkpoint writer and trajectory recorder main was asked for.
+    Each loads numpy, so neither is imported unless used.
+    """
+    writer = None
+    if checkpoint_dir:
+        from .checkpoint import AsyncCheckpointWriter
+
+        writer = AsyncCheckpointWriter(checkpoint_dir)
+    recorder = None
+    if record_path:
+        from .trajectory import TrajectoryRecorder
+
+        recorder = TrajectoryRecorder(record_path, DRONE_LIST, record_capacity)
+    return writer, recorder
+
+
+def _apply_formation(drone_field: Field) -> None:
+    """Places the drones directly on an equidistant formation, for when repulsion
+    alone did not settle them. Skipped when the controller is too close to a
+    wall for a formation to fit, which would stack every drone on it.
+    """
+    from .formation import largest_radius, solve_formation
+
+    telemetry = get_telemetry()
+    controller_location = CONTROLLER.get_location()
+    radius = largest_radius(drone_field, controller_location)
+    if radius < drone_field.min_distance:
+        telemetry.event(
+            Level.WARNING,
+            "formation_skipped",
+            lambda: {
+                "controller": controller_location.get_internals_as_tuple(),
+                "radius": radius,
+            },
+        )
+        return
+
+    plan = solve_formation(drone_field, DRONE_LIST, controller_location, radius)
+    plan.apply()
+    refresh_dirty_edges()
+    telemetry.event(
+        Level.INFO,
+        "formation_applied",
+        lambda: {
+            "radius": plan.radius,
+            "max_travel": plan.max_travel,
+            "time_to_formation": plan.time_to_formation(),
+            "residual": drone_field.equidistance_residual(controller_location),
+        },
+    )
+
+
+def main(
+    telemetry: Telemetry | None = None,
+    checkpoint_dir: str | None = None,
+    checkpoint_every: int = 50,
+    resume: bool = False,
+    record_path: str | None = None,
+    record_capacity: int = 10_000,
+    force_cache: bool = False,
+) -> None:
+    """Spaces the registered drones until they are equidistant from the controller.
+
+    Args:
+        telemetry (Telemetry | None, optional): Receives progress events, phase
+            timings and, if its sink asks for them, a graph dump every pass.
+            Defaults to the shared Telemetry, which discards events.
+        checkpoint_dir (str | None, optional): Where to write a checkpoint every
+            checkpoint_every passes, in the background. Defaults to None.
+        checkpoint_every (int, optional): Passes between checkpoints.
+        resume (bool, optional): Start from the latest checkpoint in
+            checkpoint_dir, if there is one.
+        record_path (str | None, optional): Record every pass to this trajectory
+            directory, keeping the last record_capacity passes.
+        record_capacity (int, optional): Passes kept by the recording.
+        force_cache (bool, optional): Update forces incrementally between passes,
+            see ForceCache. Defaults to False.
+    """
+    global DRONE_LIST, SYS_GRAPH
+    from .convergence import run_until_converged
+
+    if telemetry is not None:
+        set_telemetry(telemetry)
+    telemetry = get_telemetry()
+
+    drone_field, start_tick = _start_swarm(checkpoint_dir if resume else None)
+    if force_cache:
+        drone_field.enable_force_cache()
+    POSITION_SNAPSHOTS.publish_graph(SYS_GRAPH)
+    writer, recorder = _open_outputs(checkpoint_dir, record_path, record_capacity)
+
+    def space_pass(iteration: int, monitor: ConvergenceMonitor) -> None:
+        drone_field.space_drones(
+            SYS_GRAPH, lambda _node_id: refresh_dirty_edges(), monitor=monitor
+        )
+        POSITION_SNAPSHOTS.publish_graph(SYS_GRAPH)
+        tick = start_tick + iteration + 1
+        if writer is not None and tick % checkpoint_every == 0:
+            writer.submit(capture_checkpoint(drone_field, tick))
+        if recorder is not None:
+            recorder.record(tick)
+        telemetry.event(
+            Level.INFO,
+            "still_not_equidistant",
+            lambda: {
+                "iteration": iteration,
+                "max_displacement": monitor.max_displacement,
+            },
+        )
+        telemetry.dump(Level.DEBUG, "graph_dump", SYS_GRAPH)
+
+    try:
+        result = run_until_converged(
+            space_pass,
+            CONVERGENCE_CRITERIA,
+            # Reads the positions published by the last pass, not the live drones
+            lambda: drone_field.equidistance_residual(
+                CONTROLLER.get_location(), POSITION_SNAPSHOTS.current()
+            ),
+        )
+    finally:
+        if writer is not None:
+            writer.close()
+        if recorder is not None:
+            recorder.close()
+
+    telemetry.event(
+        Level.INFO,
+        "equidistant" if result.converged else "stopped_without_converging",
+        lambda: {
+            "reason": result.reason.value,
+            "iterations": result.iterations,
+            "residual": result.residual,
+            "wall_time": result.wall_time,
+        },
+    )
+    if not result.converged:
+        _apply_formation(drone_field)
+
+    telemetry.event(Level.INFO, "phase_metrics", telemetry.metrics)
+    if drone_field.force_cache is not None:
+        stats = drone_field.force_cache.stats
+        telemetry.event(
+            Level.INFO,
+            "force_cache",
+            lambda: {**vars(stats), "hit_rate": stats.hit_rate},
+        )
+
+
+def cli() -> None:
+    """Parses the command line and runs main."""
+    parser = argparse.ArgumentParser(description="Runs the drone spacing simulation.")
+    parser.add_argument(
+        "--telemetry", choices=["null", "ring", "jsonl", "stderr"], default="stderr"
+    )
+    parser.add_argument("--telemetry-path", help="Output file for the jsonl sink")
+    parser.add_argument(
+        "--level", choices=[level.name for level in Level], default=Level.INFO.name
+    )
+    parser.add_argument(
+        "--graph-dumps", action="store_true", help="Dump the graph after every pass"
+    )
+    parser.add_argument("--checkpoint-dir", help="Write checkpoints to this directory")
+    parser.add_argument("--checkpoint-every", type=int, default=50)
+    parser.add_argument(
+        "--resume", action="store_true", help="Resume from the latest checkpoint"
+    )
+    parser.add_argument("--record", help="Record every pass to this directory")
+    parser.add_argument("--record-capacity", type=int, default=10_000)
+    parser.add_argument(
+        "--force-cache", action="store_true", help="Update forces incrementally"
+    )
+    args = parser.parse_args()
+    sink = make_sink(
+        args.telemetry, args.telemetry_path, Level[args.level], args.graph_dumps
+    )
+    try:
+        main(
+            Telemetry(sink),
+            args.checkpoint_dir,
+            args.checkpoint_every,
+            args.resume,
+            args.record,
+            args.record_capacity,
+            args.force_cache,
+        )
+    finally:
+        sink.close()
+
+
+if __name__ == "__main__":
+    cli()
@@ -0,0 +1,281 @@
+"""Spatial sharding of one large swarm across worker processes.
+
+The field is cut into slabs along its longest axis and each shard runs its
+own Simulation over the drones it owns plus ghost copies of every drone
+within interaction_radius of its slab. Drones only feel drones within the
+radius, so with ghosts refreshed every tick each owned drone sees exactly the
+neighbors it would in one unsharded graph, and a JACOBI tick over the shards
+matches a JACOBI tick over the whole swarm up to float summation order.
+
+The coordinator keeps the authoritative (N, 3) positions. Every tick it sends
+each shard the rows it owns and its ghosts, and reads back the moved owned
+rows. Drones change owner as soon as they cross a slab boundary.
+"""
+
+from multiprocessing import Pipe, Process
+from multiprocessing.connection import Connection
+
+import numpy as np
+
+from .constants.proj_constants import INITIAL_DAMPING, MIN_DISTANCE, REPULSION_STRENGTH
+from .drone import Drone
+from .field import Field, UpdateMode
+from .simulation import Simulation
+
+
+class ShardLayout:
+    """Equal width slabs along one axis of the field.
+
+    Args:
+        field_size (tuple[float, float, float | None]): Field dimensions.
+        shards (int): Number of slabs.
+        halo (float): How far past its slab a shard sees ghosts, the
+            interaction radius.
+    """
+
+    def __init__(
+        self, field_size: tuple[float, float, float | None], shards: int, halo: float
+    ) -> None:
+        if shards < 1:
+            raise ValueError("shards must be at least 1")
+        sizes = [size or 0.0 for size in field_size]
+        self.axis = int(np.argmax(sizes))
+        self.shards = shards
+        self.halo = halo
+        self.edges = np.linspace(0.0, sizes[self.axis], shards + 1)
+
+    def owners(self, positions: np.ndarray) -> np.ndarray:
+        """Shard owning each row of positions. Drones on a boundary belong to the upper slab."""
+        return np.clip(
+            np.searchsorted(self.edges, positions[:, self.axis], side="right") - 1,
+            0,
+            self.shards - 1,
+        )
+
+    def partition(self, positions: np.ndarray) -> list[tuple[np.ndarray, np.ndarray]]:
+        """Splits rows into (owned, ghosts) per shard.
+
+        Returns:
+            list[tuple[np.ndarray, np.ndarray]]: Row indices owned by each shard
+            and rows of other shards within halo of its slab.
+        """
+        coordinate = positions[:, self.axis]
+        owners = self.owners(positions)
+        parts = []
+        for shard in range(self.shards):
+            owned = owners == shard
+            near = (coordinate >= self.edges[shard] - self.halo) & (
+                coordinate <= self.edges[shard + 1] + self.halo
+            )
+            parts.append((np.flatnonzero(owned), np.flatnonzero(near & ~owned)))
+        return parts
+
+
+class Shard:
+    """Simulation of one slab. Owned and ghost drones live in the same graph,
+    but only owned drones move.
+
+    Args:
+        field_size (tuple[float, float, float | None]): Field dimensions.
+        interaction_radius (float): Radius the graph connects drones within.
+        repulsion_strength (float, optional): Passed to Field.
+        min_distance (float, optional): Passed to Field.
+        initial_damping (float, optional): Passed to Field.
+    """
+
+    def __init__(
+        self,
+        field_size: tuple[float, float, float | None],
+        interaction_radius: float,
+        repulsion_strength: float = REPULSION_STRENGTH,
+        min_distance: float = MIN_DISTANCE,
+        initial_damping: float = INITIAL_DAMPING,
+    ) -> None:
+        self.simulation = Simulation()
+        self.simulation.populate_graph(interaction_radius)
+        self.field = Field(
+            *field_size,
+            self.simulation.drones,
+            repulsion_strength,
+            min_distance,
+            initial_damping,
+        )
+
+    def sync(self, ids: list[int | str], positions: np.ndarray) -> None:
+        """Makes the graph hold exactly the given drones at the given positions."""
+        simulation = self.simulation
+        graph = simulation.graph
+        present = set(ids)
+        for drone in list(simulation.drones):
+            if drone.get_id() not in present:
+                simulation.leave_drone(drone.get_id())
+        for drone_id, (x, y, z) in zip(ids, positions.tolist(), strict=True):
+            node_id = graph.node_index(drone_id)
+            if node_id is None:
+                simulation.join_drone(Drone(drone_id, x, y, z))
+                continue
+            drone: Drone = graph[node_id]
+            drone.set_x(x)
+            drone.set_y(y)
+            drone.set_z(z)
+        simulation.refresh_dirty_edges()
+
+    def step(
+        self,
+        iteration: int,
+        ids: list[int | str],
+        positions: np.ndarray,
+        owned_count: int,
+    ) -> np.ndarray:
+        """Runs one JACOBI pass over the first owned_count drones.
+
+        Args:
+            iteration (int): Index of the pass, sets the damping.
+            ids (list[int | str]): Owned drone ids followed by ghost ids.
+            positions (np.ndarray): (len(ids), 3) positions at the start of the tick.
+            owned_count (int): Number of owned drones at the front of ids.
+
+        Returns:
+            np.ndarray: (owned_count, 3) positions of the owned drones after the pass.
+        """
+        self.sync(ids, positions)
+        simulation = self.simulation
+        graph = simulation.graph
+        owned_nodes = [graph.node_index(i) for i in ids[:owned_count]]
+        self.field.space_drones(
+            graph,
+            lambda _node_id: None,
+            neighbors_only=True,
+            update_mode=UpdateMode.JACOBI,
+            iteration=iteration,
+            refresh_edges_function=simulation.refresh_dirty_edges,
+            node_ids=owned_nodes,
+        )
+        return np.array(
+            [
+                (graph[i].get_x(), graph[i].get_y(), graph[i].get_z())
+                for i in owned_nodes
+            ],
+            dtype=np.float64,
+        ).reshape(owned_count, 3)
+
+
+def _serve_shard(conn: Connection, shard_args: tuple) -> None:
+    """Worker process loop: one Shard, one step request at a time until None."""
+    shard = Shard(*shard_args)
+    while (request := conn.recv()) is not None:
+        conn.send(shard.step(*request))
+    conn.close()
+
+
+class ShardedSimulation:
+    """Spaces one swarm across shards, each in its own process or all in this one.
+
+    Use as a context manager so worker processes are stopped.
+
+    Args:
+        drones (list[Drone]): Drones to space. Their coordinates are only read
+            here and written back by write_positions.
+        field (Field): Field holding the drones, also gives the force parameters.
+        shards (int): Number of slabs.
+        interaction_radius (float): Radius drones interact within, also the
+            ghost halo of every shard.
+        processes (bool, optional): Run each shard in a worker process. With
+            False the shards run one after another in this process. Defaults to True.
+    """
+
+    def __init__(
+        self,
+        drones: list[Drone],
+        field: Field,
+        shards: int,
+        interaction_radius: float,
+        processes: bool = True,
+    ) -> None:
+        self.drones = drones
+        self.ids = [drone.get_id() for drone in drones]
+        self.positions = np.array(
+            [(d.get_x(), d.get_y(), d.get_z()) for d in drones], dtype=np.float64
+        ).reshape(len(drones), 3)
+        field_size = (field.x_size, field.y_size, field.z_size)
+        self.layout = ShardLayout(field_size, shards, interaction_radius)
+        self.iteration = 0
+        shard_args = (
+            field_size,
+            interaction_radius,
+            field.repulsion_strength,
+            field.min_distance,
+            field.initial_damping,
+        )
+        self._shards: list[Shard] = []
+        self._workers: list[tuple[Process, Connection]] = []
+        for _ in range(shards):
+            if not processes:
+                self._shards.append(Shard(*shard_args))
+                continue
+            parent_conn, child_conn = Pipe()
+            process = Process(
+                target=_serve_shard, args=(child_conn, shard_args), daemon=True
+            )
+            process.start()
+            child_conn.close()
+            self._workers.append((process, parent_conn))
+
+    def step(self) -> None:
+        """Runs one JACOBI tick on every shard and gathers the owned rows."""
+        requests = []
+        for owned, ghosts in self.layout.partition(self.positions):
+            rows = np.concatenate([owned, ghosts])
+            requests.append(
+                (
+                    owned,
+                    (
+                        self.iteration,
+                        [self.ids[row] for row in rows.tolist()],
+                        self.positions[rows],
+                        len(owned),
+                    ),
+                )
+            )
+
+        new_positions = self.positions.copy()
+        if self._workers:
+            # Send everything first so the shards run in parallel
+            for (_owned, request), (_process, conn) in zip(
+                requests, self._workers, strict=True
+            ):
+                conn.send(request)
+            for (owned, _request), (_process, conn) in zip(
+                requests, self._workers, strict=True
+            ):
+                new_positions[owned] = conn.recv()
+        else:
+            for (owned, request), shard in zip(requests, self._shards, strict=True):
+                new_positions[owned] = shard.step(*request)
+        self.positions = new_positions
+        self.iteration += 1
+
+    def run(self, ticks: int) -> None:
+        for _ in range(ticks):
+            self.step()
+
+    def write_positions(self) -> None:
+        """Copies the current positions back onto the drones."""
+        for drone, (x, y, z) in zip(self.drones, self.positions.tolist(), strict=True):
+            drone.set_x(x)
+            drone.set_y(y)
+            drone.set_z(z)
+
+    def close(self) -> None:
+        """Stops the worker processes."""
+        for process, conn in self._workers:
+            conn.send(None)
+            conn.close()
+            process.join()
+        self._workers = []
+
+    def __enter__(self) -> "ShardedSimulation":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
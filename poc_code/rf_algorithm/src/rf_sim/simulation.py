@@ -0,0 +1,445 @@
+from __future__ import annotations
+
+import random
+from collections.abc import Callable, Iterable
+from typing import TYPE_CHECKING
+
+from .constants.proj_constants import INITIAL_DAMPING, MIN_DISTANCE, REPULSION_STRENGTH
+from .controller import Controller
+from .convergence import ConvergenceCriteria, Criterion
+from .drone import Drone
+from .field import Field
+from .utils.distance_obj import Distance
+from .utils.graph_wrapper import DroneGraph
+from .utils.snapshot import SnapshotPublisher, StripedLocks
+from .utils.spatial_index import UniformGrid
+from .utils.telemetry import get_telemetry
+
+if TYPE_CHECKING:
+    # checkpoint loads numpy and discovery sockets, only imported when used
+    from .checkpoint import Checkpoint
+    from .discovery import Discovery, MembershipEvent
+
+# Controller position used when none is given and get_location is not set
+DEFAULT_CONTROLLER_LOCATION: tuple[float, float, float] = (5, 5, 5)
+
+
+class Simulation:
+    """One swarm: its drones, their graph and the controller they space around.
+
+    Simulations share nothing, so any number of them can run in one process.
+    rf_simulation's module level functions drive a single default instance.
+
+    Args:
+        criteria (ConvergenceCriteria | None, optional): Stopping rules for spacing
+            runs. Defaults to equidistance within 0.1, at most 1000 passes.
+        get_location (Callable[[], tuple[float, float, float]] | None, optional):
+            Returns the controller's (x, y, z) when register_controller is given
+            no location.
+    """
+
+    def __init__(
+        self,
+        criteria: ConvergenceCriteria | None = None,
+        get_location: Callable[[], tuple[float, float, float]] | None = None,
+    ) -> None:
+        self.graph: DroneGraph = DroneGraph(
+            # Edges are bi-directional
+            multigraph=False
+        )
+        self.drones: list[Drone] = []
+        # Drones whose edges are stale, filled by each drone's move listener
+        self.moving_drones: set[Drone] = set()
+        self.controller: Controller | None = None
+        # Edges share a fixed pool of locks instead of owning one each
+        self.edge_locks: StripedLocks = StripedLocks()
+        # Lock-free position reads, published once per tick
+        self.position_snapshots: SnapshotPublisher = SnapshotPublisher()
+        # Only set when the graph is populated with an interaction radius
+        self.spatial_index: UniformGrid | None = None
+        self.criteria: ConvergenceCriteria = criteria or ConvergenceCriteria(
+            criterion=Criterion.EQUIDISTANCE, tolerance=0.1, max_iterations=1000
+        )
+        self.get_location = get_location
+
+    @classmethod
+    def build_swarm(
+        cls,
+        drones: int | Iterable[int | str],
+        field_size: tuple[float, float, float | None] = (10, 10, 10),
+        rng: random.Random | None = None,
+        interaction_radius: float | None = None,
+        controller_location: tuple[float, float, float] | None = None,
+        place: bool = True,
+        populate: bool = True,
+        repulsion_strength: float = REPULSION_STRENGTH,
+        min_distance: float = MIN_DISTANCE,
+        initial_damping: float = INITIAL_DAMPING,
+    ) -> tuple[Simulation, Field]:
+        """Builds a new Simulation of drones starting at the origin, places them
+        at random in a new Field and connects them.
+
+        Args:
+            drones (int | Iterable[int | str]): Number of drones, with ids
+                0 to drones - 1, or the ids themselves.
+            field_size (tuple[float, float, float | None], optional): Field
+                dimensions, z None for a 2D field. Defaults to (10, 10, 10).
+            rng (random.Random | None, optional): Source of the placement.
+                Defaults to the random module.
+            interaction_radius (float | None, optional): Passed to populate_graph.
+            controller_location (tuple[float, float, float] | None, optional):
+                Passed to register_controller.
+            place (bool, optional): Randomly place the drones. Defaults to True,
+                pass False when the caller positions them itself.
+            populate (bool, optional): Populate the graph. Defaults to True, pass
+                False to populate it later, such as to time it.
+            repulsion_strength (float, optional): Passed to Field.
+            min_distance (float, optional): Passed to Field.
+            initial_damping (float, optional): Passed to Field.
+
+        Returns:
+            tuple[Simulation, Field]: The simulation and the field holding its drones.
+        """
+        simulation = cls()
+        simulation.register_controller(controller_location)
+        ids = range(drones) if isinstance(drones, int) else drones
+        simulation.drones = [Drone(drone_id, 0, 0, 0) for drone_id in ids]
+        field = Field(
+            *field_size,
+            simulation.drones,
+            repulsion_strength,
+            min_distance,
+            initial_damping,
+        )
+        # Placing before populating keeps radius graphs sparse from the start
+        if place:
+            field.randomly_place_drones(rng)
+        if populate:
+            simulation.populate_graph(interaction_radius)
+        return simulation, field
+
+    def reset(self) -> None:
+        """Drops every drone, edge and the controller so a new swarm can be simulated."""
+        self.graph = DroneGraph(multigraph=False)
+        self.drones = []
+        self.moving_drones.clear()
+        self.controller = None
+        self.spatial_index = None
+        self.position_snapshots = SnapshotPublisher()
+
+    def mark_drone_moved(self, drone: Drone) -> None:
+        self.moving_drones.add(drone)
+
+    def register_controller(
+        self, location: tuple[float, float, float] | None = None
+    ) -> None:
+        """Creates the controller once, at location, else at get_location(), else
+        at DEFAULT_CONTROLLER_LOCATION.
+
+        Args:
+            location (tuple[float, float, float] | None, optional): Controller
+                position, for example as reported by discovery.
+        """
+        if location is None:
+            location = (
+                self.get_location()
+                if self.get_location is not None
+                else DEFAULT_CONTROLLER_LOCATION
+            )
+        if self.controller is None:
+            self.controller = Controller(*location)
+
+    def register_drones(self, discovery: Discovery | None = None) -> None:
+        """Fills drones, from a multicast discovery round when one is given.
+
+        Args:
+            discovery (Discovery | None, optional): Pings the group and collects the
+                drones and controller that reply. The controller's reported location
+                is registered too. Defaults to None, which registers four drones at
+                the origin.
+        """
+        if discovery is not None:
+            result = discovery.discover()
+            self.drones = [
+                Drone(peer.peer_id, *peer.position) for peer in result.drones
+            ]
+            if result.controller is not None:
+                self.register_controller(result.controller.position)
+            return
+
+        # Equidistant list of drones
+        # self.drones = [
+        #     Drone(0, 3, 3, 3),
+        #     Drone(1, 3, -3, -3),
+        #     Drone(2, -3, 3, -3),
+        #     Drone(3, -3, -3, 3)
+        # ]
+
+        self.drones = [Drone(id, 0, 0, 0) for id in range(4)]
+
+    def _make_distance(
+        self, out_idx: int, in_idx: int, out_d: Drone, in_d: Drone
+    ) -> Distance:
+        return Distance(
+            out_d.get_x() - in_d.get_x(),
+            out_d.get_y() - in_d.get_y(),
+            out_d.get_z() - in_d.get_z(),
+            self.edge_locks.lock_for(out_idx, in_idx),
+            out_idx,
+        )
+
+    def populate_graph(self, interaction_radius: float | None = None) -> None:
+        """Adds every registered drone to the graph and connects them with Distance edges.
+
+        Args:
+            interaction_radius (float | None, optional): When set, drones are only
+                connected to drones within this radius, tracked by spatial_index.
+                Defaults to None, which connects every pair.
+        """
+        for drone in self.drones:
+            drone.set_move_listener(self.mark_drone_moved)
+        if interaction_radius is not None:
+            node_ids = self.graph.batch_join(self.drones)
+            self.spatial_index = UniformGrid(interaction_radius)
+            for idx in node_ids:
+                d = self.graph.get_node_data(idx)
+                self.spatial_index.insert(idx, d.get_x(), d.get_y(), d.get_z())
+            self.graph.connect(self.spatial_index.pairs(), self._make_distance)
+            return
+
+        # One edge per unordered pair, the graph is not a multigraph
+        self.graph.batch_join(self.drones, self._make_distance)
+
+    def update_graph_edges(self) -> None:
+        """
+        Updates the edges of the graph with the current distance between every Drone.
+        """
+        self.moving_drones.clear()
+        if self.spatial_index is not None:
+            for idx in self.graph.node_indices():
+                d = self.graph.get_node_data(idx)
+                self.spatial_index.move(idx, d.get_x(), d.get_y(), d.get_z())
+            for idx in self.graph.node_indices():
+                self._sync_neighbor_edges(idx)
+            return
+
+        # Each edge once, written by its first endpoint
+        for out_idx, in_idx, edge_data in self.graph.weighted_edge_list():
+            self.update_graph_edge(out_idx, in_idx, edge_data)
+
+    def update_graph_edge(
+        self, node1_id: int, node2_id: int, edge_data: Distance
+    ) -> None:
+        """Update a single edge's payload based on two provided nodes.
+        The first id should be the "dominant" node in the transaction.
+
+        Args:
+            node1_id (int): node ID of the first drone.
+            node2_id (int): node ID of the second drone.
+        """
+        drone1 = self.graph.get_node_data(node1_id)
+        drone2 = self.graph.get_node_data(node2_id)
+        edge_data.update_vector_with_components(
+            drone1.get_x() - drone2.get_x(),
+            drone1.get_y() - drone2.get_y(),
+            drone1.get_z() - drone2.get_z(),
+            node1_id,
+        )
+
+    def refresh_all_edges(self) -> None:
+        """Updates every edge of the graph exactly once, written by its lower node ID.
+        Batched edge refresh for UpdateMode.JACOBI passes.
+        """
+        self.moving_drones.clear()
+        for node1_id, node2_id, edge_data in self.graph.weighted_edge_list():
+            self.update_graph_edge(node1_id, node2_id, edge_data)
+
+    def update_egress_edges(self, node_id: int) -> None:
+        edges: list[tuple[int, int, Distance]] = self.graph.out_edges(node_id)
+        for edge in edges:
+            self.update_graph_edge(edge[0], edge[1], edge[2])
+        self.moving_drones.discard(self.graph.get_node_data(node_id))
+
+    def refresh_dirty_edges(self) -> int:
+        """Refreshes every edge touching a drone in moving_drones exactly once, then
+        clears the set. Cost is proportional to the edges of drones that moved,
+        not to the size of the graph.
+
+        Returns:
+            int: Number of edges refreshed.
+        """
+        graph = self.graph
+        dirty_ids = [graph.node_index(drone.get_id()) for drone in self.moving_drones]
+        self.moving_drones.clear()
+
+        if self.spatial_index is not None:
+            for node_id in dirty_ids:
+                d = graph.get_node_data(node_id)
+                self.spatial_index.move(node_id, d.get_x(), d.get_y(), d.get_z())
+            for node_id in dirty_ids:
+                self._sync_neighbor_edges(node_id, refresh_existing=False)
+
+        edge_indices: set[int] = set()
+        for node_id in dirty_ids:
+            edge_indices.update(graph.incident_edges(node_id))
+        for edge_index in edge_indices:
+            node1_id, node2_id = graph.get_edge_endpoints_by_index(edge_index)
+            self.update_graph_edge(
+                node1_id, node2_id, graph.get_edge_data_by_index(edge_index)
+            )
+        get_telemetry().count("edges_refreshed", len(edge_indices))
+        return len(edge_indices)
+
+    def _sync_neighbor_edges(self, node_id: int, refresh_existing: bool = True) -> None:
+        """Makes the edges of a node match its neighbors in spatial_index.
+
+        Edges to drones that left the radius are removed, edges to drones that
+        entered it are created and, if refresh_existing, the remaining edges are refreshed.
+        """
+        graph = self.graph
+        in_range = set(self.spatial_index.neighbors(node_id))
+        connected = set(graph.neighbors(node_id))
+
+        for in_idx in connected - in_range:
+            graph.remove_edge(node_id, in_idx)
+        node_d = graph.get_node_data(node_id)
+        for in_idx in in_range - connected:
+            graph.add_edge(
+                node_id,
+                in_idx,
+                self._make_distance(
+                    node_id, in_idx, node_d, graph.get_node_data(in_idx)
+                ),
+            )
+        if not refresh_existing:
+            return
+        for in_idx in in_range & connected:
+            self.update_graph_edge(
+                node_id, in_idx, graph.get_edge_data(node_id, in_idx)
+            )
+
+    def update_neighbor_edges(self, node_id: int) -> None:
+        """Edge update for graphs populated with an interaction radius.
+        Moves the node in spatial_index and reconciles its edges with its new neighbors.
+
+        Args:
+            node_id (int): node ID of the drone that moved.
+        """
+        d = self.graph.get_node_data(node_id)
+        self.spatial_index.move(node_id, d.get_x(), d.get_y(), d.get_z())
+        self._sync_neighbor_edges(node_id)
+        self.moving_drones.discard(d)
+
+    def join_drone(self, drone: Drone) -> int:
+        """Adds a drone that joined after populate_graph, connecting it to the
+        existing drones without rebuilding the graph.
+
+        Args:
+            drone (Drone): The new drone.
+
+        Returns:
+            int: Its node ID in the graph.
+        """
+        self.drones.append(drone)
+        drone.set_move_listener(self.mark_drone_moved)
+        if self.spatial_index is None:
+            return self.graph.join_drone(drone, self._make_distance)
+
+        (node_id,) = self.graph.batch_join([drone])
+        self.spatial_index.insert(node_id, drone.get_x(), drone.get_y(), drone.get_z())
+        self.graph.connect(
+            ((node_id, in_idx) for in_idx in self.spatial_index.neighbors(node_id)),
+            self._make_distance,
+        )
+        return node_id
+
+    def leave_drone(self, drone_id: int | str) -> bool:
+        """Removes a drone and its edges from the graph. Other drones keep their
+        node IDs, and the freed ID may be reused by the next drone to join.
+
+        Args:
+            drone_id (int | str): ID of the drone that left.
+
+        Returns:
+            bool: False if no such drone was registered.
+        """
+        removed = self.graph.leave_drone(drone_id)
+        if removed is None:
+            return False
+        node_id, drone = removed
+        if self.spatial_index is not None:
+            self.spatial_index.remove(node_id)
+        self.moving_drones.discard(drone)
+        drone.set_move_listener(None)
+        self.drones.remove(drone)
+        return True
+
+    def apply_membership_events(self, events: list[MembershipEvent]) -> None:
+        """Joins and removes drones reported by Discovery.poll, one at a time.
+        A controller announce registers the controller if there is none yet.
+        """
+        from .discovery import MembershipChange, PeerRole
+
+        for event in events:
+            peer = event.peer
+            if peer.role is PeerRole.CONTROLLER:
+                if event.change is MembershipChange.JOIN:
+                    self.register_controller(peer.position)
+                continue
+            if event.change is MembershipChange.LEAVE:
+                self.leave_drone(peer.peer_id)
+            elif not self.graph.has_drone(peer.peer_id):
+                self.join_drone(Drone(peer.peer_id, *peer.position))
+
+    def capture_checkpoint(
+        self, field: Field, tick: int, rng: random.Random | None = None
+    ) -> Checkpoint:
+        """Copies the drones, controller, field settings and RNG state into a Checkpoint.
+
+        Args:
+            field (Field): Field the drones live in.
+            tick (int): Pass or tick counter to resume from.
+            rng (random.Random | None, optional): Generator to save. Defaults to the
+                random module's global generator.
+        """
+        from .checkpoint import capture
+
+        return capture(
+            tick,
+            self.drones,
+            self.controller.get_location().get_internals_as_tuple(),
+            field,
+            rng,
+        )
+
+    def restore_checkpoint(
+        self,
+        checkpoint: Checkpoint,
+        rng: random.Random | None = None,
+        interaction_radius: float | None = None,
+    ) -> Field:
+        """Replaces all state with a checkpoint and rebuilds the graph.
+
+        Args:
+            checkpoint (Checkpoint): State to restore.
+            rng (random.Random | None, optional): Generator to restore the RNG state
+                into. Defaults to the random module's global generator.
+            interaction_radius (float | None, optional): Passed to populate_graph.
+
+        Returns:
+            Field: Field with the saved dimensions and force parameters holding the
+            restored drones.
+        """
+        self.reset()
+        (rng or random).setstate(checkpoint.rng_state)
+        self.register_controller(checkpoint.controller_location)
+        self.drones = checkpoint.make_drones()
+        self.populate_graph(interaction_radius)
+        self.update_graph_edges()
+        return Field(
+            *checkpoint.field_size,
+            self.drones,
+            checkpoint.repulsion_strength,
+            checkpoint.min_distance,
+            checkpoint.initial_damping,
+        )
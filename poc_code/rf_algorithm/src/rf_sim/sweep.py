@@ -0,0 +1,306 @@
+"""Parameter sweeps of the spacing algorithm across a process pool.
+
+Every combination of swarm size, field size, seed and force parameters is
+one cell. Cells run as independent simulations in worker processes, and each
+result is appended to the output file (.csv or .jsonl) as soon as it finishes.
+Rerunning with the same output file skips the cells already in it.
+
+Run with the installed rf-sim script, or python -m rf_sim from the src directory:
+    rf-sim sweep --drones 4 8 16 --fields 10x10x10 20x20 --seeds 0 1 2 \\
+        --repulsion 1 2 4 --workers 4 --timeout 30 --out sweep.jsonl
+"""
+
+import argparse
+import csv
+import itertools
+import json
+import os
+import random
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, fields
+
+from .constants.proj_constants import INITIAL_DAMPING, MIN_DISTANCE, REPULSION_STRENGTH
+from .convergence import ConvergenceCriteria, Criterion, run_until_converged
+from .field import UpdateMode
+from .simulation import Simulation
+
+# Result columns, in output order, after the Scenario fields
+RESULT_COLUMNS = [
+    "key",
+    "status",
+    "converged",
+    "iterations",
+    "wall_time",
+    "spread",
+    "error",
+]
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """One cell of a sweep. z_size is None for a 2D field."""
+
+    drones: int
+    x_size: float
+    y_size: float
+    z_size: float | None
+    seed: int
+    repulsion_strength: float = REPULSION_STRENGTH
+    min_distance: float = MIN_DISTANCE
+    initial_damping: float = INITIAL_DAMPING
+    update_mode: str = UpdateMode.GAUSS_SEIDEL.value
+
+    def key(self) -> str:
+        """Identifies the cell in an output file, used to resume a sweep."""
+        return json.dumps(asdict(self), sort_keys=True)
+
+
+def parse_field(text: str) -> tuple[float, float, float | None]:
+    """Parses XxY or XxYxZ, such as 10x10x10."""
+    sizes = [float(size) for size in text.lower().split("x")]
+    if len(sizes) == 2:
+        return sizes[0], sizes[1], None
+    if len(sizes) == 3:
+        return sizes[0], sizes[1], sizes[2]
+    raise ValueError(f"field must be XxY or XxYxZ, got {text!r}")
+
+
+def expand_grid(
+    drone_counts: Iterable[int],
+    field_sizes: Iterable[tuple[float, float, float | None]],
+    seeds: Iterable[int],
+    repulsion_strengths: Iterable[float] = (REPULSION_STRENGTH,),
+    min_distances: Iterable[float] = (MIN_DISTANCE,),
+    initial_dampings: Iterable[float] = (INITIAL_DAMPING,),
+    update_modes: Iterable[str] = (UpdateMode.GAUSS_SEIDEL.value,),
+) -> list[Scenario]:
+    """Returns one Scenario per combination of the given values."""
+    return [
+        Scenario(drones, *field_size, seed, repulsion, min_distance, damping, mode)
+        for drones, field_size, seed, repulsion, min_distance, damping, mode in (
+            itertools.product(
+                drone_counts,
+                field_sizes,
+                seeds,
+                repulsion_strengths,
+                min_distances,
+                initial_dampings,
+                update_modes,
+            )
+        )
+    ]
+
+
+def run_scenario(
+    scenario: Scenario, max_iterations: int, tolerance: float, timeout: float | None
+) -> dict[str, object]:
+    """Spaces a fresh swarm for one cell. Runs in a worker process.
+
+    The controller sits at the center of the field and drones start at random
+    positions drawn from the scenario's seed. timeout is checked between passes,
+    so a run stops within one pass of it.
+
+    Returns:
+        dict[str, object]: The scenario's fields followed by RESULT_COLUMNS.
+    """
+    row: dict[str, object] = {**asdict(scenario), "key": scenario.key()}
+    try:
+        center = (
+            scenario.x_size / 2,
+            scenario.y_size / 2,
+            scenario.z_size / 2 if scenario.z_size else 0.0,
+        )
+        simulation, field = Simulation.build_swarm(
+            scenario.drones,
+            (scenario.x_size, scenario.y_size, scenario.z_size),
+            random.Random(scenario.seed),
+            controller_location=center,
+            repulsion_strength=scenario.repulsion_strength,
+            min_distance=scenario.min_distance,
+            initial_damping=scenario.initial_damping,
+        )
+
+        mode = UpdateMode(scenario.update_mode)
+        controller = simulation.controller.get_location()
+        result = run_until_converged(
+            lambda iteration, monitor: field.space_drones(
+                simulation.graph,
+                lambda _node_id: simulation.refresh_dirty_edges(),
+                update_mode=mode,
+                iteration=iteration,
+                refresh_edges_function=simulation.refresh_dirty_edges,
+                monitor=monitor,
+            ),
+            ConvergenceCriteria(
+                criterion=Criterion.EQUIDISTANCE,
+                tolerance=tolerance,
+                max_iterations=max_iterations,
+                time_budget=timeout,
+            ),
+            lambda: field.equidistance_residual(controller),
+        )
+        row.update(
+            status=result.reason.value,
+            converged=result.converged,
+            iterations=result.iterations,
+            wall_time=result.wall_time,
+            spread=result.residual,
+            error="",
+        )
+    except Exception as e:  # a failed cell must not stop the sweep
+        row.update(
+            status="error",
+            converged=False,
+            iterations=0,
+            wall_time=0.0,
+            spread=float("nan"),
+            error=f"{type(e).__name__}: {e}",
+        )
+    return row
+
+
+class ResultFile:
+    """Appends sweep rows to a .csv or .jsonl file, flushing after every row.
+
+    Args:
+        path (str): Output file. The format follows its extension.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.is_csv = path.endswith(".csv")
+        self.columns = [f.name for f in fields(Scenario)] + RESULT_COLUMNS
+
+    def completed_keys(self) -> set[str]:
+        """Keys of the cells already in the file. Failed cells are run again."""
+        return {row["key"] for row in self._read_rows() if row.get("status") != "error"}
+
+    def _read_rows(self) -> Iterator[dict[str, object]]:
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, newline="") as file:
+            if self.is_csv:
+                yield from csv.DictReader(file)
+                return
+            for line in file:
+                # A sweep killed mid-write can leave a partial last line
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+
+    def __enter__(self) -> "ResultFile":
+        new_file = not os.path.exists(self.path) or os.path.getsize(self.path) == 0
+        if not new_file:
+            with open(self.path, "rb") as file:
+                file.seek(-1, os.SEEK_END)
+                partial_line = file.read(1) != b"\n"
+        self._file = open(self.path, "a", newline="")
+        if not new_file and partial_line:
+            self._file.write("\n")
+        if self.is_csv:
+            self._writer = csv.DictWriter(self._file, self.columns)
+            if new_file:
+                self._writer.writeheader()
+        return self
+
+    def write(self, row: dict[str, object]) -> None:
+        if self.is_csv:
+            self._writer.writerow(row)
+        else:
+            self._file.write(json.dumps(row) + "\n")
+        self._file.flush()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._file.close()
+
+
+def run_sweep(
+    scenarios: list[Scenario],
+    out_path: str,
+    workers: int | None = None,
+    max_iterations: int = 1000,
+    tolerance: float = 0.1,
+    timeout: float | None = None,
+) -> Iterator[dict[str, object]]:
+    """Runs every scenario not already in out_path, yielding rows as they finish.
+
+    Args:
+        scenarios (list[Scenario]): Cells to run.
+        out_path (str): .csv or .jsonl file results are appended to.
+        workers (int | None, optional): Worker processes. Defaults to the CPU count.
+        max_iterations (int, optional): Pass budget of each run.
+        tolerance (float, optional): Spread at which a run counts as converged.
+        timeout (float | None, optional): Seconds each run may take.
+    """
+    results = ResultFile(out_path)
+    done = results.completed_keys()
+    pending = [s for s in scenarios if s.key() not in done]
+    if not pending:
+        return
+    with results, ProcessPoolExecutor(workers) as pool:
+        futures = [
+            pool.submit(run_scenario, s, max_iterations, tolerance, timeout)
+            for s in pending
+        ]
+        for future in as_completed(futures):
+            row = future.result()
+            results.write(row)
+            yield row
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--drones", type=int, nargs="+", default=[4, 8, 16])
+    parser.add_argument(
+        "--fields", type=parse_field, nargs="+", default=[(10.0, 10.0, 10.0)]
+    )
+    parser.add_argument("--seeds", type=int, nargs="+", default=[0])
+    parser.add_argument(
+        "--repulsion", type=float, nargs="+", default=[REPULSION_STRENGTH]
+    )
+    parser.add_argument("--min-distance", type=float, nargs="+", default=[MIN_DISTANCE])
+    parser.add_argument("--damping", type=float, nargs="+", default=[INITIAL_DAMPING])
+    parser.add_argument(
+        "--modes",
+        nargs="+",
+        choices=[m.value for m in UpdateMode],
+        default=[UpdateMode.GAUSS_SEIDEL.value],
+    )
+    parser.add_argument("--max-iterations", type=int, default=1000)
+    parser.add_argument("--tolerance", type=float, default=0.1)
+    parser.add_argument("--timeout", type=float, help="Seconds allowed per run")
+    parser.add_argument("--workers", type=int)
+    parser.add_argument("--out", default="sweep.jsonl", help=".csv or .jsonl")
+    args = parser.parse_args()
+
+    scenarios = expand_grid(
+        args.drones,
+        args.fields,
+        args.seeds,
+        args.repulsion,
+        args.min_distance,
+        args.damping,
+        args.modes,
+    )
+    finished = 0
+    for row in run_sweep(
+        scenarios,
+        args.out,
+        args.workers,
+        args.max_iterations,
+        args.tolerance,
+        args.timeout,
+    ):
+        finished += 1
+        print(
+            f"{finished:>5}  {row['status']:<16} drones={row['drones']:<5}"
+            f" iterations={row['iterations']:<6} spread={row['spread']:.4f}"
+            f" {row['wall_time']:.2f}s"
+        )
+    print(f"{finished} of {len(scenarios)} cells run, results in {args.out}")
+
+
+if __name__ == "__main__":
+    main()
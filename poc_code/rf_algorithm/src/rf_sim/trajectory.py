@@ -0,0 +1,271 @@
+"""Recording and replay of drone trajectories.
+
+A recording is a directory holding:
+
+    positions.npy   (T, N, 3) float64 ring buffer, row tick % T holds that tick
+    ticks.npy       (T,) int64 tick stored in each row, -1 while the row is empty
+    ids.npy         (N,) drone ids, in column order
+
+Both buffers are preallocated and memory-mapped, so a recording never takes
+more than T * N * 24 bytes of disk however long it runs, and readers only page
+in the ticks and drones they touch.
+
+Run with the installed rf-sim script, or python -m rf_sim from the src directory:
+    rf-sim trajectory stats run.traj
+    rf-sim trajectory replay run.traj --every 100
+"""
+
+import argparse
+import os
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+
+import numpy as np
+
+from .drone import Drone
+from .field import Field
+from .utils.vector import Vector
+
+# Ticks read at once by the chunked statistics
+STATS_CHUNK = 1024
+
+
+def _paths(path: str) -> tuple[str, str, str]:
+    return (
+        os.path.join(path, "positions.npy"),
+        os.path.join(path, "ticks.npy"),
+        os.path.join(path, "ids.npy"),
+    )
+
+
+class TrajectoryRecorder:
+    """Appends the positions of a fixed set of drones every tick.
+
+    Once capacity ticks are recorded, each new tick overwrites the oldest one.
+
+    Args:
+        path (str): Recording directory, created or overwritten.
+        drones (list[Drone]): Drones to record, one column each, in order.
+        capacity (int): Ticks kept in the ring buffer.
+    """
+
+    def __init__(self, path: str, drones: list[Drone], capacity: int) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        os.makedirs(path, exist_ok=True)
+        positions_path, ticks_path, ids_path = _paths(path)
+        self.path = path
+        self.drones = list(drones)
+        self.capacity = capacity
+        np.save(ids_path, np.array([d.get_id() for d in self.drones]))
+        self._positions = np.lib.format.open_memmap(
+            positions_path,
+            mode="w+",
+            dtype=np.float64,
+            shape=(capacity, len(self.drones), 3),
+        )
+        self._ticks = np.lib.format.open_memmap(
+            ticks_path, mode="w+", dtype=np.int64, shape=(capacity,)
+        )
+        self._ticks[:] = -1
+        # Scratch row, filled in one pass and copied into the map in one write
+        self._row = np.empty((len(self.drones), 3))
+
+    def record(self, tick: int) -> None:
+        """Stores the current position of every drone as tick. O(N)."""
+        # One list conversion is several times faster than filling row by row
+        self._row[:] = [(drone.x, drone.y, drone.z) for drone in self.drones]
+        slot = tick % self.capacity
+        self._positions[slot] = self._row
+        self._ticks[slot] = tick
+
+    def flush(self) -> None:
+        self._positions.flush()
+        self._ticks.flush()
+
+    def close(self) -> None:
+        self.flush()
+        del self._positions, self._ticks
+
+    def __enter__(self) -> "TrajectoryRecorder":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+@dataclass
+class DroneStats:
+    """Statistics of each drone over a recording, arrays are indexed by column."""
+
+    ticks: int
+    mean: np.ndarray
+    minimum: np.ndarray
+    maximum: np.ndarray
+    path_length: np.ndarray
+    max_step: np.ndarray
+
+
+class TrajectoryReader:
+    """Read only view of a recording. Nothing is loaded until it is indexed.
+
+    Args:
+        path (str): Recording directory written by TrajectoryRecorder.
+    """
+
+    def __init__(self, path: str) -> None:
+        positions_path, ticks_path, ids_path = _paths(path)
+        self.positions: np.ndarray = np.load(positions_path, mmap_mode="r")
+        self.ids: np.ndarray = np.load(ids_path)
+        ticks = np.load(ticks_path)
+        # Ring slots holding a tick, oldest first
+        filled = np.flatnonzero(ticks >= 0)
+        self._order = filled[np.argsort(ticks[filled], kind="stable")]
+        self.ticks: np.ndarray = ticks[self._order]
+        self._slot_of_tick = dict(zip(self.ticks.tolist(), self._order.tolist()))
+
+    def __len__(self) -> int:
+        return len(self.ticks)
+
+    @property
+    def drone_count(self) -> int:
+        return self.positions.shape[1]
+
+    def column(self, drone_id: int | str) -> int:
+        """Returns the column of a drone in positions."""
+        matches = np.flatnonzero(self.ids == drone_id)
+        if not len(matches):
+            raise KeyError(drone_id)
+        return int(matches[0])
+
+    def seek(self, tick: int) -> np.ndarray:
+        """Returns the (N, 3) positions at tick.
+
+        Raises:
+            KeyError: The tick was never recorded or has been overwritten.
+        """
+        return self.positions[self._slot_of_tick[tick]]
+
+    def iter_ticks(
+        self, start: int | None = None, stop: int | None = None, every: int = 1
+    ) -> Iterator[tuple[int, np.ndarray]]:
+        """Yields (tick, positions) in tick order for start <= tick < stop."""
+        lo = 0 if start is None else int(np.searchsorted(self.ticks, start))
+        hi = len(self) if stop is None else int(np.searchsorted(self.ticks, stop))
+        for i in range(lo, hi, every):
+            yield int(self.ticks[i]), self.positions[self._order[i]]
+
+    def drone_stats(self, columns: slice | list[int] = slice(None)) -> DroneStats:
+        """Per drone mean, bounds, distance travelled and largest single tick move,
+        read STATS_CHUNK ticks at a time.
+
+        Args:
+            columns (slice | list[int], optional): Drones to include. Defaults to all.
+        """
+        indices = np.arange(self.drone_count)[columns]
+        count = len(indices)
+        total = np.zeros((count, 3))
+        minimum = np.full((count, 3), np.inf)
+        maximum = np.full((count, 3), -np.inf)
+        path_length = np.zeros(count)
+        max_step = np.zeros(count)
+        previous = None
+        for lo in range(0, len(self), STATS_CHUNK):
+            # Indexing ticks and drones together reads only the selected
+            # drones of these ticks from the map, never whole rows
+            slots = self._order[lo : lo + STATS_CHUNK]
+            chunk = self.positions[slots[:, None], indices]
+            total += chunk.sum(axis=0)
+            np.minimum(minimum, chunk.min(axis=0), out=minimum)
+            np.maximum(maximum, chunk.max(axis=0), out=maximum)
+            if previous is not None:
+                chunk = np.concatenate([previous[None], chunk])
+            steps = np.linalg.norm(np.diff(chunk, axis=0), axis=2)
+            path_length += steps.sum(axis=0)
+            if len(steps):
+                np.maximum(max_step, steps.max(axis=0), out=max_step)
+            previous = chunk[-1]
+        return DroneStats(
+            ticks=len(self),
+            mean=total / max(len(self), 1),
+            minimum=minimum,
+            maximum=maximum,
+            path_length=path_length,
+            max_step=max_step,
+        )
+
+
+def replay(
+    reader: TrajectoryReader,
+    field: Field,
+    on_tick: Callable[[int], None] | None = None,
+    start: int | None = None,
+    stop: int | None = None,
+    every: int = 1,
+) -> int:
+    """Moves the field's drones along a recording instead of computing forces.
+
+    field.drones must be in the same order as the recorded columns.
+
+    Args:
+        reader (TrajectoryReader): Recording to play back.
+        field (Field): Field whose drones are moved.
+        on_tick (Callable[[int], None] | None, optional): Called with each tick
+            after the drones moved, such as to refresh graph edges.
+        start (int | None, optional): First tick to play.
+        stop (int | None, optional): Tick to stop before.
+        every (int, optional): Play every n-th recorded tick. Defaults to 1.
+
+    Returns:
+        int: Ticks played.
+    """
+    played = 0
+    for tick, positions in reader.iter_ticks(start, stop, every):
+        field.place_drones(positions)
+        if on_tick is not None:
+            on_tick(tick)
+        played += 1
+    return played
+
+
+def main() -> None:
+    from .simulation import Simulation
+
+    parser = argparse.ArgumentParser(description="Inspects or replays a recording.")
+    parser.add_argument("mode", choices=["stats", "replay"])
+    parser.add_argument("path")
+    parser.add_argument("--every", type=int, default=1)
+    parser.add_argument("--field", type=float, nargs=3, default=[10, 10, 10])
+    args = parser.parse_args()
+
+    reader = TrajectoryReader(args.path)
+    print(
+        f"{len(reader)} ticks of {reader.drone_count} drones"
+        + (f", {reader.ticks[0]} to {reader.ticks[-1]}" if len(reader) else "")
+    )
+    if args.mode == "stats":
+        stats = reader.drone_stats()
+        print(f"{'drone':>8} {'path':>10} {'max step':>10}  mean")
+        for i, drone_id in enumerate(reader.ids.tolist()):
+            mean = ", ".join(f"{c:.3f}" for c in stats.mean[i])
+            print(
+                f"{drone_id!s:>8} {stats.path_length[i]:>10.3f}"
+                f" {stats.max_step[i]:>10.4f}  ({mean})"
+            )
+        return
+
+    # The recording places the drones
+    simulation, field = Simulation.build_swarm(
+        reader.ids.tolist(), tuple(args.field), place=False
+    )
+    controller: Vector = simulation.controller.get_location()
+
+    def show(tick: int) -> None:
+        simulation.refresh_dirty_edges()
+        print(f"tick {tick:>8} residual {field.equidistance_residual(controller):.4f}")
+
+    replay(reader, field, show, every=args.every)
+
+
+if __name__ == "__main__":
+    main()
@@ -76,6 +76,49 @@ class Distance:
         self.last_to_write = drone_id
         self.mutex.release_write()
 
+    def update_vector_with_components(
+        self, x: float, y: float, z: float, drone_id: int
+    ) -> None:
+        """Thread-safe way to overwrite the internal distance vector in place,
+        without building a Vector first. Unlike update_vector_with_coords,
+        zero components are written too.
+
+        Args:
+            x (float): New x component.
+            y (float): New y component.
+            z (float): New z component.
+            drone_id (int): Drone the vector now points to.
+        """
+        self.mutex.acquire_write()
+        self.vector.set_components(x, y, z)
+        self.last_to_write = drone_id
+        self.mutex.release_write()
+
+    def add_force_into(
+        self,
+        out: Vector,
+        drone_id: int,
+        min_distance: float,
+        repulsion_strength: float,
+    ) -> None:
+        """Thread-safe way to add the force this edge exerts on drone_id to out,
+        under a single read lock and without copying the vector.
+
+        Args:
+            out (Vector): Accumulator of the net force on drone_id.
+            drone_id (int): Drone the force acts on, one of the edge's endpoints.
+            min_distance (float): Minimum distance used in the force law.
+            repulsion_strength (float): Strength of repulsive force.
+        """
+        self.mutex.acquire_read()
+        self.vector.force_into(
+            out,
+            min_distance,
+            repulsion_strength,
+            1.0 if self.last_to_write == drone_id else -1.0,
+        )
+        self.mutex.release_read()
+
     def get_rwlock(self) -> RWLock:
         """Getter for internal RWLock.
 
@@ -96,6 +139,21 @@ class Distance:
 
         return drone_id
 
+    def get_vector_and_last_to_write(self) -> tuple[Vector, int]:
+        """Thread-safe way to acquire a copy of the internal distance vector
+        together with the drone that wrote it, under a single read lock.
+
+        Returns:
+            tuple[Vector, int]: Copy of the internal vector and the drone id
+            of the last drone to update distance.
+        """
+        self.mutex.acquire_read()
+        vector = copy(self.vector)
+        drone_id = self.last_to_write
+        self.mutex.release_read()
+
+        return vector, drone_id
+
     def distance_between_vectors(self, other_vector: Vector) -> float:
         """Calculates the distance between the calling vector and another vector.
 
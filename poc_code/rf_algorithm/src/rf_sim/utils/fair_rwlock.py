@@ -0,0 +1,222 @@
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from enum import Enum
+
+
+class FairnessPolicy(Enum):
+    """Which side a FairRWLock lets in first when both are waiting."""
+
+    # New readers join active readers even while writers wait. Matches RWLock.
+    READER_PREFERRING = "reader"
+    # A waiting writer blocks new readers until every waiting writer is done.
+    WRITER_PREFERRING = "writer"
+    # Readers and writers alternate: readers that queued behind a writer enter
+    # together as soon as that writer leaves, before the next writer.
+    PHASE_FAIR = "phase"
+
+
+@dataclass
+class LockStats:
+    """Counters collected by an instrumented FairRWLock. Times are in seconds."""
+
+    read_acquires: int = 0
+    write_acquires: int = 0
+    read_contended: int = 0
+    write_contended: int = 0
+    read_wait_total: float = 0.0
+    write_wait_total: float = 0.0
+    write_wait_max: float = 0.0
+    read_hold_total: float = 0.0
+    write_hold_total: float = 0.0
+
+
+class FairRWLock:
+    """Readers-writer lock with a selectable fairness policy.
+
+    Readers and writers wait on separate conditions, so a release only wakes
+    the side that can make progress. Nested acquisitions by the same thread
+    never block: a thread holding the read lock may read again, and the
+    writing thread may read or write again. Upgrading a read lock to a write
+    lock would deadlock and raises RuntimeError instead.
+
+    Has the same acquire/release methods as RWLock, plus read() and write()
+    context managers.
+    """
+
+    def __init__(
+        self,
+        policy: FairnessPolicy = FairnessPolicy.WRITER_PREFERRING,
+        instrument: bool = False,
+    ) -> None:
+        self.policy = policy
+        self.stats: LockStats | None = LockStats() if instrument else None
+        self._mutex = threading.Lock()
+        self._read_ready = threading.Condition(self._mutex)
+        self._write_ready = threading.Condition(self._mutex)
+        self._active_readers = 0
+        self._waiting_readers = 0
+        self._waiting_writers = 0
+        self._writer: int | None = None
+        self._write_depth = 0
+        self._write_acquired_at = 0.0
+        # Phase-fair bookkeeping: readers let in by the last writer release
+        self._phase = 0
+        self._admitted_readers = 0
+        self._local = threading.local()
+
+    def _thread_reads(self) -> int:
+        return getattr(self._local, "reads", 0)
+
+    def _reader_may_enter(self, arrival_phase: int) -> bool:
+        if self._writer is not None:
+            return False
+        if self.policy is FairnessPolicy.READER_PREFERRING:
+            return True
+        if self.policy is FairnessPolicy.WRITER_PREFERRING:
+            return self._waiting_writers == 0
+        return self._waiting_writers == 0 or self._phase != arrival_phase
+
+    def _writer_may_enter(self) -> bool:
+        return (
+            self._writer is None
+            and self._active_readers == 0
+            and self._admitted_readers == 0
+        )
+
+    def acquire_read(self) -> None:
+        me = threading.get_ident()
+        with self._mutex:
+            if self._writer == me:
+                # Reads inside our own write section are already exclusive
+                self._local.write_reads = getattr(self._local, "write_reads", 0) + 1
+                return
+            reads = self._thread_reads()
+            self._local.reads = reads + 1
+            if reads > 0:
+                return
+
+            waited = 0.0
+            if not self._reader_may_enter(self._phase):
+                arrival_phase = self._phase
+                start = time.perf_counter()
+                self._waiting_readers += 1
+                while not self._reader_may_enter(arrival_phase):
+                    self._read_ready.wait()
+                self._waiting_readers -= 1
+                # Only readers queued before the last writer release were
+                # admitted by it, a newer reader must not use up their count
+                if arrival_phase != self._phase and self._admitted_readers > 0:
+                    self._admitted_readers -= 1
+                waited = time.perf_counter() - start
+
+            self._active_readers += 1
+            self._local.read_acquired_at = time.perf_counter()
+            if self.stats is not None:
+                self.stats.read_acquires += 1
+                if waited:
+                    self.stats.read_contended += 1
+                    self.stats.read_wait_total += waited
+
+    def release_read(self) -> None:
+        with self._mutex:
+            write_reads = getattr(self._local, "write_reads", 0)
+            if write_reads and self._writer == threading.get_ident():
+                self._local.write_reads = write_reads - 1
+                return
+            reads = self._thread_reads()
+            if reads == 0:
+                raise RuntimeError("release_read called without holding the read lock")
+            self._local.reads = reads - 1
+            if reads > 1:
+                return
+
+            self._active_readers -= 1
+            if self.stats is not None:
+                self.stats.read_hold_total += (
+                    time.perf_counter() - self._local.read_acquired_at
+                )
+            if self._active_readers == 0 and self._admitted_readers == 0:
+                self._write_ready.notify()
+
+    def acquire_write(self) -> None:
+        me = threading.get_ident()
+        with self._mutex:
+            if self._writer == me:
+                self._write_depth += 1
+                return
+            if self._thread_reads() > 0:
+                raise RuntimeError("cannot upgrade a read lock to a write lock")
+
+            waited = 0.0
+            if not self._writer_may_enter():
+                start = time.perf_counter()
+                self._waiting_writers += 1
+                while not self._writer_may_enter():
+                    self._write_ready.wait()
+                self._waiting_writers -= 1
+                waited = time.perf_counter() - start
+
+            self._writer = me
+            self._write_depth = 1
+            self._write_acquired_at = time.perf_counter()
+            if self.stats is not None:
+                self.stats.write_acquires += 1
+                if waited:
+                    self.stats.write_contended += 1
+                    self.stats.write_wait_total += waited
+                    self.stats.write_wait_max = max(self.stats.write_wait_max, waited)
+
+    def release_write(self) -> None:
+        with self._mutex:
+            if self._writer != threading.get_ident():
+                raise RuntimeError(
+                    "release_write called by a thread not holding the write lock"
+                )
+            self._write_depth -= 1
+            if self._write_depth > 0:
+                return
+
+            self._writer = None
+            if self.stats is not None:
+                self.stats.write_hold_total += (
+                    time.perf_counter() - self._write_acquired_at
+                )
+            write_reads = getattr(self._local, "write_reads", 0)
+            if write_reads:
+                # Reads still open from inside the write section downgrade the lock
+                self._local.write_reads = 0
+                self._local.reads = write_reads
+                self._local.read_acquired_at = time.perf_counter()
+                self._active_readers += 1
+
+            if self.policy is FairnessPolicy.PHASE_FAIR:
+                self._phase += 1
+                self._admitted_readers = self._waiting_readers
+            if self._waiting_readers and not (
+                self.policy is FairnessPolicy.WRITER_PREFERRING
+                and self._waiting_writers
+            ):
+                self._read_ready.notify_all()
+            else:
+                self._write_ready.notify()
+
+    @contextmanager
+    def read(self) -> Iterator[None]:
+        """Holds the read lock for the duration of a with block."""
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+
+    @contextmanager
+    def write(self) -> Iterator[None]:
+        """Holds the write lock for the duration of a with block."""
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
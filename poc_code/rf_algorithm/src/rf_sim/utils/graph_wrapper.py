@@ -0,0 +1,159 @@
+from collections.abc import Callable, Iterable, Iterator
+from itertools import combinations
+from typing import TextIO
+
+import rustworkx as rx
+
+from ..drone import Drone
+
+DroneId = int | str
+# Builds the payload of the edge between two nodes: (out_idx, in_idx, out_d, in_d)
+EdgeFactory = Callable[[int, int, Drone, Drone], object]
+
+
+class DroneGraph(rx.PyGraph):
+    """PyGraph of drones with incremental membership.
+
+    Every unordered pair of drones is connected by at most one edge. The node
+    index of a drone never changes while it is in the graph, but rustworkx
+    hands a removed node's index to the next node added, so look drones up by
+    id with node_index() instead of keeping indices across a leave.
+    """
+
+    def __init__(self, *args: object, **kwargs: object) -> None:
+        # rx.PyGraph consumes the constructor arguments in __new__
+        super().__init__()
+        self._node_of_id: dict[DroneId, int] = {}
+
+    def node_index(self, drone_id: DroneId) -> int | None:
+        """Returns the node index of a drone, or None if it is not in the graph."""
+        return self._node_of_id.get(drone_id)
+
+    def has_drone(self, drone_id: DroneId) -> bool:
+        return drone_id in self._node_of_id
+
+    def _register(self, drones: list[Drone]) -> list[int]:
+        for drone in drones:
+            if drone.get_id() in self._node_of_id:
+                raise ValueError(f"{drone.pretty_print()} is already in the graph")
+        node_ids = list(self.add_nodes_from(drones))
+        for drone, node_id in zip(drones, node_ids, strict=True):
+            self._node_of_id[drone.get_id()] = node_id
+        return node_ids
+
+    def connect(
+        self, pairs: Iterable[tuple[int, int]], edge_factory: EdgeFactory
+    ) -> None:
+        """Adds one edge per pair in a single add_edges_from call.
+
+        Args:
+            pairs (Iterable[tuple[int, int]]): Node index pairs, each unordered pair once.
+            edge_factory (EdgeFactory): Builds the payload of each edge.
+        """
+        self.add_edges_from(
+            [
+                (
+                    out_idx,
+                    in_idx,
+                    edge_factory(out_idx, in_idx, self[out_idx], self[in_idx]),
+                )
+                for out_idx, in_idx in pairs
+            ]
+        )
+
+    def batch_join(
+        self,
+        drones: Iterable[Drone],
+        edge_factory: EdgeFactory | None = None,
+    ) -> list[int]:
+        """Adds many drones at once.
+
+        With an edge_factory, every new drone is connected to every drone in the
+        graph, new or old, with one edge per pair. Without one, no edges are added
+        so the caller can connect() its own pairs, such as neighbors in a radius.
+
+        Args:
+            drones (Iterable[Drone]): Drones to add.
+            edge_factory (EdgeFactory | None, optional): Builds edge payloads.
+
+        Returns:
+            list[int]: Node indices of the new drones, in order.
+        """
+        existing = list(self.node_indices())
+        node_ids = self._register(list(drones))
+        if edge_factory is not None:
+            self.connect(
+                [
+                    *((new, old) for new in node_ids for old in existing),
+                    *combinations(node_ids, 2),
+                ],
+                edge_factory,
+            )
+        return node_ids
+
+    def join_drone(
+        self,
+        drone: Drone,
+        edge_factory: EdgeFactory,
+        neighbors: Iterable[int] | None = None,
+    ) -> int:
+        """Adds one drone and its edges in O(N).
+
+        Args:
+            drone (Drone): Drone to add.
+            edge_factory (EdgeFactory): Builds edge payloads, the new drone is out_idx.
+            neighbors (Iterable[int] | None, optional): Node indices to connect to.
+                Defaults to every drone already in the graph.
+
+        Returns:
+            int: Node index of the new drone.
+        """
+        in_ids = list(self.node_indices()) if neighbors is None else list(neighbors)
+        (node_id,) = self._register([drone])
+        self.connect(
+            ((node_id, in_idx) for in_idx in in_ids if in_idx != node_id),
+            edge_factory,
+        )
+        return node_id
+
+    def leave_drone(self, drone_id: DroneId) -> tuple[int, Drone] | None:
+        """Removes a drone and all of its edges.
+
+        Args:
+            drone_id (int | str): ID of the drone to remove.
+
+        Returns:
+            tuple[int, Drone] | None: The freed node index and the drone, or None if
+            no drone has that id.
+        """
+        node_id = self._node_of_id.pop(drone_id, None)
+        if node_id is None:
+            return None
+        drone = self[node_id]
+        self.remove_node(node_id)
+        return node_id, drone
+
+    def iter_dump(self) -> Iterator[str]:
+        """Yields the text dump of the graph one node at a time, so large graphs
+        can be written out without building the whole string in memory.
+
+        Yields:
+            str: A node, its edges and a trailing blank line.
+        """
+        for src_node in self.node_indices():
+            lines = [f"{self.get_node_data(src_node).pretty_print()}\tEdges:\n"]
+            for k, v in self.adj(src_node).items():
+                if k == src_node:
+                    continue
+                lines.append(
+                    f"\t\t{self.get_node_data(k).pretty_print()} distance: {v}\n"
+                )
+            lines.append("\n")
+            yield "".join(lines)
+
+    def write_dump(self, stream: TextIO) -> None:
+        """Streams the text dump of the graph to stream."""
+        stream.writelines(self.iter_dump())
+
+    def __str__(self) -> str:
+        return "".join(self.iter_dump())
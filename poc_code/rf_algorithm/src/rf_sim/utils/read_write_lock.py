@@ -36,7 +36,8 @@ class RWLock:
     def release_write(self) -> None:
         self._cv.acquire()
         try:
-            self._readers += 1
+            # Writers never nest, so the only valid state here is -1
+            self._readers = 0
             self._cv.notify_all()
         finally:
             self._cv.release()
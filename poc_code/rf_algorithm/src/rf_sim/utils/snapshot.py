@@ -0,0 +1,129 @@
+from collections.abc import Callable, Mapping
+from threading import Lock
+from types import MappingProxyType
+
+from .graph_wrapper import DroneGraph
+from .read_write_lock import RWLock
+from .vector import Vector
+
+Position = tuple[float, float, float]
+
+
+class PositionSnapshot:
+    """Immutable view of every drone position at the end of one simulation tick.
+
+    Nothing in a snapshot changes after it is published, so readers can use it
+    without taking a lock and every value they read belongs to the same epoch.
+    """
+
+    __slots__ = ("epoch", "positions")
+
+    def __init__(self, epoch: int, positions: Mapping[int, Position]) -> None:
+        self.epoch = epoch
+        self.positions: Mapping[int, Position] = MappingProxyType(dict(positions))
+
+    def get_position(self, node_id: int) -> Vector:
+        """Returns the position of a drone in this snapshot.
+
+        Args:
+            node_id (int): node ID of the drone.
+
+        Returns:
+            Vector: Position vector of the drone.
+        """
+        return Vector(*self.positions[node_id])
+
+    def get_displacement(self, out_id: int, in_id: int) -> Vector:
+        """Returns the vector pointing from one drone to another, as a Distance
+        edge last written by out_id would hold it.
+
+        Args:
+            out_id (int): node ID of the drone the vector points to.
+            in_id (int): node ID of the drone the vector points from.
+
+        Returns:
+            Vector: out_id's position minus in_id's position.
+        """
+        out_x, out_y, out_z = self.positions[out_id]
+        in_x, in_y, in_z = self.positions[in_id]
+        return Vector(out_x - in_x, out_y - in_y, out_z - in_z)
+
+
+class SnapshotPublisher:
+    """Publishes a new PositionSnapshot every tick and hands out the latest one.
+
+    Readers never lock: rebinding the current snapshot is a single reference
+    assignment, so a reader sees either the previous or the new epoch in full.
+    Writers are serialized among themselves so epochs stay strictly increasing.
+    """
+
+    def __init__(self) -> None:
+        self._current = PositionSnapshot(0, {})
+        self._write_lock = Lock()
+
+    def current(self) -> PositionSnapshot:
+        """Returns the latest published snapshot without locking.
+
+        Returns:
+            PositionSnapshot: Most recently published snapshot.
+        """
+        return self._current
+
+    def publish(self, positions: Mapping[int, Position]) -> PositionSnapshot:
+        """Publishes a new snapshot with the next epoch.
+
+        Args:
+            positions (Mapping[int, Position]): Position of every drone keyed by node ID.
+
+        Returns:
+            PositionSnapshot: The snapshot that was published.
+        """
+        with self._write_lock:
+            snapshot = PositionSnapshot(self._current.epoch + 1, positions)
+            self._current = snapshot
+        return snapshot
+
+    def publish_graph(self, drone_graph: DroneGraph) -> PositionSnapshot:
+        """Publishes the current position of every drone in a graph.
+
+        Args:
+            drone_graph (DroneGraph): Graph holding the drones.
+
+        Returns:
+            PositionSnapshot: The snapshot that was published.
+        """
+        positions = {}
+        for node_id in drone_graph.node_indices():
+            drone = drone_graph.get_node_data(node_id)
+            positions[node_id] = (drone.get_x(), drone.get_y(), drone.get_z())
+        return self.publish(positions)
+
+
+class StripedLocks:
+    """Fixed pool of RWLocks shared between edges.
+
+    An edge maps to a stripe from its unordered node pair, so both directions
+    of an edge always use the same lock. N drones need `stripes` locks
+    instead of one per edge. Any lock with the RWLock interface can be pooled,
+    such as a FairRWLock.
+    """
+
+    def __init__(
+        self, stripes: int = 64, lock_factory: Callable[[], RWLock] = RWLock
+    ) -> None:
+        self._locks = [lock_factory() for _ in range(stripes)]
+
+    def lock_for(self, node1_id: int, node2_id: int) -> RWLock:
+        """Returns the lock guarding the edge between two nodes.
+
+        Args:
+            node1_id (int): node ID of one end of the edge.
+            node2_id (int): node ID of the other end of the edge.
+
+        Returns:
+            RWLock: Lock shared by every edge in the same stripe.
+        """
+        low, high = (
+            (node1_id, node2_id) if node1_id < node2_id else (node2_id, node1_id)
+        )
+        return self._locks[hash((low, high)) % len(self._locks)]
@@ -0,0 +1,130 @@
+import math
+from collections import defaultdict
+
+Cell = tuple[int, int, int]
+
+
+class UniformGrid:
+    """Uniform cell grid used to find drones within an interaction radius.
+
+    Cells are cubes whose side equals the radius, so every neighbor of a point
+    lies in the point's own cell or one of the 26 cells around it. Moving a
+    point only touches the grid when it crosses into a different cell.
+    """
+
+    def __init__(self, radius: float) -> None:
+        if radius <= 0:
+            raise ValueError("radius must be positive")
+        self.radius = radius
+        self._cells: defaultdict[Cell, set[int]] = defaultdict(set)
+        self._points: dict[int, tuple[float, float, float]] = {}
+        self._cell_of: dict[int, Cell] = {}
+
+    def _cell_for(self, x: float, y: float, z: float) -> Cell:
+        return (
+            math.floor(x / self.radius),
+            math.floor(y / self.radius),
+            math.floor(z / self.radius),
+        )
+
+    def insert(self, key: int, x: float, y: float, z: float) -> None:
+        """Adds a point to the grid. Inserting an existing key moves it instead.
+
+        Args:
+            key (int): Identifier of the point, usually a graph node index.
+            x (float): X coordinate.
+            y (float): Y coordinate.
+            z (float): Z coordinate.
+        """
+        if key in self._points:
+            self.move(key, x, y, z)
+            return
+        cell = self._cell_for(x, y, z)
+        self._cells[cell].add(key)
+        self._cell_of[key] = cell
+        self._points[key] = (x, y, z)
+
+    def remove(self, key: int) -> None:
+        """Removes a point from the grid.
+
+        Args:
+            key (int): Identifier of the point to remove.
+        """
+        cell = self._cell_of.pop(key)
+        del self._points[key]
+        members = self._cells[cell]
+        members.discard(key)
+        if not members:
+            del self._cells[cell]
+
+    def move(self, key: int, x: float, y: float, z: float) -> bool:
+        """Updates the location of a point already in the grid.
+
+        Args:
+            key (int): Identifier of the point to move.
+            x (float): New x coordinate.
+            y (float): New y coordinate.
+            z (float): New z coordinate.
+
+        Returns:
+            bool: True if the point crossed into a different cell.
+        """
+        self._points[key] = (x, y, z)
+        new_cell = self._cell_for(x, y, z)
+        old_cell = self._cell_of[key]
+        if new_cell == old_cell:
+            return False
+
+        members = self._cells[old_cell]
+        members.discard(key)
+        if not members:
+            del self._cells[old_cell]
+        self._cells[new_cell].add(key)
+        self._cell_of[key] = new_cell
+        return True
+
+    def neighbors(self, key: int) -> list[int]:
+        """Returns every other point within the radius of the given point.
+
+        Args:
+            key (int): Identifier of the point to search around.
+
+        Returns:
+            list[int]: Keys of the points within the radius, excluding key itself.
+        """
+        x, y, z = self._points[key]
+        cx, cy, cz = self._cell_of[key]
+        radius_sq = self.radius * self.radius
+        found: list[int] = []
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                for dz in (-1, 0, 1):
+                    members = self._cells.get((cx + dx, cy + dy, cz + dz))
+                    if not members:
+                        continue
+                    for other in members:
+                        if other == key:
+                            continue
+                        ox, oy, oz = self._points[other]
+                        if (x - ox) ** 2 + (y - oy) ** 2 + (z - oz) ** 2 <= radius_sq:
+                            found.append(other)
+        return found
+
+    def pairs(self) -> list[tuple[int, int]]:
+        """Returns every unordered pair of points within the radius of each other.
+
+        Returns:
+            list[tuple[int, int]]: Pairs (a, b) with a < b.
+        """
+        return [
+            (key, other)
+            for key in self._points
+            for other in self.neighbors(key)
+            if key < other
+        ]
+
+    def __contains__(self, key: int) -> bool:
+        return key in self._points
+
+    def __len__(self) -> int:
+        return len(self._points)
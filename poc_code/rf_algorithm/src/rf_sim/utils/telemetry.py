@@ -0,0 +1,314 @@
+import json
+import sys
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from enum import IntEnum
+from typing import Protocol, TextIO
+
+Fields = dict[str, object]
+
+
+class Level(IntEnum):
+    """Severity of a telemetry event. Sinks drop events below their min_level."""
+
+    DEBUG = 10
+    INFO = 20
+    WARNING = 30
+
+
+class Dumpable(Protocol):
+    """Anything that can stream a text dump of itself, such as DroneGraph."""
+
+    def iter_dump(self) -> Iterator[str]: ...
+
+
+class Event:
+    """A single telemetry event.
+
+    fields may be a callable returning the fields, so building them is deferred
+    until a sink actually writes the event.
+    """
+
+    __slots__ = ("_fields", "level", "name", "timestamp")
+
+    def __init__(
+        self, level: Level, name: str, fields: Fields | Callable[[], Fields] | None
+    ) -> None:
+        self.level = level
+        self.name = name
+        self.timestamp = time.time()
+        self._fields = fields
+
+    def get_fields(self) -> Fields:
+        """Returns the event fields, building them on first access."""
+        if callable(self._fields):
+            self._fields = self._fields()
+        return self._fields or {}
+
+    def as_dict(self) -> Fields:
+        return {
+            "ts": self.timestamp,
+            "level": self.level.name,
+            "event": self.name,
+            **self.get_fields(),
+        }
+
+    def __str__(self) -> str:
+        fields = " ".join(f"{k}={v}" for k, v in self.get_fields().items())
+        return f"{self.level.name} {self.name} {fields}".rstrip()
+
+
+class TelemetrySink(ABC):
+    """Destination for telemetry events. Subclasses implement write and write_dump.
+
+    Args:
+        min_level (Level, optional): Lowest level written. Defaults to INFO.
+        graph_dumps (bool, optional): Whether this sink wants graph dumps, which
+            are only produced when some sink asks for them. Defaults to False.
+    """
+
+    def __init__(
+        self, min_level: Level = Level.INFO, graph_dumps: bool = False
+    ) -> None:
+        self.min_level = min_level
+        self.graph_dumps = graph_dumps
+
+    def accepts(self, level: Level) -> bool:
+        return level >= self.min_level
+
+    @abstractmethod
+    def write(self, event: Event) -> None:
+        """Writes one event the sink accepts."""
+
+    @abstractmethod
+    def write_dump(self, name: str, chunks: Iterable[str]) -> None:
+        """Writes a streamed dump chunk by chunk, never holding all of it at once."""
+
+    def close(self) -> None:
+        pass
+
+
+class NullSink(TelemetrySink):
+    """Discards everything. Events are never built and dumps never produced."""
+
+    def __init__(self) -> None:
+        super().__init__(min_level=Level.WARNING, graph_dumps=False)
+
+    def accepts(self, level: Level) -> bool:
+        return False
+
+    def write(self, event: Event) -> None:
+        pass
+
+    def write_dump(self, name: str, chunks: Iterable[str]) -> None:
+        pass
+
+
+class RingBufferSink(TelemetrySink):
+    """Keeps the most recent events in memory, for tests and post-mortems.
+
+    Dump chunks are stored as events named after the dump with a "text" field.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 1024,
+        min_level: Level = Level.DEBUG,
+        graph_dumps: bool = False,
+    ) -> None:
+        super().__init__(min_level, graph_dumps)
+        self.events: deque[Event] = deque(maxlen=capacity)
+
+    def write(self, event: Event) -> None:
+        self.events.append(event)
+
+    def write_dump(self, name: str, chunks: Iterable[str]) -> None:
+        for chunk in chunks:
+            self.events.append(Event(Level.DEBUG, name, {"text": chunk}))
+
+
+class StreamSink(TelemetrySink):
+    """Writes events as plain text lines to a stream, stderr by default."""
+
+    def __init__(
+        self,
+        stream: TextIO | None = None,
+        min_level: Level = Level.INFO,
+        graph_dumps: bool = False,
+    ) -> None:
+        super().__init__(min_level, graph_dumps)
+        self.stream = stream or sys.stderr
+
+    def write(self, event: Event) -> None:
+        self.stream.write(f"{event}\n")
+
+    def write_dump(self, name: str, chunks: Iterable[str]) -> None:
+        self.stream.writelines(chunks)
+        self.stream.flush()
+
+
+class JsonlSink(TelemetrySink):
+    """Appends one JSON object per event to a file.
+
+    A dump is written as one "<name>" record per chunk, so it streams to disk.
+    """
+
+    def __init__(
+        self, path: str, min_level: Level = Level.INFO, graph_dumps: bool = False
+    ) -> None:
+        super().__init__(min_level, graph_dumps)
+        self._file = open(path, "a", encoding="utf-8")
+
+    def write(self, event: Event) -> None:
+        self._file.write(json.dumps(event.as_dict(), default=str) + "\n")
+
+    def write_dump(self, name: str, chunks: Iterable[str]) -> None:
+        for chunk in chunks:
+            self.write(Event(Level.DEBUG, name, {"text": chunk}))
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def make_sink(
+    kind: str,
+    path: str | None = None,
+    min_level: Level = Level.INFO,
+    graph_dumps: bool = False,
+) -> TelemetrySink:
+    """Builds a sink by name.
+
+    Args:
+        kind (str): One of "null", "ring", "jsonl" or "stderr".
+        path (str | None, optional): Output file, required for "jsonl".
+        min_level (Level, optional): Lowest level written. Defaults to INFO.
+        graph_dumps (bool, optional): Whether the sink wants graph dumps.
+
+    Returns:
+        TelemetrySink: The new sink.
+    """
+    if kind == "null":
+        return NullSink()
+    if kind == "ring":
+        return RingBufferSink(min_level=min_level, graph_dumps=graph_dumps)
+    if kind == "stderr":
+        return StreamSink(min_level=min_level, graph_dumps=graph_dumps)
+    if kind == "jsonl":
+        if path is None:
+            raise ValueError("the jsonl sink needs a path")
+        return JsonlSink(path, min_level, graph_dumps)
+    raise ValueError(f"Unknown telemetry sink {kind!r}")
+
+
+class PhaseTimer:
+    """Context manager adding the time spent inside it to one phase of a Telemetry.
+
+    One timer is reused per phase, so the same phase must not be nested.
+    """
+
+    __slots__ = ("_start", "_telemetry", "name")
+
+    def __init__(self, telemetry: "Telemetry", name: str) -> None:
+        self._telemetry = telemetry
+        self.name = name
+        self._start = 0.0
+
+    def __enter__(self) -> None:
+        self._start = time.perf_counter()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._telemetry.add_time(self.name, time.perf_counter() - self._start)
+
+
+class Telemetry:
+    """Leveled events, per-phase timers and counters routed to one sink.
+
+    Timers and counters are always kept since they cost a few additions. Events
+    and dumps are only built when the sink accepts their level.
+    """
+
+    def __init__(self, sink: TelemetrySink | None = None) -> None:
+        self.sink = sink or NullSink()
+        self.phase_seconds: dict[str, float] = {}
+        self.phase_calls: dict[str, int] = {}
+        self.counters: dict[str, int] = {}
+        self._timers: dict[str, PhaseTimer] = {}
+
+    def enabled(self, level: Level) -> bool:
+        return self.sink.accepts(level)
+
+    def event(
+        self,
+        level: Level,
+        name: str,
+        fields: Fields | Callable[[], Fields] | None = None,
+    ) -> None:
+        """Sends an event to the sink if it accepts the level.
+
+        Args:
+            level (Level): Severity of the event.
+            name (str): Short event name.
+            fields (Fields | Callable[[], Fields] | None, optional): Event fields,
+                or a callable building them, only called if the event is written.
+        """
+        if self.sink.accepts(level):
+            self.sink.write(Event(level, name, fields))
+
+    def dump(self, level: Level, name: str, target: Dumpable) -> bool:
+        """Streams target.iter_dump() to the sink, only if it asked for dumps.
+
+        Returns:
+            bool: True if the dump was produced.
+        """
+        if not (self.sink.graph_dumps and self.sink.accepts(level)):
+            return False
+        self.sink.write_dump(name, target.iter_dump())
+        return True
+
+    def phase(self, name: str) -> PhaseTimer:
+        """Returns the timer for a phase, use as `with telemetry.phase("force_calc"):`."""
+        timer = self._timers.get(name)
+        if timer is None:
+            timer = self._timers[name] = PhaseTimer(self, name)
+        return timer
+
+    def add_time(self, name: str, seconds: float) -> None:
+        self.phase_seconds[name] = self.phase_seconds.get(name, 0.0) + seconds
+        self.phase_calls[name] = self.phase_calls.get(name, 0) + 1
+
+    def count(self, name: str, amount: int = 1) -> None:
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def metrics(self) -> Fields:
+        """Returns a copy of every timer and counter."""
+        return {
+            "phase_seconds": dict(self.phase_seconds),
+            "phase_calls": dict(self.phase_calls),
+            "counters": dict(self.counters),
+        }
+
+    def reset_metrics(self) -> None:
+        self.phase_seconds.clear()
+        self.phase_calls.clear()
+        self.counters.clear()
+
+    def close(self) -> None:
+        self.sink.close()
+
+
+# Shared by every module on the hot path, swapped with set_telemetry
+_TELEMETRY = Telemetry()
+
+
+def get_telemetry() -> Telemetry:
+    return _TELEMETRY
+
+
+def set_telemetry(telemetry: Telemetry) -> Telemetry:
+    """Replaces the shared Telemetry and returns the previous one."""
+    global _TELEMETRY
+    previous = _TELEMETRY
+    _TELEMETRY = telemetry
+    return previous
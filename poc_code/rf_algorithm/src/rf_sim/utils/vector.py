@@ -0,0 +1,251 @@
+import math
+
+
+class Vector:
+    """Class representing distance vectors.
+
+    The magnitude is computed on first use and cached until the vector changes.
+    Change components through the methods below rather than assigning x, y or z
+    directly, so the cache stays valid.
+    """
+
+    __slots__ = ("x", "y", "z", "_magnitude", "_magnitude_squared")
+
+    def __init__(self, x: float, y: float, z: float) -> None:
+        self.x = x
+        self.y = y
+        self.z = z
+        self._magnitude: float | None = None
+        self._magnitude_squared: float | None = None
+
+    def _invalidate(self) -> None:
+        self._magnitude = None
+        self._magnitude_squared = None
+
+    def __copy__(self) -> "Vector":
+        """Returns a copy of this vector.
+
+        Returns:
+            Vector: Copy of calling vector.
+        """
+        vector = Vector(self.x, self.y, self.z)
+        vector._magnitude = self._magnitude
+        vector._magnitude_squared = self._magnitude_squared
+        return vector
+
+    def as_abs(self) -> "Vector":
+        """Returns a copy of this vector with all internal data set to their corresponding absolute value.
+
+        Returns:
+            Vector: Copy of the calling vector with all internal data set to their corresponding absolute value.
+        """
+        vector = Vector(abs(self.x), abs(self.y), abs(self.z))
+        vector._magnitude = self._magnitude
+        vector._magnitude_squared = self._magnitude_squared
+        return vector
+
+    def get_magnitude_squared(self) -> float:
+        """Returns the squared magnitude of this vector, without a square root.
+
+        Returns:
+            float: Squared magnitude of this vector.
+        """
+        magnitude_squared = self._magnitude_squared
+        if magnitude_squared is None:
+            x, y, z = self.x, self.y, self.z
+            magnitude_squared = self._magnitude_squared = x * x + y * y + z * z
+        return magnitude_squared
+
+    def get_magnitude(self) -> float:
+        """Returns the magnitude of this vector.
+
+        Returns:
+            float: Magnitude of this vector.
+        """
+        magnitude = self._magnitude
+        if magnitude is None:
+            x, y, z = self.x, self.y, self.z
+            magnitude = self._magnitude = math.sqrt((x**2) + (y**2) + (z**2))
+        return magnitude
+
+    def get_internals_as_tuple(self) -> tuple[float, float, float]:
+        """Returns a tuple containing the class x, y, z variables in order.
+
+        Returns:
+            tuple[float, float, float]: A tuple containing the class x, y, z variables in order.
+        """
+        return (self.x, self.y, self.z)
+
+    def _update_vector(
+        self, *, x: float | None = None, y: float | None = None, z: float | None = None
+    ) -> None:
+        """Protected method to mutate the internal state of the calling vector.
+
+        Args:
+            x (float | None, optional): New x coordinate value. Defaults to None.
+            y (float | None, optional): New y coordinate value. Defaults to None.
+            z (float | None, optional): New z coordinate value. Defaults to None.
+        """
+        if x:
+            self.x = x
+        if y:
+            self.y = y
+        if z:
+            self.z = z
+        self._invalidate()
+
+    def _replace_internals_with_vector(self, vector: "Vector") -> None:
+        """Protected method to mutate the internal state of the calling vector.
+
+        Args:
+            vector (Vector): Vector to mutate calling Vector object into.
+        """
+        self.x = vector.x
+        self.y = vector.y
+        self.z = vector.z
+        self._magnitude = vector._magnitude
+        self._magnitude_squared = vector._magnitude_squared
+
+    def set_components(self, x: float, y: float, z: float) -> None:
+        """Overwrites all three components in place.
+
+        Args:
+            x (float): New x coordinate value.
+            y (float): New y coordinate value.
+            z (float): New z coordinate value.
+        """
+        self.x = x
+        self.y = y
+        self.z = z
+        self._invalidate()
+
+    def distance_between_vector(self, other_vector: "Vector") -> float:
+        """Calculates the distance between the tip of two position vectors.
+
+        Args:
+            other_vector (Vector): Other vector to use in distance formula.
+
+        Returns:
+            float: The distance between the tip of the calling and provided vector.
+        """
+        return math.sqrt(
+            math.pow((other_vector.x - self.x), 2)
+            + math.pow((other_vector.y - self.y), 2)
+            + math.pow((other_vector.z - self.z), 2)
+        )
+
+    def vector_sum(self, other_vector: "Vector") -> "Vector":
+        """Calculates the vector sum between the calling vector and the provided vector. Returns resultant as new Vector object.
+
+        Args:
+            other_vector (Vector): Additional Vector object to add to calling vector.
+
+        Returns:
+            Vector: Resultant of vector sum.
+        """
+        return Vector(
+            self.x + other_vector.x, self.y + other_vector.y, self.z + other_vector.z
+        )
+
+    def mutating_vector_sum(self, other_vector: "Vector") -> None:
+        """Mutates the internal state of the calling Vector by summing the
+        internal components with the internal components of the provided Vector.
+
+        Args:
+            other_vector (Vector): Vector to sum with.
+        """
+        self.iadd(other_vector)
+
+    def iadd(self, other_vector: "Vector") -> "Vector":
+        """Adds other_vector to this vector in place.
+
+        Returns:
+            Vector: This vector, for chaining.
+        """
+        self.x += other_vector.x
+        self.y += other_vector.y
+        self.z += other_vector.z
+        self._magnitude = None
+        self._magnitude_squared = None
+        return self
+
+    def iscale(self, factor: float) -> "Vector":
+        """Multiplies every component by factor in place.
+
+        Returns:
+            Vector: This vector, for chaining.
+        """
+        self.x *= factor
+        self.y *= factor
+        self.z *= factor
+        self._invalidate()
+        return self
+
+    def negate_into(self, out: "Vector") -> "Vector":
+        """Writes the negation of this vector into out, which may be this vector.
+
+        Returns:
+            Vector: out.
+        """
+        out.x = -self.x
+        out.y = -self.y
+        out.z = -self.z
+        out._magnitude = self._magnitude
+        out._magnitude_squared = self._magnitude_squared
+        return out
+
+    def as_negated(self) -> "Vector":
+        """Returns the vector with all components negated.
+
+        Returns:
+            Vector: A vector with all internal components of the calling vector negated.
+        """
+        return self.negate_into(Vector(0.0, 0.0, 0.0))
+
+    def force_into(
+        self,
+        out: "Vector",
+        min_distance: float,
+        repulsion_strength: float,
+        sign: float = 1.0,
+    ) -> "Vector":
+        """Adds calculate_force of this vector, times sign, to out without
+        allocating. sign=-1.0 gives the force of the negated vector.
+
+        Args:
+            out (Vector): Accumulator the force is added to.
+            min_distance (float): Minimum distance that distance should be calculated as.
+            repulsion_strength (float): Strength of repulsive force.
+            sign (float, optional): 1.0 or -1.0. Defaults to 1.0.
+
+        Returns:
+            Vector: out.
+        """
+        distance = max(min_distance, self.get_magnitude())
+        # Same operations, in the same order, as calculate_force always used, so
+        # results match it exactly. sign is applied to the components first,
+        # as negating the vector did.
+        force = repulsion_strength / math.pow(distance, 2)
+        out.x += ((sign * self.x) / distance) * force
+        out.y += ((sign * self.y) / distance) * force
+        out.z += ((sign * self.z) / distance) * force
+        out._magnitude = None
+        out._magnitude_squared = None
+        return out
+
+    def calculate_force(
+        self, min_distance: float, repulsion_strength: float
+    ) -> "Vector":
+        """Calculates a force vector based on the calling Vector's internal state,
+        and a passed repulsion_strength. min_distance parameter ensures that at least
+        a minimal change occurs.
+
+        Args:
+            min_distance (float): Minimum distance that distance should be calculated as.
+            repulsion_strength (float): Strength of repulsive force.
+
+        Returns:
+            Vector: Force vector calculated from the calling Vector's internal state and the provided repulsion_strength parameter.
+        """
+        # f = repulsion_strength / distance^2, the closer the 2 drones the stronger the force
+        return self.force_into(Vector(0.0, 0.0, 0.0), min_distance, repulsion_strength)